@@ -1,7 +1,76 @@
+import sys
+from importlib import import_module
+
+from .backend import get_backend, set_backend
 from .palettes import art_pals, pals
-from .circles import circle_data
+from .profiling import profile, stats
+
+__all__ = [
+    "Canvas",
+    "art_pals",
+    "circle_batch_data",
+    "circle_data",
+    "get_backend",
+    "pals",
+    "profile",
+    "set_backend",
+    "stats",
+]
+
+# Public names that live in modules with heavy dependencies (polars, numpy).
+# They are imported on first access so `import artpack` stays cheap.
+_lazy_exports = {
+    "circle_data": "artpack.circles",
+    "circle_batch_data": "artpack.circles",
+    "Canvas": "artpack.canvas",
+}
+
+
+def _package_version() -> str:
+    # Installed metadata, else the version in a source checkout's pyproject.toml
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("artpack")
+    except PackageNotFoundError:
+        pass
+    import re
+    from pathlib import Path
+
+    pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+    try:
+        match = re.search(
+            r'^version\s*=\s*"([^"]+)"', pyproject.read_text(), re.MULTILINE
+        )
+    except OSError:
+        match = None
+    return match[1] if match else "0+unknown"
+
+
+def _register_polars_namespace():
+    # Registers `DataFrame.artpack`/`LazyFrame.artpack` once polars is loaded
+    if "polars" in sys.modules and "artpack.namespace" not in sys.modules:
+        import_module("artpack.namespace")
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        globals()[name] = _package_version()
+        return globals()[name]
+    if name in _lazy_exports:
+        value = getattr(import_module(_lazy_exports[name]), name)
+        globals()[name] = value
+        _register_polars_namespace()
+        return value
+    raise AttributeError(f"module 'artpack' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
+
+
+_register_polars_namespace()
 
-__all__ = ["art_pals", "pals", "circle_data"]
 
 # Future exports:
 # from .squares import square_data
@@ -2,7 +2,9 @@
 
 import re
 from typing import Any
-from matplotlib import colors as mcolors
+from artpack._colors import _CSS4_COLORS
+
+_COLOR_FORMATS = ("hex", "rgba")
 
 
 ###############################################################################
@@ -78,7 +80,7 @@ def _is_valid_color(param_name: str, color: str):
     invalid_hex_color = not re.match(hex_color, color)
 
     # Check if it's a named matplotlib color
-    invalid_matplotlib_color = color.lower() not in mcolors.CSS4_COLORS
+    invalid_matplotlib_color = color.lower() not in _CSS4_COLORS
 
     if invalid_hex_color and invalid_matplotlib_color:
         raise ValueError(
@@ -87,6 +89,43 @@ def _is_valid_color(param_name: str, color: str):
         )
 
 
+def _check_color_format(color_format: str):
+    """
+    Internal validator for the `color_format` option of shape generators. Raises if invalid.
+
+    "hex" keeps `color`/`fill` as strings; "rgba" packs them into `pl.UInt32`
+    integers (0xRRGGBBAA).
+    """
+    if color_format not in _COLOR_FORMATS:
+        raise ValueError(
+            f"`color_format` must be one of: {', '.join(_COLOR_FORMATS)}.\n"
+            f"You've supplied: '{color_format}'"
+        )
+
+
+###############################################################################
+# Bounding boxes
+###############################################################################
+def _check_bbox(param_name: str, bbox: Any):
+    """
+    Internal validator for (xmin, ymin, xmax, ymax) boxes. Raises if invalid.
+
+    Parameters
+    ----------
+    param_name : str
+        Name of the box parameter to be checked in the parent function.
+    bbox : Any
+        Box to check. Must be a tuple or list of four numbers with
+        xmin < xmax and ymin < ymax.
+    """
+    _check_type(param_name, bbox, (tuple, list))
+    if len(bbox) != 4 or not bbox[0] < bbox[2] or not bbox[1] < bbox[3]:
+        raise ValueError(
+            f"`{param_name}` must be (xmin, ymin, xmax, ymax) with xmin < xmax and ymin < ymax.\n"
+            f"You've supplied: `{bbox}`"
+        )
+
+
 ###############################################################################
 # Positive Numeric Values
 ###############################################################################
@@ -158,3 +197,53 @@ def _check_min_points(number: int, min_points: int, shape: str) -> bool:
             f"`n_points` must be >= {min_points} for a reasonable approximation of a {shape}.\nYou've supplied: `{number}`"
         )
     return True
+
+
+###############################################################################
+# Numeric sequences
+###############################################################################
+def _as_float_array(param_name: str, values: Any):
+    """
+    Internal converter for batch numeric inputs. Raises if invalid.
+
+    Parameters
+    ----------
+    param_name : str
+        Name of the parameter to be checked in the parent function.
+    values : float, int, or sequence of float/int
+        A number or a 1-D sequence (list, tuple, NumPy array, polars Series)
+        of numbers.
+
+    Raises
+    ------
+    TypeError
+        If `values` is not a number or a 1-D sequence of numbers.
+
+    Returns
+    -------
+    numpy.ndarray
+        A 1-D float64 array. Scalars become length-1 arrays.
+    """
+    import numpy as np
+
+    if isinstance(values, (str, bytes, bool)) or values is None:
+        raise TypeError(
+            f"`{param_name}` should be a number or a sequence of numbers.\n"
+            f"You've supplied a `{type(values).__name__}` object"
+        )
+
+    try:
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise TypeError(
+            f"`{param_name}` should be a number or a sequence of numbers.\n"
+            f"You've supplied a `{type(values).__name__}` object"
+        ) from None
+
+    if array.ndim > 1:
+        raise TypeError(
+            f"`{param_name}` should be a number or a 1-D sequence of numbers.\n"
+            f"You've supplied an array with shape {array.shape}"
+        )
+
+    return array.reshape(-1)
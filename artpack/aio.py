@@ -0,0 +1,238 @@
+###############################################################################
+# artpack/aio.py
+###############################################################################
+"""asyncio helpers for generating artpack data without blocking the event loop."""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import polars as pl
+
+###############################################################################
+# Shared executor
+###############################################################################
+_EXECUTOR: Executor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _default_executor() -> Executor:
+    """
+    Internal accessor for artpack's shared, bounded worker pool.
+
+    NumPy and polars release the GIL for the heavy parts of shape generation,
+    so a small thread pool keeps that work off the event loop.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="artpack"
+            )
+    return _EXECUTOR
+
+
+###############################################################################
+# Offloading
+###############################################################################
+async def offload(
+    func: Callable[..., Any], *args: Any, executor: Executor | None = None, **kwargs
+) -> Any:
+    """
+    Run any artpack function (or renderer) in a worker and await its result.
+
+    Parameters
+    ----------
+    func : callable
+        The function to run, e.g. `art_pals` or `circle_data`.
+    *args, **kwargs
+        Arguments passed on to `func`.
+    executor : concurrent.futures.Executor, optional
+        The pool to run `func` in. Default is artpack's shared thread pool.
+
+    Returns
+    -------
+    Any
+        Whatever `func` returns.
+
+    Examples
+    --------
+    ```python
+    from artpack import art_pals
+    from artpack.aio import offload
+
+    colors = await offload(art_pals, "rainbow", 1000)
+    ```
+    """
+    loop = asyncio.get_running_loop()
+    # Run in a copy of the caller's context so `use_backend` carries over
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor or _default_executor(), partial(context.run, func, *args, **kwargs)
+    )
+
+
+###############################################################################
+# Streaming
+###############################################################################
+async def circle_stream(
+    x: float | Sequence[float | int],
+    y: float | Sequence[float | int],
+    radius: float | Sequence[float | int],
+    color: str | Sequence[str] | None = None,
+    fill: str | Sequence[str] | None = None,
+    n_points: int = 100,
+    group_var: bool = True,
+    group_value: str = "circle_",
+    chunk_size: int = 1000,
+    max_pending: int = 2,
+    executor: Executor | None = None,
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: str | Sequence[str] | None = None,
+    bbox: Sequence[float] | None = None,
+    clip: bool = False,
+    max_memory: int | str | None = None,
+) -> AsyncIterator["pl.DataFrame"]:
+    """
+    Asynchronously generate many circles as a stream of DataFrame chunks.
+
+    Takes the same inputs as `circle_batch_data` and yields its output in
+    chunks of `chunk_size` circles, in order. Chunks are generated in a worker
+    pool; at most `max_pending` chunks are generated ahead of the consumer, so
+    a slow consumer (e.g. a renderer) applies backpressure instead of letting
+    finished chunks pile up in memory.
+
+    Parameters
+    ----------
+    x, y, radius, color, fill, n_points, group_var, group_value, color_format, categorical, gradient, bbox, clip
+        See `circle_batch_data`. Inputs are validated once, before the first chunk.
+        With `bbox`, each chunk is culled before its vertices are computed, so
+        chunks can hold fewer than `chunk_size` circles (or none).
+    chunk_size : int, default 1000
+        Number of circles per yielded DataFrame.
+    max_pending : int, default 2
+        Maximum number of chunks being generated or waiting to be consumed.
+    executor : concurrent.futures.Executor, optional
+        The pool to generate chunks in. Default is artpack's shared thread pool.
+    max_memory : int or str, optional, default None
+        A memory budget in bytes, or a size such as "512MB" or "2GiB". If
+        supplied, `chunk_size` is derived from it so the `max_pending` chunks
+        in flight plus the one being consumed, each with its working memory,
+        stay within the budget. See `planning.plan_circles`.
+
+    Returns
+    -------
+    AsyncIterator[pl.DataFrame]
+        DataFrames with the same columns as `circle_batch_data`. Group labels
+        are numbered across the whole stream, not per chunk.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    from artpack.aio import circle_stream
+
+    rng = np.random.default_rng(42)
+    xs, ys = rng.uniform(0, 100, (2, 50_000))
+
+    async for chunk in circle_stream(xs, ys, radius=0.5, chunk_size=5_000):
+        await render(chunk)
+    ```
+    """
+    from artpack._utils import _check_type, _is_positive_number
+    from artpack.circles import (
+        _check_circle_batch_inputs,
+        _check_gradient,
+        _check_viewport,
+        _circle_batch_frame,
+        _slice_circles,
+    )
+    from artpack.planning import _as_bytes, _chunk_size, _circle_layout
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("chunk_size", chunk_size, int)
+    _is_positive_number("chunk_size", chunk_size)
+    _check_type("max_pending", max_pending, int)
+    _is_positive_number("max_pending", max_pending)
+
+    x, y, radius = _check_circle_batch_inputs(
+        x,
+        y,
+        radius,
+        color,
+        fill,
+        n_points,
+        group_var,
+        group_value,
+        color_format,
+        categorical,
+    )
+    table = _check_gradient(color, gradient)
+    _check_viewport(bbox, clip)
+
+    if max_memory is not None:
+        max_memory = _as_bytes("max_memory", max_memory)
+        n_circles = max(len(x), 1)
+        columns, temporary = _circle_layout(
+            n_circles,
+            n_points,
+            color,
+            fill,
+            group_var,
+            group_value,
+            color_format,
+            categorical,
+            table is not None,
+        )
+        per_circle = sum(columns.values()) / n_circles + temporary * n_points
+        chunk_size = _chunk_size(max_memory, (max_pending + 1) * per_circle)
+
+    ###############################################################################
+    # Chunked Generation
+    ###############################################################################
+    loop = asyncio.get_running_loop()
+    pool = executor or _default_executor()
+
+    def chunk_job(start: int):
+        # A context can't be entered by two threads at once: one copy per job
+        return partial(
+            contextvars.copy_context().run,
+            _circle_batch_frame,
+            *_slice_circles(start, start + chunk_size, x, y, radius, color, fill),
+            n_points,
+            group_var,
+            group_value,
+            start + 1,
+            color_format,
+            categorical,
+            table,
+            bbox,
+            clip,
+        )
+
+    starts = iter(range(0, len(x), chunk_size))
+    pending: list[asyncio.Future] = []
+    try:
+        for start in starts:
+            pending.append(loop.run_in_executor(pool, chunk_job(start)))
+            if len(pending) == max_pending:
+                break
+
+        while pending:
+            chunk = await pending.pop(0)
+            next_start = next(starts, None)
+            if next_start is not None:
+                pending.append(loop.run_in_executor(pool, chunk_job(next_start)))
+            yield chunk
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,178 @@
+###############################################################################
+# artpack/backend.py
+###############################################################################
+"""Selection of the compute backend for artpack's circle vertex kernel."""
+
+import os
+import threading
+import warnings
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from importlib.util import find_spec
+
+_BACKENDS = ("auto", "numba", "numpy")
+_SETTINGS = {"backend": "auto"}
+# Set by `use_backend`; local to the current thread or asyncio task
+_OVERRIDE: ContextVar[str | None] = ContextVar("artpack_backend", default=None)
+_COMPILE_LOCK = threading.Lock()
+
+
+###############################################################################
+# Backend settings
+###############################################################################
+def _numba_available() -> bool:
+    """Internal check for an installed numba, without importing it."""
+    return find_spec("numba") is not None
+
+
+def _check_backend(backend: str) -> None:
+    """Internal validator for backend names. Raises if invalid or unavailable."""
+    if not isinstance(backend, str) or backend.lower() not in _BACKENDS:
+        raise ValueError(
+            f"`backend` must be one of: {', '.join(_BACKENDS)}.\n"
+            f"You've supplied: '{backend}'"
+        )
+    if backend.lower() == "numba" and not _numba_available():
+        raise ImportError(
+            "The 'numba' backend requires numba. Install it with `pip install numba` "
+            "or use backend 'auto' or 'numpy'"
+        )
+
+
+def set_backend(backend: str) -> None:
+    """
+    Choose the backend that computes circle vertices.
+
+    Every backend produces identical results; only speed differs. The setting
+    is process-wide; use `use_backend` to switch it for one block of code.
+
+    Parameters
+    ----------
+    backend : str
+        One of:
+
+        - "auto" - numba if it is installed, otherwise NumPy (the default)
+
+        - "numba" - a JIT-compiled loop (requires numba)
+
+        - "numpy" - vectorized NumPy
+
+    Notes
+    -----
+    The initial backend can also be set with the `ARTPACK_BACKEND`
+    environment variable. An invalid value warns and falls back to "numpy".
+
+    The backend covers only the circle vertex kernel used by
+    `circle_batch_data`, `circle_data`, and `aio.circle_stream`. Its NumPy
+    version is already one broadcast, so numba mainly saves the float64
+    temporaries rather than speeding up a Python loop. Hatching, flow
+    tracing, and spatial queries are vectorized NumPy and don't depend on it.
+
+    Examples
+    --------
+    ```python
+    import artpack
+
+    artpack.set_backend("numpy")
+    artpack.get_backend()  # "numpy"
+    ```
+    """
+    _check_backend(backend)
+    _SETTINGS["backend"] = backend.lower()
+
+
+def get_backend() -> str:
+    """
+    Return the backend kernels currently run on.
+
+    Returns
+    -------
+    str
+        "numba" or "numpy" ("auto" is resolved).
+    """
+    backend = _OVERRIDE.get() or _SETTINGS["backend"]
+    if backend == "auto":
+        return "numba" if _numba_available() else "numpy"
+    return backend
+
+
+@contextmanager
+def use_backend(backend: str) -> Iterator[None]:
+    """
+    Temporarily switch the kernel backend inside a `with` block.
+
+    The switch is local to the current thread or asyncio task (and the work
+    it hands to `aio.offload`), so concurrent tasks keep their own backend.
+
+    Parameters
+    ----------
+    backend : str
+        One of "auto", "numba", or "numpy". See `set_backend`.
+    """
+    _check_backend(backend)
+    token = _OVERRIDE.set(backend.lower())
+    try:
+        yield
+    finally:
+        _OVERRIDE.reset(token)
+
+
+###############################################################################
+# Kernels
+###############################################################################
+class _Kernel:
+    """
+    Internal dispatcher between a loop implementation and a NumPy fallback.
+
+    The loop implementation is plain Python written for numba's nopython
+    mode. It is compiled with `numba.njit` the first time it runs on the
+    numba backend; numba is never imported otherwise.
+    """
+
+    def __init__(self, loop: Callable, numpy: Callable):
+        self.loop = loop
+        self.numpy = numpy
+        self._compiled = None
+        self.__name__ = loop.__name__
+        self.__doc__ = loop.__doc__
+
+    def _jit(self) -> Callable:
+        if self._compiled is None:
+            with _COMPILE_LOCK:
+                if self._compiled is None:
+                    import numba
+
+                    self._compiled = numba.njit(cache=True, nogil=True)(self.loop)
+        return self._compiled
+
+    def __call__(self, *args):
+        if get_backend() == "numba":
+            return self._jit()(*args)
+        return self.numpy(*args)
+
+
+def _kernel(numpy: Callable) -> Callable[[Callable], _Kernel]:
+    """
+    Internal decorator pairing a numba-compatible loop with its NumPy version.
+
+    Both implementations must take the same arguments and give identical
+    results; kernels write into preallocated output arrays.
+    """
+
+    def decorator(loop: Callable) -> _Kernel:
+        return _Kernel(loop, numpy)
+
+    return decorator
+
+
+if os.environ.get("ARTPACK_BACKEND"):
+    try:
+        set_backend(os.environ["ARTPACK_BACKEND"])
+    except (ValueError, ImportError) as error:
+        warnings.warn(
+            f"Ignoring `ARTPACK_BACKEND` and using the 'numpy' backend.\n{error}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        _SETTINGS["backend"] = "numpy"
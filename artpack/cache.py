@@ -0,0 +1,323 @@
+###############################################################################
+# artpack/cache.py
+###############################################################################
+"""Opt-in, content-addressed on-disk cache for generated scene data."""
+
+import hashlib
+import inspect
+import io
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+import polars as pl
+
+from artpack import __version__
+from artpack._utils import _check_type, _is_positive_number
+from artpack.profiling import _PROFILE
+
+_DEFAULT_MAX_BYTES = 1024**3
+_SUFFIX = ".arrow"
+_TMP_SUFFIX = ".tmp"
+# Temporary files older than this are left over from interrupted writes
+_STALE_TMP_SECONDS = 60 * 60
+
+
+###############################################################################
+# Cache location
+###############################################################################
+def _default_cache_dir() -> Path:
+    """
+    Internal default cache location.
+
+    Uses `ARTPACK_CACHE_DIR` if set, otherwise `$XDG_CACHE_HOME/artpack`
+    (falling back to `~/.cache/artpack`).
+    """
+    if os.environ.get("ARTPACK_CACHE_DIR"):
+        return Path(os.environ["ARTPACK_CACHE_DIR"])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "artpack"
+
+
+###############################################################################
+# Argument hashing
+###############################################################################
+def _normalize(value: Any) -> Any:
+    """
+    Internal converter from an argument value to a JSON-able, canonical form.
+
+    Raises
+    ------
+    TypeError
+        If the value (or something nested in it) has no stable representation.
+    """
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return {"float": value.hex()}
+    if isinstance(value, (list, tuple)):
+        return {type(value).__name__: [_normalize(item) for item in value]}
+    if isinstance(value, dict):
+        return {
+            "dict": [
+                [_normalize(key), _normalize(item)]
+                for key, item in sorted(value.items(), key=lambda kv: repr(kv[0]))
+            ]
+        }
+    if isinstance(value, range):
+        return {"range": [value.start, value.stop, value.step]}
+    if isinstance(value, (pl.DataFrame, pl.Series)):
+        frame = value.to_frame() if isinstance(value, pl.Series) else value
+        buffer = io.BytesIO()
+        frame.write_ipc(buffer)
+        return {type(value).__name__: hashlib.sha256(buffer.getvalue()).hexdigest()}
+    if hasattr(value, "__array__") and hasattr(value, "dtype"):
+        import numpy as np
+
+        array = np.ascontiguousarray(value)
+        digest = hashlib.sha256(array.tobytes()).hexdigest()
+        return {"ndarray": [str(array.dtype), list(array.shape), digest]}
+
+    raise TypeError(
+        f"`cache_scene` can't hash arguments of type `{type(value).__name__}`.\n"
+        "Supported types are None, bool, int, float, str, lists, tuples, dicts, "
+        "ranges, NumPy arrays, and polars Series/DataFrames"
+    )
+
+
+def _const_key(const: Any) -> Any:
+    """
+    Internal stable form of a code object constant.
+
+    Nested code objects (comprehensions, lambdas, inner functions) are
+    replaced by their own digest, since their repr includes a memory address.
+    Frozensets are sorted, since their order depends on string hashing.
+    """
+    if isinstance(const, CodeType):
+        return ["code", _code_digest(const)]
+    if isinstance(const, tuple):
+        return ["tuple", [_const_key(item) for item in const]]
+    if isinstance(const, frozenset):
+        return ["frozenset", sorted(repr(_const_key(item)) for item in const)]
+    return repr(const)
+
+
+def _code_digest(code: CodeType) -> str:
+    """Internal hash of a code object that is the same in every process."""
+    payload = [
+        code.co_code.hex(),
+        [_const_key(const) for const in code.co_consts],
+        list(code.co_names),
+    ]
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+
+def _cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Internal content hash of a function call.
+
+    Combines the function's qualified name and code (so editing the function
+    invalidates its entries) and the artpack version with its arguments,
+    bound to the signature with defaults applied so equivalent calls share
+    a key.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+
+    code = getattr(func, "__code__", None)
+    payload = {
+        "function": f"{func.__module__}.{func.__qualname__}",
+        "code": _code_digest(code) if code else None,
+        "artpack": __version__,
+        "arguments": [
+            [name, _normalize(value)] for name, value in bound.arguments.items()
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+
+
+###############################################################################
+# Storage
+###############################################################################
+def _read(path: Path) -> pl.DataFrame | None:
+    """Internal memory-mapped reload of a cached frame; None on a miss."""
+    try:
+        df = pl.read_ipc(path, memory_map=True)
+    except (FileNotFoundError, OSError, pl.exceptions.ComputeError):
+        return None
+    # Mark as recently used for LRU eviction
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        # Evicted by another process since the read; the mapping stays valid
+        pass
+    return df
+
+
+def _write(cache_dir: Path, path: Path, df: pl.DataFrame) -> None:
+    """Internal atomic write of a frame as an uncompressed Arrow IPC file."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=_TMP_SUFFIX)
+    os.close(fd)
+    try:
+        df.write_ipc(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Internal LRU eviction: delete least recently used entries over `max_bytes`.
+
+    Also deletes temporary files that interrupted writes left behind.
+    """
+    stale = time.time() - _STALE_TMP_SECONDS
+    for path in cache_dir.glob(f"*{_TMP_SUFFIX}"):
+        try:
+            if path.stat().st_mtime < stale:
+                path.unlink()
+        except OSError:
+            continue
+
+    entries = []
+    for path in cache_dir.glob(f"*{_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            # e.g. still memory-mapped on Windows; try again on the next write
+            continue
+        total -= size
+
+
+###############################################################################
+# Public API
+###############################################################################
+def cache_scene(
+    func: Callable[..., pl.DataFrame] | None = None,
+    *,
+    cache_dir: str | os.PathLike | None = None,
+    max_bytes: int = _DEFAULT_MAX_BYTES,
+) -> Callable:
+    """
+    Cache a scene-generating function's DataFrame output on disk.
+
+    The decorated function's arguments (bound to its signature, with defaults
+    applied), its code, and the artpack version are hashed into a key, so
+    entries are reused across processes and dropped after an upgrade. On a hit the stored frame is
+    memory-mapped back and the function is not called at all. On a miss the
+    function runs and its output is stored as an Arrow IPC file. When the
+    cache directory grows past `max_bytes`, the least recently used entries
+    are deleted.
+
+    Parameters
+    ----------
+    func : callable
+        A function returning a `pl.DataFrame`. Its arguments must be None,
+        bools, numbers, strings, lists, tuples, dicts, ranges, NumPy arrays,
+        or polars Series/DataFrames. Pass the random seed as an argument so
+        different seeds get different entries.
+    cache_dir : str or path-like, optional
+        Where entries are stored. Default is `ARTPACK_CACHE_DIR`, or
+        `~/.cache/artpack`.
+    max_bytes : int, default 1 GiB
+        Size limit for the cache directory.
+
+    Returns
+    -------
+    callable
+        The wrapped function. `wrapper.cache_dir` is the cache location.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    from artpack import art_pals, circle_batch_data
+    from artpack.cache import cache_scene
+
+    @cache_scene
+    def bubbles(n, seed):
+        rng = np.random.default_rng(seed)
+        return circle_batch_data(
+            x=rng.uniform(0, 100, n), y=rng.uniform(0, 100, n),
+            radius=rng.uniform(0.5, 3, n), fill=art_pals("ocean", n),
+        )
+
+    df = bubbles(50_000, seed=42)  # generated and stored
+    df = bubbles(50_000, seed=42)  # loaded from disk
+    ```
+    """
+    if func is None:
+        return lambda f: cache_scene(f, cache_dir=cache_dir, max_bytes=max_bytes)
+
+    if not callable(func):
+        raise TypeError(
+            f"`func` should be callable.\nYou've supplied a `{type(func).__name__}` object"
+        )
+    _check_type("max_bytes", max_bytes, int)
+    _is_positive_number("max_bytes", max_bytes)
+    directory = Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        path = directory / f"{_cache_key(func, args, kwargs)}{_SUFFIX}"
+
+        cached = _read(path)
+        if _PROFILE.enabled:
+            _PROFILE._record_cache("scene_cache", cached is not None)
+        if cached is not None:
+            return cached
+
+        result = func(*args, **kwargs)
+        if not isinstance(result, pl.DataFrame):
+            raise TypeError(
+                f"`{func.__name__}` must return a polars DataFrame to be cached.\n"
+                f"It returned a `{type(result).__name__}` object"
+            )
+        _write(directory, path, result)
+        _evict(directory, max_bytes)
+        return result
+
+    wrapper.cache_dir = directory
+    return wrapper
+
+
+def clear_scene_cache(cache_dir: str | os.PathLike | None = None) -> int:
+    """
+    Delete every entry in a scene cache directory.
+
+    Parameters
+    ----------
+    cache_dir : str or path-like, optional
+        The cache location. Default is the same as `cache_scene`'s.
+
+    Returns
+    -------
+    int
+        The number of entries deleted.
+    """
+    directory = Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+    deleted = 0
+    for path in directory.glob(f"*{_SUFFIX}"):
+        path.unlink(missing_ok=True)
+        deleted += 1
+    return deleted
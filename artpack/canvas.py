@@ -0,0 +1,305 @@
+###############################################################################
+# artpack/canvas.py
+###############################################################################
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+
+from artpack._utils import (
+    _as_float_array,
+    _check_color_format,
+    _check_type,
+    _is_valid_color,
+)
+from artpack.colors import pack_colors
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+class Canvas:
+    """
+    A scene builder that collects shapes into growable columnar buffers.
+
+    Shape generators such as `circle_data` and `circle_batch_data` accept a
+    `canvas` argument and write their vertices straight into it instead of
+    returning a DataFrame. The buffers grow geometrically (doubling), so
+    adding many small shapes costs amortized O(1) per vertex and the scene
+    is copied at most once more, when it is exported.
+
+    Parameters
+    ----------
+    capacity : int, default 1024
+        Number of vertex rows to preallocate.
+
+    Notes
+    -----
+    Group, color, and fill labels are stored once each in lookup tables and
+    referenced from every vertex row by integer codes. Rows exported with
+    `to_polars` or `to_arrow` match what `pl.concat` of the equivalent
+    generator outputs would contain: shapes written without a group, color,
+    or fill have nulls in that column, and a column is omitted entirely if no
+    shape set it.
+
+    Examples
+    --------
+    ```python
+    from artpack import Canvas, art_pals, circle_data
+
+    canvas = Canvas()
+    for i, fill in enumerate(art_pals("rainbow", 10)):
+        circle_data(x=i, y=0, radius=0.4, fill=fill, group_var=True,
+                    group_value=f"circle_{i}", canvas=canvas)
+
+    df = canvas.to_polars()
+    ```
+    """
+
+    def __init__(self, capacity: int = 1024):
+        _check_type("capacity", capacity, int)
+        self._capacity = max(capacity, 1)
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every shape. Frames exported earlier are not affected."""
+        # New buffers (rather than resetting the size) keep earlier zero-copy
+        # exports from seeing overwritten rows.
+        self._x = np.empty(self._capacity, dtype=np.float32)
+        self._y = np.empty(self._capacity, dtype=np.float32)
+        self._codes = {
+            column: np.empty(self._capacity, dtype=np.int32)
+            for column in ("group", "color", "fill")
+        }
+        self._labels: dict[str, dict[str, int]] = {
+            column: {} for column in ("group", "color", "fill")
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return (
+            f"Canvas(rows={self._size}, groups={len(self._labels['group'])}, "
+            f"capacity={len(self._x)})"
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Number of vertex rows the buffers can hold before growing."""
+        return len(self._x)
+
+    ###############################################################################
+    # Writing
+    ###############################################################################
+    def _reserve(self, n_rows: int) -> tuple[int, int]:
+        """Grow the buffers (by doubling) to fit `n_rows` more rows and claim them."""
+        start, stop = self._size, self._size + n_rows
+        capacity = len(self._x)
+        if stop > capacity:
+            while capacity < stop:
+                capacity *= 2
+            self._x = self._grow(self._x, capacity)
+            self._y = self._grow(self._y, capacity)
+            self._codes = {
+                column: self._grow(codes, capacity)
+                for column, codes in self._codes.items()
+            }
+        self._size = stop
+        return start, stop
+
+    def _grow(self, buffer: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.empty(capacity, dtype=buffer.dtype)
+        grown[: self._size] = buffer[: self._size]
+        return grown
+
+    def _encode(self, column: str, values) -> np.ndarray | int:
+        """Integer codes for a label (or sequence of labels); -1 means null."""
+        lookup = self._labels[column]
+        if values is None:
+            return -1
+        if isinstance(values, str):
+            return lookup.setdefault(values, len(lookup))
+        return np.fromiter(
+            (lookup.setdefault(value, len(lookup)) for value in values),
+            dtype=np.int32,
+            count=len(values),
+        )
+
+    def _add_shapes(
+        self,
+        x_vals: np.ndarray,
+        y_vals: np.ndarray,
+        n_points: int,
+        groups: str | Sequence[str] | None = None,
+        colors: str | Sequence[str] | None = None,
+        fills: str | Sequence[str] | None = None,
+    ) -> tuple[int, int]:
+        """
+        Internal writer used by the shape generators. Skips input validation.
+
+        `x_vals`/`y_vals` hold consecutive blocks of `n_points` vertices, one
+        block per shape. Each of `groups`, `colors`, and `fills` is None, one
+        label for every shape, or one label per shape. Returns the written
+        row range.
+        """
+        start, stop = self._reserve(len(x_vals))
+        self._x[start:stop] = x_vals
+        self._y[start:stop] = y_vals
+        self._write_labels(start, stop, n_points, groups, colors, fills)
+        return start, stop
+
+    def _write_labels(
+        self,
+        start: int,
+        stop: int,
+        n_points: int,
+        groups: str | Sequence[str] | None = None,
+        colors: str | Sequence[str] | None = None,
+        fills: str | Sequence[str] | None = None,
+    ) -> None:
+        """
+        Internal writer for the label codes of rows `start:stop`.
+
+        Used by generators that compute vertices directly into the reserved
+        rows of `_x`/`_y`; see `_add_shapes` for the label arguments.
+        """
+        for column, values in (("group", groups), ("color", colors), ("fill", fills)):
+            codes = self._encode(column, values)
+            block = self._codes[column][start:stop]
+            if isinstance(codes, np.ndarray):
+                block.reshape(len(codes), n_points)[:] = codes[:, None]
+            else:
+                block[:] = codes
+
+    def _write_gradient(
+        self,
+        start: int,
+        stop: int,
+        column: str,
+        table: Sequence[str],
+        index: np.ndarray,
+    ) -> None:
+        """
+        Internal writer of per-vertex labels `table[index]` for rows `start:stop`.
+
+        The table is encoded once and the codes are gathered onto the rows.
+        """
+        self._codes[column][start:stop] = self._encode(column, table)[index]
+
+    def add_path(
+        self,
+        x: Sequence[float | int],
+        y: Sequence[float | int],
+        group: str | None = None,
+        color: str | None = None,
+        fill: str | None = None,
+    ) -> "Canvas":
+        """
+        Add one shape from its vertex coordinates.
+
+        Parameters
+        ----------
+        x : sequence of float or int
+            The x-coordinates of the shape's vertices.
+        y : sequence of float or int
+            The y-coordinates of the shape's vertices. Same length as `x`.
+        group : str, optional, default None
+            The shape's grouping label.
+        color : str, optional, default None
+            The shape's outline color.
+        fill : str, optional, default None
+            The shape's fill color.
+
+        Returns
+        -------
+        Canvas
+            The canvas itself, for chaining.
+        """
+        x = _as_float_array("x", x)
+        y = _as_float_array("y", y)
+        if len(x) != len(y):
+            raise ValueError(
+                "`x` and `y` must have the same length.\n"
+                f"You've supplied lengths {len(x)} and {len(y)}"
+            )
+        if group is not None:
+            _check_type("group", group, str)
+        if color is not None:
+            _is_valid_color("color", color)
+        if fill is not None:
+            _is_valid_color("fill", fill)
+
+        self._add_shapes(x, y, len(x), group, color, fill)
+        return self
+
+    ###############################################################################
+    # Export
+    ###############################################################################
+    def _used_columns(self) -> list[str]:
+        return [column for column in ("color", "fill", "group") if self._labels[column]]
+
+    def to_polars(
+        self, color_format: str = "hex", categorical: bool = False
+    ) -> pl.DataFrame:
+        """
+        Export the scene as a polars DataFrame.
+
+        The `x` and `y` columns share memory with the canvas buffers; label
+        columns are decoded from their lookup tables in one gather each.
+
+        Parameters
+        ----------
+        color_format : str, default "hex"
+            "hex" exports `color`/`fill` as strings; "rgba" as packed
+            `pl.UInt32` integers (0xRRGGBBAA). Each distinct color is
+            converted once.
+        categorical : bool, default False
+            Whether to export `group` and hex `color`/`fill` columns as
+            `pl.Categorical`, built straight from the canvas's lookup tables.
+
+        Returns
+        -------
+        pl.DataFrame
+            Columns `x`, `y`, and any of `color`, `fill`, `group` that were set.
+        """
+        _check_color_format(color_format)
+        _check_type("categorical", categorical, bool)
+        n = self._size
+        columns = [pl.Series("x", self._x[:n]), pl.Series("y", self._y[:n])]
+        for column in self._used_columns():
+            labels = pl.Series(column, [*self._labels[column], None], dtype=pl.Utf8)
+            if color_format == "rgba" and column != "group":
+                labels = pack_colors(labels)
+            elif categorical:
+                labels = labels.cast(pl.Categorical)
+            codes = self._codes[column][:n]
+            codes = np.where(codes < 0, len(labels) - 1, codes)
+            columns.append(labels.gather(codes))
+        return pl.DataFrame(columns)
+
+    def to_arrow(self) -> "pa.Table":
+        """
+        Export the scene as a pyarrow Table without copying vertex data.
+
+        Label columns become Arrow dictionary arrays that reference the
+        canvas's code buffers and lookup tables.
+
+        Returns
+        -------
+        pyarrow.Table
+            Columns `x`, `y`, and any of `color`, `fill`, `group` that were set.
+        """
+        import pyarrow as pa
+
+        n = self._size
+        arrays = {"x": pa.array(self._x[:n]), "y": pa.array(self._y[:n])}
+        for column in self._used_columns():
+            codes = self._codes[column][:n]
+            arrays[column] = pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0),
+                pa.array(list(self._labels[column]), type=pa.string()),
+            )
+        return pa.table(arrays)
@@ -1,16 +1,48 @@
 ###############################################################################
 # artpack/circle_data.py
 ###############################################################################
-from numpy import linspace, pi, cos, sin
+from collections.abc import Sequence
+
 import polars as pl
+from numpy import arange, cos, empty, float32, linspace, ndarray, pi, sin, tile
+from numpy import clip as np_clip
+
+from artpack._colors import _to_rgba32
 from artpack._utils import (
+    _as_float_array,
+    _check_bbox,
+    _check_color_format,
+    _check_min_points,
     _check_type,
     _is_positive_number,
     _is_valid_color,
-    _check_min_points,
 )
+from artpack.backend import _kernel
+from artpack.canvas import Canvas
+from artpack.colors import pack_colors
+from artpack.gradients import _gradient_index, _gradient_table, _table_series
+from artpack.planning import _as_bytes, _chunk_size, _circle_layout
+from artpack.profiling import _counted_cache, _instrumented, _phase
+
 
+###############################################################################
+# Unit circle cache
+###############################################################################
+@_counted_cache("unit_circle", maxsize=32)
+def _unit_circle(n_points: int):
+    """
+    Internal cache of unit-circle coordinates for a given number of points.
 
+    Returns read-only (cos, sin) arrays of `n_points` angles from 0 to 2*pi.
+    """
+    theta = linspace(0, 2 * pi, n_points)
+    cos_theta, sin_theta = cos(theta), sin(theta)
+    cos_theta.flags.writeable = False
+    sin_theta.flags.writeable = False
+    return cos_theta, sin_theta
+
+
+@_instrumented
 def circle_data(
     x: float | int,
     y: float | int,
@@ -20,7 +52,13 @@ def circle_data(
     n_points: int = 100,
     group_var: bool = False,
     group_value: str = "circle_",
-) -> pl.DataFrame:
+    canvas: Canvas = None,
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: str | Sequence[str] | None = None,
+    bbox: Sequence[float] | None = None,
+    clip: bool = False,
+) -> pl.DataFrame | Canvas:
     """
     Generate data for plotting a circle as a DataFrame.
 
@@ -48,6 +86,32 @@ def circle_data(
         Whether to include a grouping variable in the output.
     group_value : str, default "circle_"
         Prefix for the grouping variable name. Required if `group_var` is True.
+    canvas : Canvas, optional, default None
+        If supplied, the circle is written into this `Canvas` (and the canvas is
+        returned) instead of being returned as a new DataFrame.
+    color_format : str, default "hex"
+        How `color` and `fill` are stored: "hex" keeps the color strings, "rgba"
+        packs them into `pl.UInt32` integers (0xRRGGBBAA) that take 4 bytes per
+        row and need no parsing by renderers. See `colors.unpack_colors`.
+        Ignored when `canvas` is supplied; pick the format in `Canvas.to_polars`.
+    categorical : bool, default False
+        Whether to return `group` and hex `color`/`fill` columns as
+        `pl.Categorical` (dictionary-encoded) instead of `pl.Utf8`, so each
+        label is stored once and group-bys and joins compare integers.
+        Ignored when `canvas` is supplied; see `Canvas.to_polars`.
+    gradient : str or sequence of str, optional, default None
+        An artpack palette name (see `pals`) or a list of colors. If supplied,
+        the outline `color` sweeps through the palette around the circle, one
+        color per vertex. Can't be combined with `color`.
+    bbox : tuple of float, optional, default None
+        The visible canvas as (xmin, ymin, xmax, ymax). A circle whose bounds
+        fall fully outside it is discarded before any vertices are computed:
+        an empty DataFrame (with the usual columns) is returned, or nothing is
+        written to `canvas`.
+    clip : bool, default False
+        Whether to clamp vertices that fall outside `bbox` onto its edges.
+        This is a per-vertex clamp, not exact polygon clipping, so outlines
+        that leave the box run along its border. Requires `bbox`.
 
     Returns
     -------
@@ -79,49 +143,579 @@ def circle_data(
     ###############################################################################
     # Input Checks
     ###############################################################################
-    # Numeric Checks
-    _check_type("x", x, (float, int))
-    _check_type("y", y, (float, int))
-    _check_type("radius", radius, (float, int))
-    _check_type("n_points", n_points, int)
-    _is_positive_number("radius", radius)
-    _check_min_points(n_points, 100, "circle")
+    with _phase("validation"):
+        # Numeric Checks
+        _check_type("x", x, (float, int))
+        _check_type("y", y, (float, int))
+        _check_type("radius", radius, (float, int))
+        _check_type("n_points", n_points, int)
+        _is_positive_number("radius", radius)
+        _check_min_points(n_points, 100, "circle")
 
-    # Color Checks
-    if color is not None:
-        _is_valid_color("color", color)
+        # Color Checks
+        if color is not None:
+            _is_valid_color("color", color)
 
-    if fill is not None:
-        _is_valid_color("fill", fill)
+        if fill is not None:
+            _is_valid_color("fill", fill)
 
-    # Grouping Checks
-    if group_var:
-        _check_type("group_value", group_value, str)
+        _check_color_format(color_format)
+        _check_type("categorical", categorical, bool)
+        table = _check_gradient(color, gradient)
+
+        # Grouping Checks
+        if group_var:
+            _check_type("group_value", group_value, str)
+
+        # Canvas Checks
+        if canvas is not None:
+            _check_type("canvas", canvas, Canvas)
+
+        _check_viewport(bbox, clip)
 
     ###############################################################################
     # Data Generation
     ###############################################################################
-    # Create Theta
-    theta = linspace(0, 2 * pi, n_points)
-    x_vals = cos(theta) * radius + x
-    y_vals = sin(theta) * radius + y
+    visible = bbox is None or _visible(x, y, radius, bbox)
+    with _phase("coordinates"):
+        cos_theta, sin_theta = _unit_circle(n_points)
+        if not visible:
+            cos_theta, sin_theta = cos_theta[:0], sin_theta[:0]
+        x_vals = cos_theta * radius + x
+        y_vals = sin_theta * radius + y
+        if clip:
+            _clip_vertices(x_vals, y_vals, bbox)
+
+    if canvas is not None:
+        if not visible:
+            return canvas
+        with _phase("frame"):
+            start, stop = canvas._add_shapes(
+                x_vals,
+                y_vals,
+                n_points,
+                group_value if group_var else None,
+                color,
+                fill,
+            )
+            if table is not None:
+                vertex_index = _outline_index(n_points)
+                canvas._write_gradient(start, stop, "color", table, vertex_index)
+        return canvas
 
     # Create circle schema
     circle_schema = {"x": pl.Float32, "y": pl.Float32}
     circle_data_dict = {"x": x_vals, "y": y_vals}
 
     # Conditional checks to add extra vars
+    packed = color_format == "rgba"
+    label_dtype = pl.Categorical if categorical else pl.Utf8
     if color is not None:
-        circle_data_dict["color"] = color
-        circle_schema["color"] = pl.Utf8
+        circle_data_dict["color"] = _to_rgba32(color) if packed else color
+        circle_schema["color"] = pl.UInt32 if packed else label_dtype
+
+    if table is not None:
+        colors = _table_series(table, color_format, categorical)
+        circle_data_dict["color"] = colors.gather(
+            _outline_index(n_points)[: len(x_vals)]
+        )
+        circle_schema["color"] = colors.dtype
 
     if fill is not None:
-        circle_data_dict["fill"] = fill
-        circle_schema["fill"] = pl.Utf8
+        circle_data_dict["fill"] = _to_rgba32(fill) if packed else fill
+        circle_schema["fill"] = pl.UInt32 if packed else label_dtype
 
     if group_var:
         circle_data_dict["group"] = group_value
-        circle_schema["group"] = pl.Utf8
+        circle_schema["group"] = label_dtype
 
-    df = pl.DataFrame(circle_data_dict, schema=circle_schema)
+    with _phase("frame"):
+        df = pl.DataFrame(circle_data_dict, schema=circle_schema)
     return df
+
+
+###############################################################################
+# Outline gradients
+###############################################################################
+def _check_gradient(color, gradient) -> tuple[str, ...] | None:
+    """
+    Internal validator for the `gradient` option. Raises if invalid.
+
+    Returns the palette table for `gradient`, or None if it isn't set.
+    """
+    if gradient is None:
+        return None
+    if color is not None:
+        raise ValueError(
+            "`color` and `gradient` can't both be supplied.\n"
+            "`gradient` sets a per-vertex `color`"
+        )
+    return _gradient_table(gradient)
+
+
+def _outline_index(n_points: int) -> ndarray:
+    """
+    Internal palette table rows for the vertices of one circle.
+
+    A circle's vertices are evenly spaced by angle, so the angle and the arc
+    length give the same parameter, `linspace(0, 1, n_points)`.
+    """
+    return _gradient_index(linspace(0, 1, n_points))
+
+
+###############################################################################
+# Viewport culling
+###############################################################################
+def _check_viewport(bbox, clip):
+    """Internal validator for the `bbox` and `clip` options. Raises if invalid."""
+    if bbox is not None:
+        _check_bbox("bbox", bbox)
+    _check_type("clip", clip, bool)
+    if clip and bbox is None:
+        raise ValueError(
+            "`clip` needs a `bbox` to clip to.\n"
+            "Supply `bbox=(xmin, ymin, xmax, ymax)` or set `clip=False`"
+        )
+
+
+def _visible(x, y, radius, bbox):
+    """Internal test (or mask, for arrays) of circles whose bounds overlap `bbox`."""
+    xmin, ymin, xmax, ymax = bbox
+    return (
+        (x + radius >= xmin)
+        & (x - radius <= xmax)
+        & (y + radius >= ymin)
+        & (y - radius <= ymax)
+    )
+
+
+def _clip_vertices(out_x: ndarray, out_y: ndarray, bbox) -> None:
+    """Internal in-place clamp of vertices onto `bbox`."""
+    xmin, ymin, xmax, ymax = bbox
+    np_clip(out_x, xmin, xmax, out=out_x)
+    np_clip(out_y, ymin, ymax, out=out_y)
+
+
+def _cull_circles(x, y, radius, color, fill, bbox):
+    """
+    Internal removal of the circles that fall fully outside `bbox`.
+
+    Works on the circles' centers and radii alone, before any vertices are
+    computed. Returns the kept x, y, radius, color, and fill, plus each kept
+    circle's position in the input, so group labels keep their numbering.
+    """
+    ids = arange(len(x))
+    if bbox is None:
+        return x, y, radius, color, fill, ids
+    keep = _visible(x, y, radius, bbox)
+    if keep.all():
+        return x, y, radius, color, fill, ids
+    mask = pl.Series(keep)
+    color, fill = (
+        colors
+        if colors is None or isinstance(colors, str)
+        else pl.Series(colors, dtype=pl.Utf8).filter(mask)
+        for colors in (color, fill)
+    )
+    return x[keep], y[keep], radius[keep], color, fill, ids[keep]
+
+
+###############################################################################
+# Batch generation
+###############################################################################
+def _check_batch_colors(param_name: str, colors, n_shapes: int):
+    """
+    Internal validator for batch color inputs. Raises if invalid.
+
+    `colors` may be None, a single color string, or a sequence of `n_shapes`
+    color strings. Each distinct color is validated once.
+    """
+    if colors is None or isinstance(colors, str):
+        if colors is not None:
+            _is_valid_color(param_name, colors)
+        return
+
+    _check_type(param_name, colors, (list, tuple, pl.Series))
+    if len(colors) != n_shapes:
+        raise ValueError(
+            f"`{param_name}` must be a single color or one color per circle ({n_shapes}).\n"
+            f"You've supplied {len(colors)} colors"
+        )
+    for color in set(colors):
+        _is_valid_color(param_name, color)
+
+
+def _fill_circle_vertices_numpy(x, y, radius, cos_theta, sin_theta, out_x, out_y):
+    n_points = len(cos_theta)
+    out_x.reshape(-1, n_points)[:] = radius[:, None] * cos_theta + x[:, None]
+    out_y.reshape(-1, n_points)[:] = radius[:, None] * sin_theta + y[:, None]
+
+
+@_kernel(numpy=_fill_circle_vertices_numpy)
+def _fill_circle_vertices(x, y, radius, cos_theta, sin_theta, out_x, out_y):
+    """
+    Internal kernel writing the vertices of many circles into `out_x`/`out_y`.
+
+    The outputs hold `len(x) * len(cos_theta)` values, circle by circle.
+    """
+    n_points = len(cos_theta)
+    for i in range(len(x)):
+        offset = i * n_points
+        for j in range(n_points):
+            out_x[offset + j] = radius[i] * cos_theta[j] + x[i]
+            out_y[offset + j] = radius[i] * sin_theta[j] + y[i]
+
+
+def _circle_vertices(
+    x: ndarray,
+    y: ndarray,
+    radius: ndarray,
+    n_points: int,
+    out_x: ndarray = None,
+    out_y: ndarray = None,
+) -> tuple[ndarray, ndarray]:
+    """
+    Internal computation of the vertices of many circles at once.
+
+    Returns flat float32 (x, y) arrays of length `len(x) * n_points`, circle
+    by circle. Pass `out_x`/`out_y` (e.g. `Canvas` buffers) to write into
+    existing arrays instead of allocating new ones.
+    """
+    cos_theta, sin_theta = _unit_circle(n_points)
+    if out_x is None:
+        out_x = empty(len(x) * n_points, dtype=float32)
+    if out_y is None:
+        out_y = empty(len(x) * n_points, dtype=float32)
+    _fill_circle_vertices(x, y, radius, cos_theta, sin_theta, out_x, out_y)
+    return out_x, out_y
+
+
+def _slice_circles(start: int, stop: int, x, y, radius, color, fill) -> tuple:
+    """Internal slice of circles `start:stop` of a validated batch."""
+    return (
+        x[start:stop],
+        y[start:stop],
+        radius[start:stop],
+        color if color is None or isinstance(color, str) else color[start:stop],
+        fill if fill is None or isinstance(fill, str) else fill[start:stop],
+    )
+
+
+def _circle_batch_frame(
+    x: ndarray,
+    y: ndarray,
+    radius: ndarray,
+    color=None,
+    fill=None,
+    n_points: int = 100,
+    group_var: bool = True,
+    group_value: str = "circle_",
+    group_start: int = 1,
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: tuple[str, ...] | None = None,
+    bbox: Sequence[float] | None = None,
+    clip: bool = False,
+) -> pl.DataFrame:
+    """
+    Internal builder for `circle_batch_data` that skips input validation.
+
+    Group labels are numbered from `group_start` so chunks of one batch
+    (see `artpack.aio`) get the same labels as the whole batch would.
+    Per-circle labels are built once per circle and gathered onto the rows.
+    `gradient` is a palette table from `_gradient_table`. Circles outside
+    `bbox` are culled first and keep their numbering.
+    """
+    x, y, radius, color, fill, ids = _cull_circles(x, y, radius, color, fill, bbox)
+    with _phase("coordinates"):
+        x_vals, y_vals = _circle_vertices(x, y, radius, n_points)
+        if clip:
+            _clip_vertices(x_vals, y_vals, bbox)
+
+    with _phase("frame"):
+        df = pl.DataFrame(
+            {"x": x_vals, "y": y_vals}, schema={"x": pl.Float32, "y": pl.Float32}
+        )
+        shape_index = pl.Series(arange(len(x)).repeat(n_points))
+
+        packed = color_format == "rgba"
+        label_dtype = pl.Categorical if categorical else pl.Utf8
+        style_columns = []
+        for name, colors in (("color", color), ("fill", fill)):
+            if colors is None:
+                continue
+            if isinstance(colors, str):
+                if packed:
+                    style_columns.append(
+                        pl.lit(_to_rgba32(colors), dtype=pl.UInt32).alias(name)
+                    )
+                else:
+                    style_columns.append(pl.lit(colors, dtype=label_dtype).alias(name))
+            else:
+                if packed:
+                    colors = pack_colors(colors)
+                else:
+                    colors = pl.Series(colors, dtype=label_dtype)
+                style_columns.append(colors.alias(name).gather(shape_index))
+
+        if gradient is not None:
+            colors = _table_series(gradient, color_format, categorical)
+            vertex_index = tile(_outline_index(n_points), len(x))
+            style_columns.insert(0, colors.alias("color").gather(vertex_index))
+
+        if group_var:
+            groups = pl.select(
+                pl.concat_str(
+                    pl.lit(group_value),
+                    pl.lit(pl.Series(ids + group_start)).cast(pl.Utf8),
+                ).cast(label_dtype)
+            ).to_series()
+            style_columns.append(groups.alias("group").gather(shape_index))
+
+        if style_columns:
+            df = df.with_columns(style_columns)
+    return df
+
+
+def _check_circle_batch_inputs(
+    x,
+    y,
+    radius,
+    color,
+    fill,
+    n_points,
+    group_var,
+    group_value,
+    color_format="hex",
+    categorical=False,
+) -> tuple[ndarray, ndarray, ndarray]:
+    """
+    Internal validator shared by the batch and streaming circle generators.
+
+    Returns the x, y, and radius inputs as equal-length float arrays.
+    """
+    x = _as_float_array("x", x)
+    y = _as_float_array("y", y)
+    radius = _as_float_array("radius", radius)
+    _check_type("n_points", n_points, int)
+    _check_min_points(n_points, 100, "circle")
+
+    n_shapes = max(len(x), len(y), len(radius))
+    lengths = {len(x), len(y), len(radius)} - {1}
+    if len(lengths) > 1:
+        raise ValueError(
+            "`x`, `y`, and `radius` must have the same length (or length 1).\n"
+            f"You've supplied lengths {len(x)}, {len(y)}, and {len(radius)}"
+        )
+    if len(x) == 1 and n_shapes > 1:
+        x = x.repeat(n_shapes)
+    if len(y) == 1 and n_shapes > 1:
+        y = y.repeat(n_shapes)
+    if len(radius) == 1 and n_shapes > 1:
+        radius = radius.repeat(n_shapes)
+
+    if (radius <= 0).any():
+        raise ValueError(
+            "`radius` values must all be positive integers or floats.\n"
+            f"You've supplied: `{radius[radius <= 0][0]:g}`"
+        )
+
+    _check_batch_colors("color", color, n_shapes)
+    _check_batch_colors("fill", fill, n_shapes)
+    _check_color_format(color_format)
+    _check_type("categorical", categorical, bool)
+
+    if group_var:
+        _check_type("group_value", group_value, str)
+
+    return x, y, radius
+
+
+@_instrumented
+def circle_batch_data(
+    x: float | Sequence[float | int],
+    y: float | Sequence[float | int],
+    radius: float | Sequence[float | int],
+    color: str | Sequence[str] | None = None,
+    fill: str | Sequence[str] | None = None,
+    n_points: int = 100,
+    group_var: bool = True,
+    group_value: str = "circle_",
+    canvas: Canvas = None,
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: str | Sequence[str] | None = None,
+    bbox: Sequence[float] | None = None,
+    clip: bool = False,
+    max_memory: int | str | None = None,
+) -> pl.DataFrame | Canvas:
+    """
+    Generate data for plotting many circles as one DataFrame.
+
+    A vectorized version of `circle_data`: the coordinates of every circle are
+    computed in one pass, with no per-circle DataFrames to concatenate.
+
+    Parameters
+    ----------
+    x : float, int, or sequence of float/int
+        The center x-coordinates of the circles.
+    y : float, int, or sequence of float/int
+        The center y-coordinates of the circles.
+    radius : float, int, or sequence of float/int
+        The radii of the circles. Must all be greater than 0.
+    color : str or sequence of str, optional, default None
+        One outline color for every circle, or one color per circle.
+    fill : str or sequence of str, optional, default None
+        One fill color for every circle, or one color per circle.
+    n_points : int, default 100
+        Number of points to generate along each circle's perimeter. Must be an integer >= 100.
+    group_var : bool, default True
+        Whether to include a grouping variable in the output.
+    group_value : str, default "circle_"
+        Prefix for the grouping variable. Circles are numbered from 1, e.g. "circle_1".
+    canvas : Canvas, optional, default None
+        If supplied, the circles are written into this `Canvas` (and the canvas is
+        returned) instead of being returned as a new DataFrame. Group labels are
+        kept as-is, so use a distinct `group_value` for each call on one canvas.
+    color_format : str, default "hex"
+        "hex" keeps `color`/`fill` as strings; "rgba" packs them into
+        `pl.UInt32` integers (0xRRGGBBAA). See `circle_data`.
+    categorical : bool, default False
+        Whether to return `group` and hex `color`/`fill` columns as
+        `pl.Categorical`. See `circle_data`.
+    gradient : str or sequence of str, optional, default None
+        An artpack palette name or a list of colors swept around every
+        circle's outline as a per-vertex `color`. Every circle uses the same
+        precomputed palette table. Can't be combined with `color`.
+    bbox : tuple of float, optional, default None
+        The visible canvas as (xmin, ymin, xmax, ymax). Circles whose bounds
+        fall fully outside it are discarded before any vertices are computed;
+        the rest keep their group numbers (e.g. "circle_7" stays "circle_7").
+    clip : bool, default False
+        Whether to clamp vertices that fall outside `bbox` onto its edges.
+        See `circle_data`. Requires `bbox`.
+    max_memory : int or str, optional, default None
+        A memory budget in bytes, or a size such as "512MB" or "2GiB". The
+        batch is built in chunks sized so the output plus the working memory
+        of one chunk stays within it, and a batch whose output alone wouldn't
+        fit raises before anything is allocated. See `planning.plan_circles`.
+        Ignored when `canvas` is supplied.
+
+    Notes
+    -----
+    `x`, `y`, and `radius` must have the same length. A single number (or a
+    length-1 sequence) is repeated for every circle.
+
+    Returns
+    -------
+    data : pl.DataFrame
+        A DataFrame with `n_points` rows per circle and columns:
+
+        - x: x-coordinates of points along each circle's perimeter
+
+        - y: y-coordinates of points along each circle's perimeter
+
+        - color: outline color (if specified)
+
+        - fill: fill color (if specified)
+
+        - group: grouping variable (if group_var is True)
+
+    Examples
+    --------
+    ```python
+    from artpack import art_pals
+    from artpack.circles import circle_batch_data
+    from plotnine import ggplot, aes, geom_polygon, coord_equal
+
+    n = 10
+    circles = circle_batch_data(
+        x=range(n), y=[0] * n, radius=0.4, fill=art_pals("rainbow", n)
+    )
+    (ggplot(circles, aes("x", "y", group="group")) + geom_polygon(aes(fill="fill")) + coord_equal())
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    with _phase("validation"):
+        x, y, radius = _check_circle_batch_inputs(
+            x,
+            y,
+            radius,
+            color,
+            fill,
+            n_points,
+            group_var,
+            group_value,
+            color_format,
+            categorical,
+        )
+        if canvas is not None:
+            _check_type("canvas", canvas, Canvas)
+        table = _check_gradient(color, gradient)
+        _check_viewport(bbox, clip)
+        if max_memory is not None:
+            max_memory = _as_bytes("max_memory", max_memory)
+
+    ###############################################################################
+    # Data Generation
+    ###############################################################################
+    if canvas is not None:
+        x, y, radius, color, fill, ids = _cull_circles(x, y, radius, color, fill, bbox)
+        start, stop = canvas._reserve(len(x) * n_points)
+        with _phase("coordinates"):
+            out_x, out_y = canvas._x[start:stop], canvas._y[start:stop]
+            _circle_vertices(x, y, radius, n_points, out_x, out_y)
+            if clip:
+                _clip_vertices(out_x, out_y, bbox)
+        with _phase("frame"):
+            groups = None
+            if group_var:
+                groups = [f"{group_value}{i}" for i in ids + 1]
+            canvas._write_labels(start, stop, n_points, groups, color, fill)
+            if table is not None:
+                vertex_index = tile(_outline_index(n_points), len(x))
+                canvas._write_gradient(start, stop, "color", table, vertex_index)
+        return canvas
+
+    layout = {
+        "color": color,
+        "fill": fill,
+        "group_var": group_var,
+        "group_value": group_value,
+        "color_format": color_format,
+        "categorical": categorical,
+        "gradient": table is not None,
+    }
+    chunk_size = max(len(x), 1)
+    if max_memory is not None:
+        columns, temporary = _circle_layout(len(x), n_points, **layout)
+        output = sum(columns.values())
+        if output > max_memory:
+            raise ValueError(
+                f"`max_memory` is smaller than the estimated output ({output:,} bytes).\n"
+                f"You've supplied: {max_memory:,} bytes. "
+                "Use `aio.circle_stream` to generate the batch in chunks"
+            )
+        # Finished chunks are part of the output; only one chunk's working
+        # memory is needed on top of it
+        chunk_size = _chunk_size(max_memory - output, temporary * n_points)
+
+    frames = [
+        _circle_batch_frame(
+            *_slice_circles(start, start + chunk_size, x, y, radius, color, fill),
+            n_points,
+            group_var,
+            group_value,
+            start + 1,
+            color_format,
+            categorical,
+            table,
+            bbox,
+            clip,
+        )
+        for start in range(0, max(len(x), 1), chunk_size)
+    ]
+    return frames[0] if len(frames) == 1 else pl.concat(frames, rechunk=False)
@@ -0,0 +1,364 @@
+###############################################################################
+# artpack/cli.py
+###############################################################################
+"""The `artpack` command: batch rendering of scene specs over seed ranges."""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+_SHAPE_TYPES = ("circle",)
+_SHAPE_KEYS = {"type", "n", "x", "y", "radius", "color", "fill", "n_points"}
+_WORKER_SPEC: dict | None = None
+
+
+###############################################################################
+# Scene specs
+###############################################################################
+def _load_spec(path: str | os.PathLike) -> dict:
+    """
+    Internal loader and validator for a JSON scene spec.
+
+    A spec holds an optional `name`, `width`, `height`, `bbox`, and
+    `background`, plus a non-empty list of `shapes` layers. See `main`.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        spec = json.load(fh)
+    if not isinstance(spec, dict):
+        raise TypeError(
+            "A scene spec must be a JSON object.\n"
+            f"You've supplied a `{type(spec).__name__}`"
+        )
+    shapes = spec.get("shapes")
+    if not isinstance(shapes, list) or not shapes:
+        raise ValueError("A scene spec needs a non-empty `shapes` list")
+    for i, layer in enumerate(shapes):
+        if not isinstance(layer, dict) or layer.get("type") not in _SHAPE_TYPES:
+            raise ValueError(
+                f"`shapes[{i}]` must be an object whose `type` is one of: "
+                f"{', '.join(_SHAPE_TYPES)}"
+            )
+        unknown = sorted(set(layer) - _SHAPE_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown keys in `shapes[{i}]`: "
+                f"{', '.join(f'`{key}`' for key in unknown)}"
+            )
+    return spec
+
+
+def _sample_numbers(value: Any, n: int, rng) -> Any:
+    """Internal sampler: a number is repeated, `[low, high]` is drawn uniformly."""
+    if isinstance(value, list) and len(value) == 2:
+        return rng.uniform(value[0], value[1], n)
+    return [value] * n
+
+
+def _sample_colors(value: Any, n: int, rng) -> list[str] | str | None:
+    """
+    Internal sampler for `color`/`fill` values.
+
+    A color string is used as is; a list of colors or a palette object
+    (`{"palette": "neon", "n": 5, "direction": "regular"}`) is drawn from
+    at random, once per shape.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        from artpack.palettes import art_pals
+
+        value = art_pals(
+            value.get("palette", "ocean"),
+            value.get("n", 5),
+            value.get("direction", "regular"),
+        )
+    return [value[i] for i in rng.integers(0, len(value), n)]
+
+
+def _build_scene(spec: dict, seed: int):
+    """
+    Internal scene builder. Returns a Canvas with every layer of `spec`.
+
+    Each call draws from its own `numpy.random.Generator` seeded with `seed`,
+    so an image depends only on the spec and its seed, never on which worker
+    rendered it.
+    """
+    import numpy as np
+
+    from artpack.canvas import Canvas
+    from artpack.circles import circle_batch_data
+
+    rng = np.random.default_rng(seed)
+    canvas = Canvas()
+    for i, layer in enumerate(spec["shapes"]):
+        n = layer.get("n", 1)
+        circle_batch_data(
+            x=_sample_numbers(layer.get("x", 0), n, rng),
+            y=_sample_numbers(layer.get("y", 0), n, rng),
+            radius=_sample_numbers(layer.get("radius", 1), n, rng),
+            color=_sample_colors(layer.get("color"), n, rng),
+            fill=_sample_colors(layer.get("fill"), n, rng),
+            n_points=layer.get("n_points", 100),
+            group_value=f"layer{i + 1}_circle_",
+            canvas=canvas,
+        )
+    return canvas
+
+
+###############################################################################
+# Rendering
+###############################################################################
+def _output_path(spec: dict, out_dir: Path, seed: int) -> Path:
+    return out_dir / f"{spec.get('name', 'scene')}_{seed}.svg"
+
+
+def _init_worker(spec: dict, limit_threads: bool = True) -> None:
+    """
+    Internal pool initializer; ships the spec to each worker once.
+
+    `limit_threads=False` is for rendering in the calling process, whose
+    environment is left untouched.
+    """
+    global _WORKER_SPEC
+    if limit_threads:
+        # One polars thread per worker process; the pool provides the parallelism
+        os.environ.setdefault("POLARS_MAX_THREADS", "1")
+    _WORKER_SPEC = spec
+
+
+def _render_seed(seed: int, out_dir: str) -> tuple[int, float]:
+    """
+    Internal worker task: render one seed to SVG. Returns (seed, seconds).
+
+    The file is written under a temporary name and moved into place, so an
+    interrupted run never leaves a partial image that a resumed run would skip.
+    """
+    from artpack.svg import write_svg
+
+    start = time.perf_counter()
+    spec = _WORKER_SPEC
+    scene = _build_scene(spec, seed).to_polars()
+    path = _output_path(spec, Path(out_dir), seed)
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix=".tmp-", suffix=".svg")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            write_svg(
+                scene,
+                fh,
+                width=spec.get("width"),
+                height=spec.get("height"),
+                bbox=spec.get("bbox"),
+                background=spec.get("background"),
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return seed, time.perf_counter() - start
+
+
+def _parse_seeds(text: str) -> list[int]:
+    """Internal parser for `--seeds`: `START:STOP` (STOP excluded), `N`, or `A,B,C`."""
+    try:
+        if ":" in text:
+            start, stop = text.split(":")
+            return list(range(int(start), int(stop)))
+        return [int(seed) for seed in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected START:STOP, a seed, or a comma-separated list, got '{text}'"
+        ) from None
+
+
+def _peak_rss() -> tuple[int, int] | None:
+    """Internal peak resident set size (bytes) of this process and its workers."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024
+    return (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    )
+
+
+def _format_bytes(n_bytes: int) -> str:
+    return f"{n_bytes / 1024**2:.1f} MiB"
+
+
+###############################################################################
+# Command line
+###############################################################################
+def _run_render(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    try:
+        spec = _load_spec(args.spec)
+    except (OSError, TypeError, ValueError) as error:
+        parser.error(str(error))
+    if args.width is not None:
+        spec["width"] = args.width
+    if args.height is not None:
+        spec["height"] = args.height
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    seeds = args.seeds
+    pending = [
+        seed
+        for seed in seeds
+        if args.overwrite or not _output_path(spec, out_dir, seed).exists()
+    ]
+    skipped = len(seeds) - len(pending)
+    if skipped:
+        print(f"Skipping {skipped} already rendered seed(s)")
+    if not pending:
+        print("Nothing to render")
+        return 0
+
+    # Fail fast on spec values the generators reject, before starting workers
+    try:
+        _build_scene(spec, pending[0])
+    except (TypeError, ValueError) as error:
+        parser.error(f"invalid scene spec:\n{error}")
+
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(pending)))
+    report_every = max(1, len(pending) // 20)
+    failed: dict[int, BaseException] = {}
+    done = 0
+    start = time.perf_counter()
+
+    def finished(seed: int, error: BaseException | None) -> None:
+        nonlocal done
+        done += 1
+        if error is not None:
+            failed[seed] = error
+            print(f"seed {seed} failed: {error}", file=sys.stderr)
+        if done % report_every == 0 or done == len(pending):
+            print(f"[{done}/{len(pending)}] rendered", flush=True)
+
+    try:
+        if workers == 1:
+            from polars.exceptions import PolarsError
+
+            _init_worker(spec, limit_threads=False)
+            for seed in pending:
+                try:
+                    _render_seed(seed, str(out_dir))
+                    finished(seed, None)
+                except (OSError, TypeError, ValueError, PolarsError) as error:
+                    finished(seed, error)
+        else:
+            # "spawn" avoids forking a process that already runs polars threads
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(spec,),
+            ) as pool:
+                # Keep a bounded number of tasks in flight so Ctrl-C stops quickly
+                seed_iter = iter(pending)
+                in_flight = {}
+                for seed in seed_iter:
+                    in_flight[pool.submit(_render_seed, seed, str(out_dir))] = seed
+                    if len(in_flight) >= 2 * workers:
+                        break
+                while in_flight:
+                    complete, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in complete:
+                        finished(in_flight.pop(future), future.exception())
+                        seed = next(seed_iter, None)
+                        if seed is not None:
+                            in_flight[pool.submit(_render_seed, seed, str(out_dir))] = (
+                                seed
+                            )
+    except KeyboardInterrupt:
+        print(
+            f"\nInterrupted after {done} of {len(pending)} seed(s); "
+            "rerun the same command to resume",
+            file=sys.stderr,
+        )
+        return 130
+
+    # A clock tick can be coarser than a fast run
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    rendered = done - len(failed)
+    summary = (
+        f"Rendered {rendered} image(s) in {elapsed:.2f} s "
+        f"({rendered / elapsed:.1f} images/s, {workers} worker(s))"
+    )
+    peak = _peak_rss()
+    if peak is not None:
+        summary += f", peak RSS {_format_bytes(peak[0])}"
+        if workers > 1:
+            summary += f" (largest worker {_format_bytes(peak[1])})"
+    print(summary)
+    if failed:
+        print(
+            f"{len(failed)} seed(s) failed: {', '.join(map(str, sorted(failed)))}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Entry point of the `artpack` command.
+
+    `artpack render SPEC --seeds START:STOP --out DIR` renders one SVG per
+    seed from a JSON scene spec such as:
+
+    ```json
+    {
+      "name": "bubbles",
+      "width": 800, "height": 800, "bbox": [0, 0, 10, 10],
+      "background": "#000000",
+      "shapes": [
+        {"type": "circle", "n": 200, "x": [0, 10], "y": [0, 10],
+         "radius": [0.1, 0.8], "fill": {"palette": "neon"}, "n_points": 100}
+      ]
+    }
+    ```
+
+    Numbers are repeated for all `n` shapes and `[low, high]` pairs are drawn uniformly per
+    shape. Colors may be a color string, a list of colors, or a palette object
+    (`{"palette": ..., "n": ..., "direction": ...}`, see `art_pals`).
+
+    Seeds are rendered across a process pool. Each image gets its own RNG
+    seeded with its seed, so output does not depend on the worker count.
+    Existing images are skipped, so an interrupted sweep resumes where it
+    stopped; pass `--overwrite` to render them again.
+    """
+    parser = argparse.ArgumentParser(
+        prog="artpack", description="Batch-render artpack scenes."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    render = commands.add_parser("render", help="Render a scene spec over seeds")
+    render.add_argument("spec", help="Path to a JSON scene spec")
+    render.add_argument(
+        "--seeds",
+        type=_parse_seeds,
+        default=[0],
+        help="START:STOP (STOP excluded), a seed, or a comma-separated list",
+    )
+    render.add_argument("--out", default=".", help="Output directory")
+    render.add_argument("--workers", type=int, default=None)
+    render.add_argument("--width", type=float, default=None)
+    render.add_argument("--height", type=float, default=None)
+    render.add_argument(
+        "--overwrite", action="store_true", help="Re-render existing images"
+    )
+    args = parser.parse_args(argv)
+    return _run_render(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
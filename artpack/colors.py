@@ -0,0 +1,114 @@
+###############################################################################
+# artpack/colors.py
+###############################################################################
+"""Conversions between hex color strings and packed RGBA integer columns."""
+
+from collections.abc import Sequence
+
+import polars as pl
+
+from artpack._colors import _rgba32_to_hex, _to_rgba32
+from artpack._utils import _check_type, _is_valid_color
+
+_COLOR_COLUMNS = ("color", "fill")
+
+
+def pack_colors(colors: str | Sequence[str] | pl.Series) -> pl.Series:
+    """
+    Pack hex or named colors into RGBA integers.
+
+    Each color becomes one `pl.UInt32` value, 0xRRGGBBAA, with alpha 0xFF.
+    This is the representation produced by the shape generators' `color_format="rgba"`
+    option.
+
+    Parameters
+    ----------
+    colors : str, sequence of str, or pl.Series
+        Hex colors (#RRGGBB or #RGB) or named colors. Nulls stay null.
+
+    Returns
+    -------
+    pl.Series
+        A `pl.UInt32` Series with one value per color.
+
+    Examples
+    --------
+    ```python
+    from artpack.colors import pack_colors
+
+    pack_colors(["#FF0000", "white"])  # [4278190335, 4294967295]
+    ```
+    """
+    if isinstance(colors, str):
+        colors = [colors]
+    _check_type("colors", colors, (list, tuple, pl.Series))
+    if isinstance(colors, pl.Series):
+        colors = colors.cast(pl.Utf8)
+    else:
+        colors = pl.Series(colors, dtype=pl.Utf8)
+
+    # Convert each distinct color once, then map every row in bulk
+    distinct = colors.drop_nulls().unique()
+    if distinct.is_empty():
+        return pl.Series(colors.name, [None] * len(colors), dtype=pl.UInt32)
+    for color in distinct:
+        _is_valid_color("colors", color)
+    return colors.replace_strict(
+        distinct,
+        [_to_rgba32(color) for color in distinct],
+        return_dtype=pl.UInt32,
+    )
+
+
+def unpack_colors(data: pl.Series | pl.DataFrame) -> pl.Series | pl.DataFrame:
+    """
+    Convert packed RGBA integers back into hex color strings.
+
+    Use this where a consumer needs strings, e.g. before handing a frame made
+    with `color_format="rgba"` to plotnine. Each distinct color is formatted
+    once; `svg.write_svg` reads packed columns directly.
+
+    Parameters
+    ----------
+    data : pl.Series or pl.DataFrame
+        Packed colors (integers, 0xRRGGBBAA), or a DataFrame whose integer
+        `color` and `fill` columns should be converted. Other columns are
+        left as-is.
+
+    Returns
+    -------
+    pl.Series or pl.DataFrame
+        Colors as lowercase "#rrggbb" strings ("#rrggbbaa" if not opaque),
+        in the same shape as `data`.
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_data
+    from artpack.colors import unpack_colors
+
+    dots = circle_data(0, 0, 1, fill="tomato", color_format="rgba")
+    unpack_colors(dots)["fill"][0]  # "#ff6347"
+    ```
+    """
+    _check_type("data", data, (pl.Series, pl.DataFrame))
+    if isinstance(data, pl.DataFrame):
+        return data.with_columns(
+            unpack_colors(data[column])
+            for column in _COLOR_COLUMNS
+            if column in data.columns and data.schema[column].is_integer()
+        )
+
+    if not data.dtype.is_integer():
+        raise TypeError(
+            "`data` should hold packed RGBA integers.\n"
+            f"You've supplied a Series of type `{data.dtype}`"
+        )
+    distinct = data.drop_nulls().unique()
+    if distinct.is_empty():
+        return pl.Series(data.name, [None] * len(data), dtype=pl.Utf8)
+    return data.replace_strict(
+        distinct,
+        [_rgba32_to_hex(value) for value in distinct],
+        return_dtype=pl.Utf8,
+    )
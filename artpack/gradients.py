@@ -0,0 +1,155 @@
+###############################################################################
+# artpack/gradients.py
+###############################################################################
+"""Per-vertex color gradients drawn from a precomputed palette table."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import polars as pl
+
+from artpack._colors import _CSS4_COLORS
+from artpack._utils import _check_color_format, _check_type, _is_valid_color
+from artpack.colors import pack_colors
+from artpack.palettes import _resize_palette, pals
+from artpack.profiling import _counted_cache
+
+_TABLE_SIZE = 256
+_GRADIENT_BY = ("arc_length", "index")
+
+
+###############################################################################
+# Palette tables
+###############################################################################
+@_counted_cache("palette_table", maxsize=64)
+def _table(colors: tuple[str, ...]) -> tuple[str, ...]:
+    """Internal cache of palettes interpolated to `_TABLE_SIZE` colors."""
+    return tuple(_resize_palette(colors, _TABLE_SIZE))
+
+
+def _gradient_table(gradient: str | Sequence[str]) -> tuple[str, ...]:
+    """
+    Internal validator and lookup for gradient palettes. Raises if invalid.
+
+    `gradient` is an artpack palette name (see `pals`) or a sequence of
+    colors. Returns the palette interpolated to `_TABLE_SIZE` hex colors.
+    """
+    if isinstance(gradient, str):
+        if gradient.lower() not in pals:
+            raise ValueError(
+                "`gradient` must be an artpack palette name or a list of colors.\n"
+                f"You've supplied: '{gradient}'"
+            )
+        return _table(tuple(pals[gradient.lower()]))
+
+    _check_type("gradient", gradient, (list, tuple, pl.Series))
+    if len(gradient) == 0:
+        raise ValueError("`gradient` must have at least one color")
+    for color in gradient:
+        _is_valid_color("gradient", color)
+    return _table(tuple(_CSS4_COLORS.get(color.lower(), color) for color in gradient))
+
+
+def _gradient_index(t: np.ndarray) -> np.ndarray:
+    """Internal mapping of vertex parameters in [0, 1] to palette table rows."""
+    return np.rint(np.clip(t, 0, 1) * (_TABLE_SIZE - 1)).astype(np.int32)
+
+
+def _table_series(
+    table: tuple[str, ...], color_format: str = "hex", categorical: bool = False
+) -> pl.Series:
+    """Internal palette table as a Series in the requested color format."""
+    if color_format == "rgba":
+        return pack_colors(list(table))
+    return pl.Series(table, dtype=pl.Categorical if categorical else pl.Utf8)
+
+
+###############################################################################
+# Gradients for any shape data
+###############################################################################
+def palette_gradient(
+    data: pl.DataFrame,
+    gradient: str | Sequence[str],
+    by: str = "arc_length",
+    column: str = "color",
+    color_format: str = "hex",
+) -> pl.DataFrame:
+    """
+    Color every vertex of every shape by its position along the outline.
+
+    Each group's vertices get a parameter from 0 (first vertex) to 1 (last
+    vertex), which is looked up in a precomputed 256-color table of the
+    palette. All shapes are colored with one vectorized gather.
+
+    Parameters
+    ----------
+    data : pl.DataFrame
+        Shape data with `x` and `y` columns and an optional `group` column.
+        Without `group` all rows form one shape.
+    gradient : str or sequence of str
+        An artpack palette name (see `pals`) or a list of colors to sweep through.
+    by : str, default "arc_length"
+        How the position of a vertex is measured: "arc_length" (distance
+        travelled along the outline) or "index" (vertex number).
+    column : str, default "color"
+        Name of the column the colors are written to.
+    color_format : str, default "hex"
+        "hex" for color strings, "rgba" for packed `pl.UInt32` integers.
+
+    Returns
+    -------
+    pl.DataFrame
+        `data` with `column` added or replaced.
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_data
+    from artpack.gradients import palette_gradient
+    from artpack.symmetry import replicate, rotations
+
+    petals = replicate(circle_data(x=3, y=0, radius=1), rotations(6))
+    petals = palette_gradient(petals, "sunnyside", by="index")
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("data", data, pl.DataFrame)
+    missing = [name for name in ("x", "y") if name not in data.columns]
+    if missing:
+        raise ValueError(
+            "`data` must have `x` and `y` columns.\n"
+            f"Missing: {', '.join(f'`{name}`' for name in missing)}"
+        )
+    table = _gradient_table(gradient)
+    if by not in _GRADIENT_BY:
+        raise ValueError(
+            f"`by` must be one of: {', '.join(_GRADIENT_BY)}.\nYou've supplied: '{by}'"
+        )
+    _check_type("column", column, str)
+    _check_color_format(color_format)
+
+    ###############################################################################
+    # Vertex Parameters
+    ###############################################################################
+    group = "group" if "group" in data.columns else None
+
+    def per_group(expr: pl.Expr) -> pl.Expr:
+        return expr.over(group) if group is not None else expr
+
+    if by == "index":
+        position = per_group(pl.int_range(pl.len())).cast(pl.Float64)
+    else:
+        step = (
+            per_group(pl.col("x").cast(pl.Float64).diff()).pow(2)
+            + per_group(pl.col("y").cast(pl.Float64).diff()).pow(2)
+        ).sqrt()
+        position = per_group(step.fill_null(0).cum_sum())
+    total = per_group(position.max())
+    t = pl.when(total > 0).then(position / total).otherwise(0.0)
+    t = data.select(t).to_series().to_numpy()
+
+    colors = _table_series(table, color_format).gather(_gradient_index(t))
+    return data.with_columns(colors.alias(column))
@@ -0,0 +1,256 @@
+###############################################################################
+# artpack/namespace.py
+###############################################################################
+"""
+The `artpack` polars namespace: shape generation from frames of shape specs.
+
+Importing this module registers `DataFrame.artpack` and `LazyFrame.artpack`.
+`import artpack` does this automatically when polars is already imported, and
+so does the first use of a polars-based artpack function; otherwise run
+`import artpack.namespace`.
+"""
+
+import polars as pl
+
+from artpack._utils import _check_min_points, _check_type
+from artpack.circles import _unit_circle
+from artpack.planning import plan_circles
+
+
+def _circle_vertices_lazy(
+    specs: pl.LazyFrame,
+    n_points: int,
+    x: str,
+    y: str,
+    radius: str,
+    color: str | None,
+    fill: str | None,
+    group_var: bool,
+    group_value: str,
+) -> pl.LazyFrame:
+    """
+    Internal query builder for the `circles` namespace method.
+
+    Cross joins the spec rows with one shared unit-circle frame, so polars
+    computes every vertex with native, multi-threaded expressions.
+    """
+    cos_theta, sin_theta = _unit_circle(n_points)
+    unit_circle = pl.LazyFrame({"_cos": cos_theta, "_sin": sin_theta})
+
+    spec_columns = [
+        pl.col(x).cast(pl.Float64).alias("_x"),
+        pl.col(y).cast(pl.Float64).alias("_y"),
+        pl.col(radius).cast(pl.Float64).alias("_radius"),
+    ]
+    style_columns = []
+    for name, column in (("color", color), ("fill", fill)):
+        if column is not None:
+            spec_columns.append(pl.col(column).cast(pl.Utf8).alias(f"_{name}"))
+            style_columns.append(pl.col(f"_{name}").alias(name))
+    if group_var:
+        spec_columns.append(
+            pl.concat_str(
+                pl.lit(group_value), (pl.int_range(pl.len()) + 1).cast(pl.Utf8)
+            ).alias("_group")
+        )
+        style_columns.append(pl.col("_group").alias("group"))
+
+    return (
+        specs.select(spec_columns)
+        .join(unit_circle, how="cross", maintain_order="left_right")
+        .select(
+            (pl.col("_radius") * pl.col("_cos") + pl.col("_x"))
+            .cast(pl.Float32)
+            .alias("x"),
+            (pl.col("_radius") * pl.col("_sin") + pl.col("_y"))
+            .cast(pl.Float32)
+            .alias("y"),
+            *style_columns,
+        )
+    )
+
+
+def _check_namespace_inputs(
+    n_points, x, y, radius, color, fill, group_var, group_value
+) -> None:
+    """Internal validator for the `circles` namespace method. Raises if invalid."""
+    _check_type("n_points", n_points, int)
+    _check_min_points(n_points, 100, "circle")
+    for param_name, column in (("x", x), ("y", y), ("radius", radius)):
+        _check_type(param_name, column, str)
+    for param_name, column in (("color", color), ("fill", fill)):
+        if column is not None:
+            _check_type(param_name, column, str)
+    if group_var:
+        _check_type("group_value", group_value, str)
+
+
+def _check_spec_columns(df: pl.DataFrame, *columns: str | None) -> None:
+    """Internal check that every named spec column exists. Raises if not."""
+    missing = [
+        column for column in columns if column is not None and column not in df.columns
+    ]
+    if missing:
+        raise ValueError(
+            "Spec columns not found in the DataFrame: "
+            + ", ".join(f"`{column}`" for column in missing)
+        )
+
+
+@pl.api.register_lazyframe_namespace("artpack")
+class ArtpackLazyFrame:
+    """artpack shape generators for a LazyFrame of shape specs."""
+
+    def __init__(self, lf: pl.LazyFrame):
+        self._lf = lf
+
+    def circles(
+        self,
+        n_points: int = 100,
+        x: str = "x",
+        y: str = "y",
+        radius: str = "radius",
+        color: str | None = None,
+        fill: str | None = None,
+        group_var: bool = True,
+        group_value: str = "circle_",
+    ) -> pl.LazyFrame:
+        """
+        Explode a frame of circle specs (one row per circle) into vertex rows.
+
+        Produces the same rows as `circle_batch_data` called with the spec
+        columns, but as a lazy polars query.
+
+        Parameters
+        ----------
+        n_points : int, default 100
+            Number of points to generate along each circle's perimeter. Must be an integer >= 100.
+        x : str, default "x"
+            Name of the column holding the center x-coordinates.
+        y : str, default "y"
+            Name of the column holding the center y-coordinates.
+        radius : str, default "radius"
+            Name of the column holding the radii.
+        color : str, optional, default None
+            Name of a column of outline colors to carry into the output `color` column.
+        fill : str, optional, default None
+            Name of a column of fill colors to carry into the output `fill` column.
+        group_var : bool, default True
+            Whether to include a grouping variable in the output.
+        group_value : str, default "circle_"
+            Prefix for the grouping variable. Circles are numbered from 1 in row order.
+
+        Notes
+        -----
+        Column values are not validated (e.g. negative radii or invalid color
+        names), since doing so would require collecting the query.
+
+        Returns
+        -------
+        pl.LazyFrame
+            A query producing columns `x`, `y`, and `color`, `fill`, `group` if requested.
+
+        Examples
+        --------
+        ```python
+        import polars as pl
+        import artpack.namespace
+
+        specs = pl.LazyFrame({"x": [0, 5], "y": [0, 5], "radius": [1, 2]})
+        vertices = specs.artpack.circles(n_points=200).collect()
+        ```
+        """
+        _check_namespace_inputs(
+            n_points, x, y, radius, color, fill, group_var, group_value
+        )
+        return _circle_vertices_lazy(
+            self._lf, n_points, x, y, radius, color, fill, group_var, group_value
+        )
+
+
+@pl.api.register_dataframe_namespace("artpack")
+class ArtpackFrame:
+    """artpack shape generators for a DataFrame of shape specs."""
+
+    def __init__(self, df: pl.DataFrame):
+        self._df = df
+
+    def circles(
+        self,
+        n_points: int = 100,
+        x: str = "x",
+        y: str = "y",
+        radius: str = "radius",
+        color: str | None = None,
+        fill: str | None = None,
+        group_var: bool = True,
+        group_value: str = "circle_",
+    ) -> pl.DataFrame:
+        """
+        Explode a frame of circle specs (one row per circle) into vertex rows.
+
+        The eager counterpart of `LazyFrame.artpack.circles`; see it for the
+        parameters. Spec columns are checked to exist before the query runs.
+
+        Returns
+        -------
+        pl.DataFrame
+            Columns `x`, `y`, and `color`, `fill`, `group` if requested.
+
+        Examples
+        --------
+        ```python
+        import polars as pl
+        import artpack.namespace
+
+        specs = pl.DataFrame({"x": [0, 5], "y": [0, 5], "radius": [1, 2], "pal": ["red", "blue"]})
+        vertices = specs.artpack.circles(fill="pal")
+        ```
+        """
+        _check_namespace_inputs(
+            n_points, x, y, radius, color, fill, group_var, group_value
+        )
+        _check_spec_columns(self._df, x, y, radius, color, fill)
+        return _circle_vertices_lazy(
+            self._df.lazy(), n_points, x, y, radius, color, fill, group_var, group_value
+        ).collect()
+
+    def plan_circles(
+        self,
+        n_points: int = 100,
+        x: str = "x",
+        y: str = "y",
+        radius: str = "radius",
+        color: str | None = None,
+        fill: str | None = None,
+        group_var: bool = True,
+        group_value: str = "circle_",
+    ) -> dict[str, int | dict[str, int] | bool | None]:
+        """
+        Estimate the size of `circles` on this frame without running it.
+
+        Takes the same arguments as `circles`. See `planning.plan_circles`
+        for the returned estimates.
+
+        Examples
+        --------
+        ```python
+        import polars as pl
+        import artpack.namespace
+
+        specs = pl.DataFrame({"x": range(100_000), "y": 0, "radius": 1})
+        specs.artpack.plan_circles(n_points=500)["peak_bytes"]
+        ```
+        """
+        _check_namespace_inputs(
+            n_points, x, y, radius, color, fill, group_var, group_value
+        )
+        _check_spec_columns(self._df, x, y, radius, color, fill)
+        return plan_circles(
+            self._df.height,
+            n_points,
+            color=None if color is None else self._df[color].cast(pl.Utf8),
+            fill=None if fill is None else self._df[fill].cast(pl.Utf8),
+            group_var=group_var,
+            group_value=group_value,
+        )
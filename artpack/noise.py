@@ -0,0 +1,159 @@
+###############################################################################
+# artpack/noise.py
+###############################################################################
+"""Seeded, vectorized 2D gradient (Perlin) noise."""
+
+import numpy as np
+
+from artpack._utils import _as_float_array, _check_type, _is_positive_number
+from artpack.profiling import _counted_cache
+
+# Unit gradients in 8 directions, picked by the low bits of a lattice hash
+_GRADIENT_ANGLES = 2 * np.pi * np.arange(8) / 8
+_GRADIENT_X = np.cos(_GRADIENT_ANGLES)
+_GRADIENT_Y = np.sin(_GRADIENT_ANGLES)
+
+# 2D Perlin noise stays within +/- sqrt(1/2); rescale it to about [-1, 1]
+_NOISE_SCALE = np.sqrt(2)
+
+
+###############################################################################
+# Lattice hashing
+###############################################################################
+@_counted_cache("noise_permutation", maxsize=32)
+def _permutation(seed: int) -> np.ndarray:
+    """
+    Internal cache of the lattice hash table for a seed.
+
+    Returns a read-only shuffle of 0..255, repeated twice so hashes of
+    neighbouring lattice points never index past the end.
+    """
+    table = np.random.default_rng(seed).permutation(256)
+    table = np.concatenate([table, table])
+    table.flags.writeable = False
+    return table
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Internal smootherstep curve, 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _perlin(x: np.ndarray, y: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Internal single-octave Perlin noise at every (x, y), in about [-1, 1]."""
+    x0, y0 = np.floor(x), np.floor(y)
+    dx, dy = x - x0, y - y0
+    xi = x0.astype(np.int64) & 255
+    yi = y0.astype(np.int64) & 255
+
+    row, next_row = table[xi], table[xi + 1]
+    corners = (
+        (table[row + yi], dx, dy),
+        (table[next_row + yi], dx - 1, dy),
+        (table[row + yi + 1], dx, dy - 1),
+        (table[next_row + yi + 1], dx - 1, dy - 1),
+    )
+    n00, n10, n01, n11 = (
+        _GRADIENT_X[h & 7] * cx + _GRADIENT_Y[h & 7] * cy for h, cx, cy in corners
+    )
+
+    u, v = _fade(dx), _fade(dy)
+    bottom = n00 + u * (n10 - n00)
+    top = n01 + u * (n11 - n01)
+    return (bottom + v * (top - bottom)) * _NOISE_SCALE
+
+
+###############################################################################
+# Noise fields
+###############################################################################
+def _check_noise_inputs(scale, octaves, persistence, lacunarity, seed):
+    """Internal validator shared by the noise and flow-field functions. Raises if invalid."""
+    _check_type("scale", scale, (float, int))
+    _is_positive_number("scale", scale)
+    _check_type("octaves", octaves, int)
+    _is_positive_number("octaves", octaves)
+    _check_type("persistence", persistence, (float, int))
+    _is_positive_number("persistence", persistence)
+    _check_type("lacunarity", lacunarity, (float, int))
+    _is_positive_number("lacunarity", lacunarity)
+    _check_type("seed", seed, int)
+
+
+def _octave_noise(x, y, scale, octaves, persistence, lacunarity, seed) -> np.ndarray:
+    """Internal fractal noise for validated float arrays of the same shape."""
+    table = _permutation(seed)
+    total = np.zeros(np.shape(x))
+    frequency, amplitude, norm = 1.0 / scale, 1.0, 0.0
+    for octave in range(octaves):
+        # Shift each octave so their lattices don't line up at the origin
+        shift = 31.7 * octave
+        total += amplitude * _perlin(
+            x * frequency + shift, y * frequency + shift, table
+        )
+        norm += amplitude
+        frequency *= lacunarity
+        amplitude *= persistence
+    return total / norm
+
+
+def perlin_noise(
+    x,
+    y,
+    scale: float = 1,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Evaluate seeded 2D Perlin noise at many points at once.
+
+    Parameters
+    ----------
+    x : float, int, or array-like
+        The x-coordinates to evaluate at.
+    y : float, int, or array-like
+        The y-coordinates to evaluate at. Broadcast against `x`, so
+        `perlin_noise(xs[None, :], ys[:, None])` evaluates a whole grid.
+    scale : float or int, default 1
+        Size of the noise features: the distance between lattice points of
+        the first octave.
+    octaves : int, default 1
+        Number of layers of noise summed together, each finer than the last.
+    persistence : float or int, default 0.5
+        Amplitude of each octave relative to the one before.
+    lacunarity : float or int, default 2
+        Frequency of each octave relative to the one before.
+    seed : int, default 0
+        Seed of the noise field. The same seed always gives the same field.
+
+    Returns
+    -------
+    np.ndarray
+        Noise values in about [-1, 1], in the broadcast shape of `x` and `y`
+        (a 0-d array if both are numbers).
+        The field is smooth, and 0 at the lattice points of the first octave.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    from artpack.noise import perlin_noise
+
+    xs = np.linspace(0, 10, 400)
+    heights = perlin_noise(xs[None, :], xs[:, None], scale=2.5, octaves=4, seed=7)
+    ```
+    """
+    _check_noise_inputs(scale, octaves, persistence, lacunarity, seed)
+    scalar = np.ndim(x) == 0 and np.ndim(y) == 0
+    x = np.asarray(x, dtype=np.float64) if np.ndim(x) else _as_float_array("x", x)
+    y = np.asarray(y, dtype=np.float64) if np.ndim(y) else _as_float_array("y", y)
+    try:
+        x, y = np.broadcast_arrays(x, y)
+    except ValueError:
+        raise ValueError(
+            "`x` and `y` must have the same shape (or shapes that broadcast).\n"
+            f"You've supplied shapes {x.shape} and {y.shape}"
+        ) from None
+    values = _octave_noise(x, y, scale, octaves, persistence, lacunarity, seed)
+    return values.reshape(()) if scalar else values
@@ -2,9 +2,10 @@
 # artpack/art_pals.py
 ###############################################################################
 import random
-from typing import List
-import numpy as np
-from matplotlib import colors as mcolors
+from collections.abc import Sequence
+
+from artpack._colors import _hex_to_rgb, _rgb_to_hex
+from artpack.profiling import _instrumented, _phase
 
 # Define all palettes
 pals = {
@@ -106,9 +107,43 @@ pals = {
 }
 
 
+def _resize_palette(base_colors: Sequence[str], n: int) -> list[str]:
+    """
+    Internal resizer of a list of hex colors to `n` colors.
+
+    Samples the base colors when `n` is not larger than the palette, and
+    interpolates in RGB otherwise.
+    """
+    # numpy is imported here so `import artpack` stays cheap
+    import numpy as np
+
+    base_len = len(base_colors)
+    if n <= base_len:
+        # If n has fewer colors than base, just sample n
+        indices = np.linspace(0, base_len - 1, n).astype(int)
+        return [base_colors[i] for i in indices]
+
+    # If n has more colors then base, interpolate
+    # Convert hex to RGB
+    rgb_colors = [_hex_to_rgb(c) for c in base_colors]
+
+    # Create interpolation indices
+    positions = np.linspace(0, 1, len(rgb_colors))
+    new_positions = np.linspace(0, 1, n)
+
+    # Then apply to each RGB channel
+    r = np.interp(new_positions, positions, [c[0] for c in rgb_colors])
+    g = np.interp(new_positions, positions, [c[1] for c in rgb_colors])
+    b = np.interp(new_positions, positions, [c[2] for c in rgb_colors])
+
+    # Convert back to hex
+    return [_rgb_to_hex((r[i], g[i], b[i])) for i in range(n)]
+
+
+@_instrumented
 def art_pals(
     pal: str = "ocean", n: int = 5, direction: str = "regular", randomize: bool = False
-) -> List[str]:
+) -> list[str]:
     """
     The artpack palette picker. The `art_pals` function consists of 18 palettes.
 
@@ -192,73 +227,52 @@ def art_pals(
     ###############################################################################
     # Input Checks
     ###############################################################################
-    # n validation
-    if not isinstance(n, int) or n <= 0:
-        raise ValueError(f"n must be a positive integer. You've supplied: {n}")
-
-    # pal validation
-    if not isinstance(pal, str):
-        raise TypeError(
-            f"pal must be a single character string. You've supplied: {pal}"
-        )
-
-    # convert to lowercase
-    pal = pal.lower()
-
-    if pal not in pals:
-        valid_pals = ", ".join(pals.keys())
-        raise ValueError(
-            f"'{pal}' is not a valid palette. Please choose one of the following: {valid_pals}"
-        )
-
-    # direction validation
-    direction = direction.lower()
-    valid_directions = ["regular", "reg", "reverse", "rev"]
-    if direction not in valid_directions:
-        raise ValueError(
-            f"'{direction}' is not a valid direction. `direction` must be one of: {', '.join(valid_directions)}"
-        )
-
-    # randomize validation
-    if not isinstance(randomize, bool):
-        raise TypeError("`randomize` must be True or False")
+    with _phase("validation"):
+        # n validation
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError(f"n must be a positive integer. You've supplied: {n}")
+
+        # pal validation
+        if not isinstance(pal, str):
+            raise TypeError(
+                f"pal must be a single character string. You've supplied: {pal}"
+            )
+
+        # convert to lowercase
+        pal = pal.lower()
+
+        if pal not in pals:
+            valid_pals = ", ".join(pals.keys())
+            raise ValueError(
+                f"'{pal}' is not a valid palette. Please choose one of the following: {valid_pals}"
+            )
+
+        # direction validation
+        direction = direction.lower()
+        valid_directions = ["regular", "reg", "reverse", "rev"]
+        if direction not in valid_directions:
+            raise ValueError(
+                f"'{direction}' is not a valid direction. `direction` must be one of: {', '.join(valid_directions)}"
+            )
+
+        # randomize validation
+        if not isinstance(randomize, bool):
+            raise TypeError("`randomize` must be True or False")
 
     ###############################################################################
     # Palette Generation
     ###############################################################################
-    # Get base palette colors
-    base_colors = pals[pal]
+    with _phase("colors"):
+        # Get base palette colors and resize them to n colors
+        new_pal = _resize_palette(pals[pal], n)
 
-    # Interpolate to get n colors
-    base_len = len(base_colors)
-    if n <= base_len:
-        # If n has fewer colors than base, just sample n
-        indices = np.linspace(0, base_len - 1, n).astype(int)
-        new_pal = [base_colors[i] for i in indices]
-    else:
-        # If n has more colors then base, interpolate
-        # Convert hex to RGB
-        rgb_colors = [mcolors.hex2color(c) for c in base_colors]
-
-        # Create interpolation indices
-        positions = np.linspace(0, 1, len(rgb_colors))
-        new_positions = np.linspace(0, 1, n)
-
-        # Then apply to each RGB channel
-        r = np.interp(new_positions, positions, [c[0] for c in rgb_colors])
-        g = np.interp(new_positions, positions, [c[1] for c in rgb_colors])
-        b = np.interp(new_positions, positions, [c[2] for c in rgb_colors])
-
-        # Convert back to hex
-        new_pal = [mcolors.rgb2hex((r[i], g[i], b[i])) for i in range(n)]
-
-    # Apply direction if applicable
-    if direction in ["reverse", "rev"]:
-        new_pal = new_pal[::-1]
-
-    # Apply randomization if applicable
-    if randomize:
-        random.shuffle(new_pal)
+        # Apply direction if applicable
+        if direction in ["reverse", "rev"]:
+            new_pal = new_pal[::-1]
+
+        # Apply randomization if applicable
+        if randomize:
+            random.shuffle(new_pal)
 
     # Spit it out
     return new_pal
@@ -0,0 +1,425 @@
+###############################################################################
+# artpack/planning.py
+###############################################################################
+"""Row, byte, and peak-memory estimates for shape generation jobs."""
+
+import os
+import re
+from collections.abc import Sequence
+
+import polars as pl
+
+from artpack._utils import (
+    _check_color_format,
+    _check_min_points,
+    _check_type,
+    _is_positive_number,
+)
+from artpack.symmetry import _as_transforms
+
+# polars stores strings as 16-byte views; strings longer than 12 bytes also
+# keep their bytes in a shared buffer
+_VIEW_BYTES = 16
+_INLINE_BYTES = 12
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 10**3,
+    "mb": 10**6,
+    "gb": 10**9,
+    "tb": 10**12,
+    "kib": 2**10,
+    "mib": 2**20,
+    "gib": 2**30,
+    "tib": 2**40,
+}
+
+
+###############################################################################
+# Memory budgets
+###############################################################################
+def _as_bytes(param_name: str, size: int | str) -> int:
+    """
+    Internal parser for memory sizes. Raises if invalid.
+
+    Accepts a positive number of bytes or a string such as "512MB" or
+    "1.5 GiB" (decimal and binary units). Returns a whole number of bytes.
+    """
+    if isinstance(size, str):
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*", size)
+        if match and match[2].lower() in _SIZE_UNITS and float(match[1]) > 0:
+            return int(float(match[1]) * _SIZE_UNITS[match[2].lower()])
+        raise ValueError(
+            f"`{param_name}` must be a number of bytes or a size such as '512MB' or '2GiB'.\n"
+            f"You've supplied: '{size}'"
+        )
+    if isinstance(size, bool):
+        raise TypeError(
+            f"`{param_name}` should be of type `int` or `str`.\n"
+            "You've supplied a `bool` object"
+        )
+    _check_type(param_name, size, (int, str))
+    _is_positive_number(param_name, size)
+    return size
+
+
+def _available_memory() -> int | None:
+    """Internal estimate of the memory available to new allocations, if known."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+###############################################################################
+# Column layouts
+###############################################################################
+def _label_bytes(labels, n_rows: int, packed: bool, categorical: bool) -> int:
+    """
+    Internal size of a label column of `n_rows` rows.
+
+    `labels` is one label for every row or the per-shape labels, each
+    repeated over its shape's rows. Long labels are counted on every row
+    they appear in, as polars' `estimated_size` does.
+    """
+    if packed or categorical:
+        return 4 * n_rows
+    if isinstance(labels, str):
+        n_bytes = len(labels.encode())
+        extra = n_bytes * n_rows if n_bytes > _INLINE_BYTES else 0
+    elif len(labels):
+        lengths = pl.Series(labels, dtype=pl.Utf8).str.len_bytes()
+        long_bytes = int(lengths.filter(lengths > _INLINE_BYTES).sum())
+        extra = long_bytes * (n_rows // len(labels))
+    else:
+        extra = 0
+    return _VIEW_BYTES * n_rows + extra
+
+
+def _group_label_bytes(group_value: str, n_circles: int, n_points: int = 1) -> int:
+    """
+    Internal buffer size of the long labels among `group_value` 1..n_circles.
+
+    Each label is counted once per row: `n_points` times.
+    """
+    prefix, extra, digits = len(group_value.encode()), 0, 1
+    while 10 ** (digits - 1) <= n_circles:
+        count = min(n_circles, 10**digits - 1) - 10 ** (digits - 1) + 1
+        if prefix + digits > _INLINE_BYTES:
+            extra += count * (prefix + digits)
+        digits += 1
+    return extra * n_points
+
+
+def _circle_layout(
+    n_circles: int,
+    n_points: int,
+    color=None,
+    fill=None,
+    group_var: bool = True,
+    group_value: str = "circle_",
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: bool = False,
+) -> tuple[dict[str, int], int]:
+    """
+    Internal estimate of a circle batch's output columns and working memory.
+
+    Skips input validation. Returns the bytes of each output column and the
+    temporary bytes per row needed while the batch is built.
+    """
+    n_rows = n_circles * n_points
+    packed = color_format == "rgba"
+    columns = {"x": 4 * n_rows, "y": 4 * n_rows}
+    if gradient:
+        columns["color"] = _label_bytes("#000000", n_rows, packed, categorical)
+    elif color is not None:
+        columns["color"] = _label_bytes(color, n_rows, packed, categorical)
+    if fill is not None:
+        columns["fill"] = _label_bytes(fill, n_rows, packed, categorical)
+    if group_var:
+        columns["group"] = _label_bytes("", n_rows, False, categorical)
+        if not categorical:
+            columns["group"] += _group_label_bytes(group_value, n_circles, n_points)
+
+    # Vertex arrays before they're moved into the frame, the row -> circle
+    # index used to gather per-circle labels, and the tiled gradient index
+    per_circle = group_var or any(
+        labels is not None and not isinstance(labels, str) for labels in (color, fill)
+    )
+    temporary = 8 + (8 if per_circle else 0) + (16 if gradient else 0)
+    return columns, temporary
+
+
+def _chunk_size(budget: int, bytes_per_circle: float) -> int:
+    """
+    Internal number of circles that fit in `budget`. Raises if not even one fits.
+    """
+    chunk_size = int(budget // bytes_per_circle)
+    if chunk_size < 1:
+        raise ValueError(
+            "`max_memory` is too small to generate even one circle at a time.\n"
+            f"You've supplied: {budget:,} bytes; each circle needs about "
+            f"{bytes_per_circle:,.0f} bytes"
+        )
+    return chunk_size
+
+
+def _copy_label_bytes(group: pl.Series, n_copies: int, group_sep: str) -> int:
+    """
+    Internal size of the string group column `replicate` builds.
+
+    Every label gains `group_sep` and a copy number, so labels near the
+    inline limit move into the buffer in later copies.
+    """
+    n_rows = len(group) * n_copies
+    lengths = group.cast(pl.Utf8).str.len_bytes().fill_null(0)
+    extra, digits = 0, 1
+    while 10 ** (digits - 1) <= n_copies:
+        count = min(n_copies, 10**digits - 1) - 10 ** (digits - 1) + 1
+        labels = lengths + len(group_sep.encode()) + digits
+        extra += count * int(labels.filter(labels > _INLINE_BYTES).sum())
+        digits += 1
+    return _VIEW_BYTES * n_rows + extra
+
+
+def _plan(columns: dict[str, int], n_rows: int, temporary: int) -> dict:
+    """Internal summary of column bytes and per-row working memory."""
+    output = sum(columns.values())
+    peak = output + temporary * n_rows
+    available = _available_memory()
+    return {
+        "rows": n_rows,
+        "columns": columns,
+        "bytes": output,
+        "peak_bytes": peak,
+        "available_bytes": available,
+        "fits": None if available is None else peak <= available,
+    }
+
+
+###############################################################################
+# Planning
+###############################################################################
+def plan_circles(
+    n_circles: int,
+    n_points: int = 100,
+    color: str | Sequence[str] | None = None,
+    fill: str | Sequence[str] | None = None,
+    group_var: bool = True,
+    group_value: str = "circle_",
+    color_format: str = "hex",
+    categorical: bool = False,
+    gradient: str | Sequence[str] | None = None,
+) -> dict[str, int | dict[str, int] | bool | None]:
+    """
+    Estimate the size of a `circle_batch_data` job without running it.
+
+    Rows and column bytes follow the in-memory layout polars uses for the
+    output (4-byte floats, packed colors, and category codes; 16-byte string
+    views plus buffers for strings longer than 12 bytes). The peak adds the
+    working memory needed while the frame is built.
+
+    Parameters
+    ----------
+    n_circles : int
+        Number of circles. Use 1 for a `circle_data` call.
+    n_points, color, fill, group_var, group_value, color_format, categorical, gradient
+        The arguments the job will be called with. See `circle_batch_data`.
+        Only the labels' lengths matter, so colors aren't validated.
+
+    Returns
+    -------
+    dict
+        - rows: number of output rows
+        - columns: estimated bytes of each output column
+        - bytes: estimated size of the output frame
+        - peak_bytes: estimated peak memory while the frame is built
+        - available_bytes: memory currently available on this machine, or
+          None if it can't be read
+        - fits: whether `peak_bytes` fits in `available_bytes` (None if unknown)
+
+    Examples
+    --------
+    ```python
+    from artpack.planning import plan_circles
+
+    plan = plan_circles(2_000_000, fill="#ff6347", color_format="rgba")
+    if not plan["fits"]:
+        ...  # stream it with aio.circle_stream(..., max_memory="1GiB")
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("n_circles", n_circles, int)
+    if n_circles < 0:
+        raise ValueError(
+            f"`n_circles` must be zero or a positive integer.\nYou've supplied: `{n_circles}`"
+        )
+    _check_type("n_points", n_points, int)
+    _check_min_points(n_points, 100, "circle")
+    for param_name, labels in (("color", color), ("fill", fill)):
+        if labels is None or isinstance(labels, str):
+            continue
+        _check_type(param_name, labels, (list, tuple, pl.Series))
+        if len(labels) != n_circles:
+            raise ValueError(
+                f"`{param_name}` must be a single color or one color per circle ({n_circles}).\n"
+                f"You've supplied {len(labels)} colors"
+            )
+    _check_type("group_value", group_value, str)
+    _check_color_format(color_format)
+    _check_type("categorical", categorical, bool)
+
+    ###############################################################################
+    # Estimates
+    ###############################################################################
+    columns, temporary = _circle_layout(
+        n_circles,
+        n_points,
+        color,
+        fill,
+        group_var,
+        group_value,
+        color_format,
+        categorical,
+        gradient is not None,
+    )
+    return _plan(columns, n_circles * n_points, temporary)
+
+
+def plan_replicate(
+    data: pl.DataFrame,
+    transforms,
+    group_sep: str = "_",
+) -> dict[str, int | dict[str, int] | bool | None]:
+    """
+    Estimate the size of a `symmetry.replicate` job without running it.
+
+    Parameters
+    ----------
+    data, transforms, group_sep
+        The arguments the job will be called with. See `symmetry.replicate`.
+
+    Returns
+    -------
+    dict
+        The same keys as `plan_circles`.
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_batch_data
+    from artpack.planning import plan_replicate
+    from artpack.symmetry import dihedral, lattice, compose
+
+    motif = circle_batch_data(range(1_000), 0, 0.4)
+    plan = plan_replicate(motif, compose(lattice((10, 0), (0, 10), 20), dihedral(6)))
+    ```
+    """
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("data", data, pl.DataFrame)
+    missing = [column for column in ("x", "y") if column not in data.columns]
+    if missing:
+        raise ValueError(
+            "`data` must have `x` and `y` columns.\n"
+            f"Missing: {', '.join(f'`{column}`' for column in missing)}"
+        )
+    n_copies = len(_as_transforms(transforms))
+    _check_type("group_sep", group_sep, str)
+
+    ###############################################################################
+    # Estimates
+    ###############################################################################
+    n_rows = data.height * n_copies
+    columns = {}
+    for name in data.columns:
+        column = data[name]
+        if name != "group":
+            columns[name] = column.estimated_size() * n_copies
+        elif column.dtype.is_integer():
+            columns[name] = 8 * n_rows
+        elif isinstance(column.dtype, (pl.Categorical, pl.Enum)):
+            columns[name] = 4 * n_rows
+        else:
+            columns[name] = _copy_label_bytes(column, n_copies, group_sep)
+    if "group" not in data.columns:
+        columns["group"] = _label_bytes("", n_rows, False, False)
+        columns["group"] += _group_label_bytes(
+            f"copy{group_sep}", n_copies, data.height
+        )
+
+    # The float64 (k, n, 2) product, its x and y slices, and the row index
+    # used to repeat the other columns
+    return _plan(columns, n_rows, 16 + 16 + 8)
+
+
+def plan_flow_paths(
+    n_particles: int,
+    n_steps: int = 50,
+    group_value: str = "flow_",
+) -> dict[str, int | dict[str, int] | bool | None]:
+    """
+    Estimate the size of a `flow.flow_paths` job without running it.
+
+    The estimate assumes every particle is traced for all `n_steps`, which
+    is exact without a `bbox` and an upper bound with one.
+
+    Parameters
+    ----------
+    n_particles : int
+        Number of particles (the length of `x` and `y`).
+    n_steps, group_value
+        The arguments the job will be called with. See `flow.flow_paths`.
+
+    Returns
+    -------
+    dict
+        The same keys as `plan_circles`.
+
+    Examples
+    --------
+    ```python
+    from artpack.planning import plan_flow_paths
+
+    plan = plan_flow_paths(50_000, n_steps=200)
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("n_particles", n_particles, int)
+    if n_particles < 0:
+        raise ValueError(
+            f"`n_particles` must be zero or a positive integer.\nYou've supplied: `{n_particles}`"
+        )
+    _check_type("n_steps", n_steps, int)
+    _is_positive_number("n_steps", n_steps)
+    _check_type("group_value", group_value, str)
+
+    ###############################################################################
+    # Estimates
+    ###############################################################################
+    n_rows = n_particles * (n_steps + 1)
+    columns = {
+        "x": 4 * n_rows,
+        "y": 4 * n_rows,
+        "group": _label_bytes("", n_rows, False, False)
+        + _group_label_bytes(group_value, n_particles, n_steps + 1),
+    }
+
+    # The float64 step-by-particle position arrays, their transposed copies,
+    # the validity mask, and the row -> particle index
+    return _plan(columns, n_rows, 16 + 16 + 1 + 8)
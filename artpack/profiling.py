@@ -0,0 +1,280 @@
+###############################################################################
+# artpack/profiling.py
+###############################################################################
+"""Opt-in instrumentation for artpack's public functions."""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Any
+
+
+###############################################################################
+# Recorder
+###############################################################################
+class Profile:
+    """
+    Collected artpack instrumentation data.
+
+    An instance is returned by `profile()`. Recording only happens while
+    profiling is enabled; otherwise every hook is a single attribute check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every recorded function, phase, and cache counter."""
+        with self._lock:
+            self._functions: dict[str, dict[str, Any]] = {}
+            self._caches: dict[str, dict[str, int]] = {}
+
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _entry(self, name: str) -> dict[str, Any]:
+        entry = self._functions.get(name)
+        if entry is None:
+            entry = self._functions[name] = {
+                "calls": 0,
+                "errors": 0,
+                "time_s": 0.0,
+                "rows": 0,
+                "bytes": 0,
+                "phases": {},
+            }
+        return entry
+
+    def _record_call(
+        self, name: str, elapsed: float, rows: int, n_bytes: int, failed: bool = False
+    ):
+        with self._lock:
+            entry = self._entry(name)
+            entry["calls"] += 1
+            entry["errors"] += failed
+            entry["time_s"] += elapsed
+            entry["rows"] += rows
+            entry["bytes"] += n_bytes
+
+    def _record_phase(self, phase: str, elapsed: float):
+        stack = self._stack()
+        name = stack[-1] if stack else "<unknown>"
+        with self._lock:
+            phases = self._entry(name)["phases"]
+            phases[phase] = phases.get(phase, 0.0) + elapsed
+
+    def _record_cache(self, name: str, hit: bool):
+        with self._lock:
+            counts = self._caches.setdefault(name, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Snapshot of everything recorded so far.
+
+        Returns
+        -------
+        dict
+            `{"functions": {...}, "caches": {...}}`. Each function entry has
+            `calls`, `errors` (calls that raised), `time_s` (cumulative),
+            `rows`, `bytes` (output size), and `phases` (cumulative seconds
+            per phase). Each cache entry has
+            `hits`, `misses`, and `hit_rate`.
+        """
+        with self._lock:
+            functions = {
+                name: {**entry, "phases": dict(entry["phases"])}
+                for name, entry in self._functions.items()
+            }
+            caches = {}
+            for name, counts in self._caches.items():
+                total = counts["hits"] + counts["misses"]
+                caches[name] = {
+                    **counts,
+                    "hit_rate": counts["hits"] / total if total else 0.0,
+                }
+        return {"functions": functions, "caches": caches}
+
+    def report(self) -> str:
+        """Format the recorded statistics as a plain-text table."""
+        snapshot = self.stats()
+        header = (
+            f"{'function':<24} {'calls':>8} {'errors':>8} {'time (ms)':>11} "
+            f"{'rows':>12} {'bytes':>14}"
+        )
+        lines = [header]
+        for name, entry in sorted(snapshot["functions"].items()):
+            lines.append(
+                f"{name:<24} {entry['calls']:>8} {entry['errors']:>8} "
+                f"{entry['time_s'] * 1000:>11.3f} {entry['rows']:>12} {entry['bytes']:>14}"
+            )
+            for phase, seconds in sorted(entry["phases"].items()):
+                lines.append(f"  {phase:<22} {'':>8} {'':>8} {seconds * 1000:>11.3f}")
+        for name, counts in sorted(snapshot["caches"].items()):
+            lines.append(
+                f"cache {name}: {counts['hits']} hits, {counts['misses']} misses "
+                f"({counts['hit_rate']:.0%} hit rate)"
+            )
+        return "\n".join(lines)
+
+
+_PROFILE = Profile()
+
+
+###############################################################################
+# Public API
+###############################################################################
+@contextmanager
+def profile(reset: bool = True) -> Iterator[Profile]:
+    """
+    Record artpack call counts, phase timings, output sizes, and cache hit rates.
+
+    Instrumentation is off by default and costs a single flag check per call
+    until this context manager turns it on.
+
+    Parameters
+    ----------
+    reset : bool, default True
+        Whether to clear previously recorded statistics on entry.
+
+    Returns
+    -------
+    Profile
+        The recorder. Call `.stats()` for a dictionary or `.report()` for a
+        formatted table, inside or after the `with` block.
+
+    Examples
+    --------
+    ```python
+    import artpack
+
+    with artpack.profile() as prof:
+        artpack.circle_data(x=0, y=0, radius=5, color="#000000")
+        artpack.art_pals("rainbow", 50)
+
+    print(prof.report())
+    ```
+    """
+    if reset:
+        _PROFILE.reset()
+    previous = _PROFILE.enabled
+    _PROFILE.enabled = True
+    try:
+        yield _PROFILE
+    finally:
+        _PROFILE.enabled = previous
+
+
+def stats() -> dict[str, dict[str, Any]]:
+    """
+    Return the statistics recorded by the most recent `profile()` block(s).
+
+    Returns
+    -------
+    dict
+        `{"functions": {...}, "caches": {...}}`. See `Profile.stats`.
+    """
+    return _PROFILE.stats()
+
+
+###############################################################################
+# Internal hooks
+###############################################################################
+def _output_size(result: Any) -> tuple[int, int]:
+    """Rows and bytes produced by a public function's return value."""
+    if hasattr(result, "estimated_size"):
+        return result.height, result.estimated_size()
+    if isinstance(result, list):
+        return len(result), sum(len(item) for item in result if isinstance(item, str))
+    return 0, 0
+
+
+def _instrumented(func: Callable) -> Callable:
+    """
+    Record calls, time, and output size of a public function when profiling.
+
+    Calls that raise are recorded too, with their time and no output.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _PROFILE.enabled:
+            return func(*args, **kwargs)
+        stack = _PROFILE._stack()
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            _PROFILE._record_call(name, time.perf_counter() - start, 0, 0, failed=True)
+            raise
+        finally:
+            stack.pop()
+        _PROFILE._record_call(name, time.perf_counter() - start, *_output_size(result))
+        return result
+
+    return wrapper
+
+
+class _Phase:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        _PROFILE._record_phase(self.name, time.perf_counter() - self.start)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def _phase(name: str) -> _Phase | _NullPhase:
+    """Time a phase (e.g. "validation") of the currently instrumented function."""
+    if not _PROFILE.enabled:
+        return _NULL_PHASE
+    return _Phase(name)
+
+
+def _counted_cache(name: str, maxsize: int = 128) -> Callable:
+    """`functools.lru_cache` that reports hits and misses while profiling."""
+
+    def decorator(func: Callable) -> Callable:
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args):
+            if not _PROFILE.enabled:
+                return cached(*args)
+            hits = cached.cache_info().hits
+            result = cached(*args)
+            _PROFILE._record_cache(name, cached.cache_info().hits > hits)
+            return result
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
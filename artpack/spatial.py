@@ -0,0 +1,439 @@
+###############################################################################
+# artpack/spatial.py
+###############################################################################
+"""Uniform-grid index over shape bounding boxes for scene-level queries."""
+
+import numpy as np
+import polars as pl
+
+from artpack._utils import _check_type, _is_positive_number
+
+_BOUND_COLUMNS = ("xmin", "ymin", "xmax", "ymax")
+_COVER_SHAPES = ("box", "circle")
+
+
+###############################################################################
+# Input conversion
+###############################################################################
+def _as_rows(param_name: str, values, width: int, description: str) -> np.ndarray:
+    """
+    Internal converter for one row or an (n, width) array of rows. Raises if invalid.
+
+    Returns an (n, width) float64 array.
+    """
+    try:
+        if isinstance(values, (str, bytes)):
+            raise TypeError
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise TypeError(
+            f"`{param_name}` should be an array of numbers.\n"
+            f"You've supplied a `{type(values).__name__}` object"
+        ) from None
+    if array.ndim == 1:
+        array = array[None]
+    if array.ndim != 2 or array.shape[1] != width:
+        raise ValueError(
+            f"`{param_name}` must be {description} or an (n, {width}) array of them.\n"
+            f"You've supplied an array with shape {np.shape(values)}"
+        )
+    return array
+
+
+def _as_boxes(boxes) -> np.ndarray:
+    """Internal converter for (xmin, ymin, xmax, ymax) query boxes. Raises if invalid."""
+    boxes = _as_rows("boxes", boxes, 4, "an (xmin, ymin, xmax, ymax) box")
+    inverted = (boxes[:, 0] > boxes[:, 2]) | (boxes[:, 1] > boxes[:, 3])
+    if inverted.any():
+        raise ValueError(
+            "`boxes` must have xmin <= xmax and ymin <= ymax.\n"
+            f"You've supplied: `{tuple(boxes[inverted][0].tolist())}`"
+        )
+    return boxes
+
+
+###############################################################################
+# Ragged array helpers
+###############################################################################
+def _ragged(counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Internal flattening of ragged ranges.
+
+    For ranges of `counts[i]` items, returns each item's range number and its
+    position within the range.
+    """
+    owner = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, local
+
+
+def _box_distance(points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Internal distance from each point to its box (0 inside the box)."""
+    dx = np.maximum(
+        np.maximum(boxes[:, 0] - points[:, 0], points[:, 0] - boxes[:, 2]), 0
+    )
+    dy = np.maximum(
+        np.maximum(boxes[:, 1] - points[:, 1], points[:, 1] - boxes[:, 3]), 0
+    )
+    return np.hypot(dx, dy)
+
+
+def _ring(k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Internal cell offsets of the square ring `k` cells from the center."""
+    span = np.arange(-k, k + 1)
+    dx, dy = np.meshgrid(span, span)
+    on_ring = np.maximum(np.abs(dx), np.abs(dy)) == k
+    return dx[on_ring], dy[on_ring]
+
+
+###############################################################################
+# Shape index
+###############################################################################
+class ShapeIndex:
+    """
+    A spatial index over the bounding boxes of the shapes in a scene.
+
+    Each group's bounding box is computed once and bulk-loaded into a
+    uniform grid stored as flat NumPy arrays (a CSR layout of the shapes in
+    every cell). Queries take whole batches of boxes or points and are
+    answered with vectorized candidate lookups and exact box tests, with no
+    per-shape Python loop, so they scale to millions of shapes.
+
+    Parameters
+    ----------
+    data : pl.DataFrame
+        Shape data (e.g. from `circle_batch_data` or `Canvas.to_polars`) with
+        `x`, `y`, and `group` columns. Row order is draw order.
+    cell_size : float or int, optional, default None
+        Side length of the grid cells. Default is the larger of the median
+        shape size and the cell size that gives about one shape per cell.
+
+    Notes
+    -----
+    Queries work on bounding boxes: `query` and `nearest` are exact for the
+    boxes, and conservative (never miss a shape) for the outlines inside them.
+    Use `ShapeIndex.from_bounds` to index shapes from their specs, without
+    generating vertices first.
+
+    Examples
+    --------
+    ```python
+    import numpy as np
+    import polars as pl
+    from artpack import circle_batch_data
+    from artpack.spatial import ShapeIndex
+
+    rng = np.random.default_rng(1)
+    xs, ys = rng.uniform(0, 100, (2, 10_000))
+    dots = circle_batch_data(xs, ys, radius=rng.uniform(0.2, 3, 10_000))
+
+    index = ShapeIndex(dots)
+    in_corner = index.query((0, 0, 10, 10))["group"]
+    dots = dots.filter(~pl.col("group").is_in(index.covered("circle").implode()))
+    ```
+    """
+
+    def __init__(self, data: pl.DataFrame, cell_size: float | None = None):
+        _check_type("data", data, pl.DataFrame)
+        missing = [name for name in ("x", "y", "group") if name not in data.columns]
+        if missing:
+            raise ValueError(
+                "`data` must have `x`, `y`, and `group` columns.\n"
+                f"Missing: {', '.join(f'`{name}`' for name in missing)}"
+            )
+        bounds = data.group_by("group", maintain_order=True).agg(
+            xmin=pl.col("x").min(),
+            ymin=pl.col("y").min(),
+            xmax=pl.col("x").max(),
+            ymax=pl.col("y").max(),
+        )
+        self._build(bounds, cell_size)
+
+    @classmethod
+    def from_bounds(cls, bounds: pl.DataFrame, cell_size: float | None = None):
+        """
+        Build an index straight from shape bounding boxes.
+
+        Parameters
+        ----------
+        bounds : pl.DataFrame
+            One row per shape with `group`, `xmin`, `ymin`, `xmax`, and `ymax`
+            columns, in draw order.
+        cell_size : float or int, optional, default None
+            See `ShapeIndex`.
+
+        Returns
+        -------
+        ShapeIndex
+
+        Examples
+        --------
+        ```python
+        import polars as pl
+        from artpack.spatial import ShapeIndex
+
+        specs = pl.DataFrame({"x": [0.0, 5.0], "y": [0.0, 1.0], "radius": [1.0, 2.0]})
+        index = ShapeIndex.from_bounds(
+            specs.select(
+                group=pl.format("circle_{}", pl.int_range(1, pl.len() + 1)),
+                xmin=pl.col("x") - pl.col("radius"),
+                ymin=pl.col("y") - pl.col("radius"),
+                xmax=pl.col("x") + pl.col("radius"),
+                ymax=pl.col("y") + pl.col("radius"),
+            )
+        )
+        ```
+        """
+        _check_type("bounds", bounds, pl.DataFrame)
+        missing = [
+            name for name in ("group", *_BOUND_COLUMNS) if name not in bounds.columns
+        ]
+        if missing:
+            raise ValueError(
+                "`bounds` must have `group`, `xmin`, `ymin`, `xmax`, and `ymax` columns.\n"
+                f"Missing: {', '.join(f'`{name}`' for name in missing)}"
+            )
+        index = cls.__new__(cls)
+        index._build(bounds, cell_size)
+        return index
+
+    def _build(self, bounds: pl.DataFrame, cell_size: float | None) -> None:
+        """Bulk-load the grid from one row of bounds per shape."""
+        if cell_size is not None:
+            _check_type("cell_size", cell_size, (float, int))
+            _is_positive_number("cell_size", cell_size)
+
+        self._groups = bounds["group"]
+        self._boxes = bounds.select(_BOUND_COLUMNS).to_numpy().astype(np.float64)
+        n_shapes = len(self._boxes)
+        if n_shapes:
+            self._origin = self._boxes[:, :2].min(axis=0)
+            span = self._boxes[:, 2:].max(axis=0) - self._origin
+        else:
+            self._origin, span = np.zeros(2), np.zeros(2)
+
+        if cell_size is None:
+            sizes = np.maximum(
+                self._boxes[:, 2] - self._boxes[:, 0],
+                self._boxes[:, 3] - self._boxes[:, 1],
+            )
+            # Never more than ~3 cells per shape, even for flat or sparse scenes
+            cell_size = max(
+                np.median(sizes) if n_shapes else 0.0,
+                np.sqrt(span.prod() / max(n_shapes, 1)),
+                span.max() / max(n_shapes, 1),
+            )
+        self._cell_size = float(cell_size) or 1.0
+        self._n_x, self._n_y = (span // self._cell_size).astype(np.int64) + 1
+
+        # CSR layout: the shapes of cell c are _items[_starts[c]:_starts[c + 1]]
+        owner, cells = self._box_cells(self._boxes)
+        self._items = owner[np.argsort(cells, kind="stable")]
+        counts = np.bincount(cells, minlength=self._n_x * self._n_y)
+        self._starts = np.concatenate([[0], np.cumsum(counts)])
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __repr__(self) -> str:
+        return (
+            f"ShapeIndex(shapes={len(self)}, grid={self._n_x}x{self._n_y}, "
+            f"cell_size={self._cell_size:g})"
+        )
+
+    @property
+    def cell_size(self) -> float:
+        """Side length of the grid cells."""
+        return self._cell_size
+
+    @property
+    def bounds(self) -> pl.DataFrame:
+        """The indexed shapes' bounding boxes, one row per group in draw order."""
+        return pl.DataFrame(
+            {"group": self._groups}
+            | {name: self._boxes[:, i] for i, name in enumerate(_BOUND_COLUMNS)}
+        )
+
+    ###############################################################################
+    # Grid lookups
+    ###############################################################################
+    def _cell_of(self, values: np.ndarray, axis: int) -> np.ndarray:
+        """Grid column (axis 0) or row (axis 1) of coordinates, clamped to the grid."""
+        n_cells = self._n_x if axis == 0 else self._n_y
+        cells = np.floor((values - self._origin[axis]) / self._cell_size)
+        return np.clip(cells, 0, n_cells - 1).astype(np.int64)
+
+    def _box_cells(self, boxes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Every (box, cell) pair for the grid cells each box overlaps."""
+        x0, x1 = self._cell_of(boxes[:, 0], 0), self._cell_of(boxes[:, 2], 0)
+        y0, y1 = self._cell_of(boxes[:, 1], 1), self._cell_of(boxes[:, 3], 1)
+        width = x1 - x0 + 1
+        owner, local = _ragged(width * (y1 - y0 + 1))
+        cells = (y0[owner] + local // width[owner]) * self._n_x
+        return owner, cells + x0[owner] + local % width[owner]
+
+    def _candidates(
+        self, owner: np.ndarray, cells: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Every (owner, shape) pair for the shapes stored in each owner's cells."""
+        starts = self._starts[cells]
+        pair, local = _ragged(self._starts[cells + 1] - starts)
+        return owner[pair], self._items[starts[pair] + local]
+
+    ###############################################################################
+    # Queries
+    ###############################################################################
+    def query(self, boxes) -> pl.DataFrame:
+        """
+        Find the shapes overlapping each of a batch of boxes.
+
+        Parameters
+        ----------
+        boxes : array-like
+            One (xmin, ymin, xmax, ymax) box or an (n, 4) array of them. Use
+            zero-size boxes (x, y, x, y) to hit-test points.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per overlapping (box, shape) pair, sorted by box and then
+            draw order, with columns `query` (the box's row number) and
+            `group`.
+        """
+        boxes = _as_boxes(boxes)
+        n_shapes = len(self)
+        if n_shapes == 0 or len(boxes) == 0:
+            return pl.DataFrame(
+                {"query": [], "group": []},
+                schema={"query": pl.UInt32, "group": self._groups.dtype},
+            )
+
+        query, shape = self._candidates(*self._box_cells(boxes))
+        found, asked = self._boxes[shape], boxes[query]
+        hit = (
+            (found[:, 0] <= asked[:, 2])
+            & (found[:, 2] >= asked[:, 0])
+            & (found[:, 1] <= asked[:, 3])
+            & (found[:, 3] >= asked[:, 1])
+        )
+        # A shape spanning several cells is found once per cell
+        query, shape = np.divmod(
+            np.unique(query[hit] * n_shapes + shape[hit]), n_shapes
+        )
+        return pl.DataFrame(
+            {
+                "query": pl.Series(query, dtype=pl.UInt32),
+                "group": self._groups.gather(shape),
+            }
+        )
+
+    def covered(self, shape: str = "box") -> pl.Series:
+        """
+        Find the shapes fully covered by a single shape drawn after them.
+
+        Parameters
+        ----------
+        shape : str, default "box"
+            How shapes are compared: "box" compares bounding boxes, "circle"
+            treats each shape as the circle inscribed in its bounding box
+            (exact for circles from `circle_data` and `circle_batch_data`).
+
+        Returns
+        -------
+        pl.Series
+            The `group` labels of covered shapes, in draw order. Filled shapes
+            with these labels are hidden and can be removed from the scene.
+        """
+        if shape not in _COVER_SHAPES:
+            raise ValueError(
+                f"`shape` must be one of: {', '.join(_COVER_SHAPES)}.\n"
+                f"You've supplied: '{shape}'"
+            )
+        # A covering shape overlaps every cell of the shape it covers, so only
+        # the cell holding each shape's lower-left corner needs searching
+        corner_cells = self._cell_of(self._boxes[:, 1], 1) * self._n_x + self._cell_of(
+            self._boxes[:, 0], 0
+        )
+        inner, outer = self._candidates(np.arange(len(self)), corner_cells)
+        later = outer > inner
+        inner, outer = inner[later], outer[later]
+        a, b = self._boxes[inner], self._boxes[outer]
+        inside = (
+            (b[:, 0] <= a[:, 0])
+            & (b[:, 1] <= a[:, 1])
+            & (b[:, 2] >= a[:, 2])
+            & (b[:, 3] >= a[:, 3])
+        )
+        if shape == "circle":
+            gap = np.hypot(
+                (a[:, 0] + a[:, 2] - b[:, 0] - b[:, 2]) / 2,
+                (a[:, 1] + a[:, 3] - b[:, 1] - b[:, 3]) / 2,
+            )
+            inside &= gap + (a[:, 2] - a[:, 0]) / 2 <= (b[:, 2] - b[:, 0]) / 2
+        return self._groups.gather(np.unique(inner[inside]))
+
+    def nearest(self, points) -> pl.DataFrame:
+        """
+        Find the shape nearest to each of a batch of points.
+
+        Distance is measured to each shape's bounding box, so it's 0 for
+        points inside a box. The grid is searched ring by ring around every
+        point at once, stopping for each point once no farther cell can hold
+        a nearer shape.
+
+        Parameters
+        ----------
+        points : array-like
+            One (x, y) point or an (n, 2) array of them.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per point with columns `group` (null if the index is
+            empty) and `distance`. Ties go to the shape drawn first.
+        """
+        points = _as_rows("points", points, 2, "an (x, y) point")
+        best = np.full(len(points), np.inf)
+        best_shape = np.zeros(len(points), dtype=np.int64)
+        if len(self) == 0:
+            return pl.DataFrame(
+                {
+                    "group": pl.Series([None] * len(points), dtype=self._groups.dtype),
+                    "distance": best,
+                }
+            )
+
+        cell_x = self._cell_of(points[:, 0], 0)
+        cell_y = self._cell_of(points[:, 1], 1)
+        pending = np.arange(len(points))
+        for k in range(max(self._n_x, self._n_y)):
+            dx, dy = _ring(k)
+            grid_x = cell_x[pending, None] + dx
+            grid_y = cell_y[pending, None] + dy
+            on_grid = (grid_x >= 0) & (grid_x < self._n_x)
+            on_grid &= (grid_y >= 0) & (grid_y < self._n_y)
+            owner = np.broadcast_to(pending[:, None], grid_x.shape)[on_grid]
+            point, shape = self._candidates(
+                owner, (grid_y * self._n_x + grid_x)[on_grid]
+            )
+
+            if len(point):
+                distance = _box_distance(points[point], self._boxes[shape])
+                order = np.lexsort((shape, distance, point))
+                point, shape, distance = point[order], shape[order], distance[order]
+                first = np.concatenate([[True], point[1:] != point[:-1]])
+                point, shape, distance = point[first], shape[first], distance[first]
+                nearer = (distance < best[point]) | (
+                    (distance == best[point]) & (shape < best_shape[point])
+                )
+                best[point[nearer]] = distance[nearer]
+                best_shape[point[nearer]] = shape[nearer]
+
+            # Cells beyond ring k are at least k cells away from the point
+            pending = pending[best[pending] > k * self._cell_size]
+            if len(pending) == 0:
+                break
+
+        return pl.DataFrame(
+            {"group": self._groups.gather(best_shape), "distance": best}
+        )
@@ -0,0 +1,296 @@
+###############################################################################
+# artpack/svg.py
+###############################################################################
+import os
+from contextlib import ExitStack
+from typing import IO
+
+import polars as pl
+
+from artpack._utils import (
+    _check_bbox,
+    _check_type,
+    _is_positive_number,
+    _is_valid_color,
+)
+from artpack.colors import unpack_colors
+
+
+###############################################################################
+# Path formatting
+###############################################################################
+def _coordinate_expr(column: str, offset: float, flip: bool, precision: int) -> pl.Expr:
+    """
+    Internal expression formatting one coordinate column for SVG output.
+
+    Shifts the column into the viewBox (flipping y so "up" matches plotnine),
+    rounds to `precision` decimals, and drops trailing ".0".
+    """
+    value = pl.col(column).cast(pl.Float64)
+    value = ((offset - value) if flip else (value - offset)).round(precision)
+    return (
+        pl.when(value == 0)
+        .then(pl.lit("0"))
+        .otherwise(value.cast(pl.Utf8).str.strip_suffix(".0"))
+    )
+
+
+def _format_length(value: float, precision: int) -> str:
+    """
+    Internal formatter for the SVG's size and viewBox.
+
+    Keeps `precision` decimals like the coordinates do (`:g` would round
+    large extents to 6 significant digits) and drops trailing zeros.
+    """
+    text = f"{value:.{precision}f}"
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+def _path_elements(
+    chunk: pl.DataFrame,
+    has_color: bool,
+    has_fill: bool,
+    close: bool,
+    stroke_width: float,
+) -> pl.Series:
+    """
+    Internal builder of `<path>` elements for one chunk of formatted points.
+
+    Rows of `chunk` are already grouped contiguously; each group becomes one
+    path whose `d` string is built with a single string join. Packed RGBA
+    colors are converted to hex here, once per distinct color.
+    """
+    style = []
+    if has_color:
+        style.append(pl.col("color").first().alias("color"))
+    if has_fill:
+        style.append(pl.col("fill").first().alias("fill"))
+
+    paths = chunk.group_by("_gid", maintain_order=True).agg(
+        pl.col("_point").str.join(" "), *style
+    )
+    paths = unpack_colors(paths)
+
+    fill = pl.col("fill").fill_null("none") if has_fill else pl.lit("none")
+    if has_color:
+        stroke = pl.col("color").fill_null("none")
+    else:
+        stroke = pl.lit("none" if has_fill else "#000000")
+
+    return paths.select(
+        pl.concat_str(
+            pl.lit('<path d="M'),
+            pl.col("_point"),
+            pl.lit(" Z" if close else ""),
+            pl.lit('" fill="'),
+            fill,
+            pl.lit('" stroke="'),
+            stroke,
+            pl.lit(f'" stroke-width="{stroke_width:g}"/>'),
+        )
+    ).to_series()
+
+
+###############################################################################
+# SVG writer
+###############################################################################
+def write_svg(
+    data: pl.DataFrame,
+    file: str | os.PathLike | IO[str],
+    width: float | None = None,
+    height: float | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+    precision: int = 2,
+    stroke_width: float = 1,
+    close: bool | None = None,
+    background: str | None = None,
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Write shape data (e.g. from `circle_data`) to an SVG file.
+
+    Each group becomes one `<path>`. Coordinates are formatted and path
+    strings built in bulk with polars string operations, `chunk_size` groups
+    at a time, and streamed to `file`. Only a group key per point is held for
+    the whole frame, so formatted text never exceeds one chunk.
+
+    Parameters
+    ----------
+    data : pl.DataFrame
+        Columns `x` and `y`, plus optional `group`, `color` (stroke), and `fill`.
+        Colors may be strings or packed RGBA integers (`color_format="rgba"`).
+        Without a `group` column all rows form a single path.
+    file : str, path-like, or text file handle
+        Where to write the SVG.
+    width : float or int, optional
+        The SVG's display width. Default is the width of `bbox`.
+    height : float or int, optional
+        The SVG's display height. Default is the height of `bbox`.
+    bbox : tuple of float, optional
+        The visible region as (xmin, ymin, xmax, ymax) in data coordinates.
+        Default is the extent of the data.
+    precision : int, default 2
+        Number of decimals kept for each coordinate and for the SVG's size
+        and viewBox.
+    stroke_width : float or int, default 1
+        The outline width, in viewBox units.
+    close : bool, optional
+        Whether to close each path back to its first point. Default closes
+        paths when `data` has a `fill` column.
+    background : str, optional
+        A color painted behind the shapes.
+    chunk_size : int, default 10000
+        Number of paths formatted and written at a time.
+
+    Notes
+    -----
+    Strokes default to black when `data` has neither `color` nor `fill`, and
+    to none when it only has `fill`. The y-axis is flipped so the image has
+    the same orientation as a plotnine plot of the same data.
+
+    Returns
+    -------
+    int
+        The number of paths written.
+
+    Examples
+    --------
+    ```python
+    from artpack import art_pals, circle_batch_data
+    from artpack.svg import write_svg
+
+    dots = circle_batch_data(x=range(10), y=0, radius=0.45, fill=art_pals("neon", 10))
+    write_svg(dots, "dots.svg", width=800, precision=3)
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("data", data, pl.DataFrame)
+    missing = [column for column in ("x", "y") if column not in data.columns]
+    if missing:
+        raise ValueError(
+            "`data` must have `x` and `y` columns.\n"
+            f"Missing: {', '.join(f'`{column}`' for column in missing)}"
+        )
+    _check_type("precision", precision, int)
+    if precision < 0:
+        raise ValueError(f"`precision` must be >= 0.\nYou've supplied: `{precision}`")
+    _is_positive_number("stroke_width", stroke_width)
+    _check_type("chunk_size", chunk_size, int)
+    _is_positive_number("chunk_size", chunk_size)
+    for param_name, size in (("width", width), ("height", height)):
+        if size is not None:
+            _is_positive_number(param_name, size)
+    if bbox is not None:
+        _check_bbox("bbox", bbox)
+    if background is not None:
+        _is_valid_color("background", background)
+
+    ###############################################################################
+    # Layout
+    ###############################################################################
+    group = "group" if "group" in data.columns else None
+    has_color = "color" in data.columns
+    has_fill = "fill" in data.columns
+    close = has_fill if close is None else close
+
+    if bbox is None:
+        bounds = data.select(
+            pl.col("x").min().alias("xmin"),
+            pl.col("y").min().alias("ymin"),
+            pl.col("x").max().alias("xmax"),
+            pl.col("y").max().alias("ymax"),
+        ).row(0)
+        bbox = tuple(0.0 if value is None else float(value) for value in bounds)
+    xmin, ymin, xmax, ymax = bbox
+    view_width = max(xmax - xmin, 10.0**-precision)
+    view_height = max(ymax - ymin, 10.0**-precision)
+    width = view_width if width is None else width
+    height = view_height if height is None else height
+
+    ###############################################################################
+    # Path Layout
+    ###############################################################################
+    columns = [
+        pl.concat_str(
+            _coordinate_expr("x", xmin, False, precision),
+            pl.lit(","),
+            _coordinate_expr("y", ymax, True, precision),
+        ).alias("_point")
+    ]
+    # Packed RGBA colors stay integers until `_path_elements`
+    for column, present in (("color", has_color), ("fill", has_fill)):
+        if present and not data.schema[column].is_integer():
+            columns.append(pl.col(column).cast(pl.Utf8))
+        elif present:
+            columns.append(pl.col(column))
+
+    # Key each group by its first row; only this key (and, when groups aren't
+    # already contiguous, the row order that makes them so) covers every row
+    if group is not None:
+        gid = (
+            data.select(group)
+            .with_row_index("_row")
+            .select(pl.col("_row").min().over(group).alias("_gid"))
+            .to_series()
+        )
+    else:
+        gid = pl.repeat(0, data.height, dtype=pl.UInt32, eager=True).alias("_gid")
+    order = None
+    if not gid.is_sorted():
+        order = gid.to_frame().select(pl.arg_sort_by("_gid", maintain_order=True))
+        order = order.to_series()
+        gid = gid.gather(order)
+    row_ends = gid.rle().struct.field("len").cum_sum().to_list()
+
+    ###############################################################################
+    # Streaming Output
+    ###############################################################################
+    n_paths = 0
+    with ExitStack() as stack:
+        if hasattr(file, "write"):
+            handle = file
+        else:
+            handle = stack.enter_context(open(file, "w", encoding="utf-8"))
+        handle.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{_format_length(width, precision)}" '
+            f'height="{_format_length(height, precision)}" '
+            f'viewBox="0 0 {_format_length(view_width, precision)} '
+            f'{_format_length(view_height, precision)}">\n'
+        )
+        if background is not None:
+            handle.write(f'<rect width="100%" height="100%" fill="{background}"/>\n')
+
+        start_row, start_group = 0, 0
+        while start_group < len(row_ends):
+            stop_group = min(start_group + chunk_size, len(row_ends))
+            stop_row = row_ends[stop_group - 1]
+            n_rows = stop_row - start_row
+            if order is None:
+                rows = data.slice(start_row, n_rows)
+            else:
+                rows = data[order.slice(start_row, n_rows)]
+
+            # Format this chunk's points and drop points that round to the
+            # same position as the point before them in their group
+            points = (
+                rows.lazy()
+                .select(*columns)
+                .with_columns(pl.lit(gid.slice(start_row, n_rows)))
+                .filter(
+                    (pl.col("_point") != pl.col("_point").shift()).fill_null(True)
+                    | (pl.col("_gid") != pl.col("_gid").shift()).fill_null(True)
+                )
+                .collect()
+            )
+            paths = _path_elements(points, has_color, has_fill, close, stroke_width)
+            handle.write(paths.str.join("\n").item())
+            handle.write("\n")
+            n_paths += len(paths)
+            start_row, start_group = stop_row, stop_group
+
+        handle.write("</svg>\n")
+    return n_paths
@@ -0,0 +1,328 @@
+###############################################################################
+# artpack/symmetry.py
+###############################################################################
+"""Replication of shape data under symmetry operations and tiling lattices."""
+
+from collections.abc import Sequence
+
+import numpy as np
+import polars as pl
+
+from artpack._utils import _check_type, _is_positive_number
+
+
+###############################################################################
+# Transform builders
+###############################################################################
+def _as_transforms(transforms) -> np.ndarray:
+    """
+    Internal converter for affine transforms. Raises if invalid.
+
+    Accepts one matrix or a stack of 2x3 or 3x3 affine matrices and returns
+    a (k, 3, 3) float64 array.
+    """
+    try:
+        ops = np.asarray(transforms, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise TypeError(
+            "`transforms` should be an array of affine matrices.\n"
+            f"You've supplied a `{type(transforms).__name__}` object"
+        ) from None
+    if ops.ndim == 2:
+        ops = ops[None]
+    if ops.ndim != 3 or ops.shape[1:] not in ((2, 3), (3, 3)):
+        raise ValueError(
+            "`transforms` must be a 2x3 or 3x3 affine matrix, or a stack of them.\n"
+            f"You've supplied an array with shape {ops.shape}"
+        )
+    if ops.shape[1] == 2:
+        bottom = np.broadcast_to([0.0, 0.0, 1.0], (len(ops), 1, 3))
+        ops = np.concatenate([ops, bottom], axis=1)
+    return ops
+
+
+def _check_point(param_name: str, point) -> np.ndarray:
+    """Internal validator for (x, y) pairs. Raises if invalid."""
+    _check_type(param_name, point, (tuple, list, np.ndarray))
+    if len(point) != 2:
+        raise ValueError(
+            f"`{param_name}` must be an (x, y) pair.\nYou've supplied: `{point}`"
+        )
+    return np.asarray(point, dtype=np.float64)
+
+
+def _about(linear: np.ndarray, center: np.ndarray) -> np.ndarray:
+    """Internal builder of (k, 3, 3) affine transforms applying `linear` about `center`."""
+    ops = np.zeros((len(linear), 3, 3))
+    ops[:, :2, :2] = linear
+    ops[:, :2, 2] = center - linear @ center
+    ops[:, 2, 2] = 1.0
+    return ops
+
+
+def rotations(n: int, center: Sequence[float] = (0, 0)) -> np.ndarray:
+    """
+    Build the `n` rotations of a cyclic symmetry (turns of 360/n degrees).
+
+    Parameters
+    ----------
+    n : int
+        Number of rotations, including the identity. Must be positive.
+    center : tuple of float, default (0, 0)
+        The point rotated about.
+
+    Returns
+    -------
+    np.ndarray
+        An (n, 3, 3) stack of affine matrices for `replicate`.
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_data
+    from artpack.symmetry import replicate, rotations
+
+    petal = circle_data(x=3, y=0, radius=1, group_var=True, group_value="petal")
+    flower = replicate(petal, rotations(8))
+    ```
+    """
+    _check_type("n", n, int)
+    _is_positive_number("n", n)
+    center = _check_point("center", center)
+
+    theta = 2 * np.pi * np.arange(n) / n
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    linear = np.stack([np.stack([cos_t, -sin_t], -1), np.stack([sin_t, cos_t], -1)], 1)
+    return _about(linear, center)
+
+
+def dihedral(
+    n: int, center: Sequence[float] = (0, 0), axis_angle: float = 0
+) -> np.ndarray:
+    """
+    Build the 2n operations of a kaleidoscope (dihedral) symmetry.
+
+    Parameters
+    ----------
+    n : int
+        Order of the symmetry. Must be positive.
+    center : tuple of float, default (0, 0)
+        The point all mirror lines pass through.
+    axis_angle : float or int, default 0
+        Angle of the first mirror line, in degrees.
+
+    Returns
+    -------
+    np.ndarray
+        A (2n, 3, 3) stack of affine matrices: the `n` rotations of
+        `rotations(n, center)` followed by the `n` reflections across mirror
+        lines `180/n` degrees apart.
+    """
+    _check_type("n", n, int)
+    _is_positive_number("n", n)
+    _check_type("axis_angle", axis_angle, (float, int))
+    center = _check_point("center", center)
+
+    phi = np.deg2rad(axis_angle) + np.pi * np.arange(n) / n
+    cos_2p, sin_2p = np.cos(2 * phi), np.sin(2 * phi)
+    mirrors = np.stack(
+        [np.stack([cos_2p, sin_2p], -1), np.stack([sin_2p, -cos_2p], -1)], 1
+    )
+    return np.concatenate([rotations(n, tuple(center)), _about(mirrors, center)])
+
+
+def lattice(
+    a: Sequence[float],
+    b: Sequence[float],
+    n_a: int,
+    n_b: int = 1,
+) -> np.ndarray:
+    """
+    Build the translations of a tiling lattice.
+
+    Parameters
+    ----------
+    a : tuple of float
+        The first lattice vector.
+    b : tuple of float
+        The second lattice vector.
+    n_a : int
+        Number of copies along `a`.
+    n_b : int, default 1
+        Number of copies along `b`.
+
+    Returns
+    -------
+    np.ndarray
+        An (n_a * n_b, 3, 3) stack of translations `i * a + j * b`, row by row
+        along `a`.
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_data
+    from artpack.symmetry import compose, dihedral, lattice, replicate
+
+    motif = circle_data(x=0.3, y=0.1, radius=0.1, group_var=True, group_value="m")
+    # A hexagonal wallpaper: a 6-fold kaleidoscope repeated on a 10 x 10 grid
+    tiles = lattice((1, 0), (0.5, 3**0.5 / 2), 10, 10)
+    wallpaper = replicate(motif, compose(tiles, dihedral(6)))
+    ```
+    """
+    a = _check_point("a", a)
+    b = _check_point("b", b)
+    for param_name, count in (("n_a", n_a), ("n_b", n_b)):
+        _check_type(param_name, count, int)
+        _is_positive_number(param_name, count)
+
+    j, i = np.divmod(np.arange(n_a * n_b), n_a)
+    ops = np.tile(np.eye(3), (n_a * n_b, 1, 1))
+    ops[:, :2, 2] = i[:, None] * a + j[:, None] * b
+    return ops
+
+
+def compose(outer, inner) -> np.ndarray:
+    """
+    Combine two sets of transforms into every pairwise product.
+
+    Parameters
+    ----------
+    outer : array-like
+        Transforms applied second (e.g. lattice translations).
+    inner : array-like
+        Transforms applied first (e.g. the symmetry of one tile).
+
+    Returns
+    -------
+    np.ndarray
+        A (len(outer) * len(inner), 3, 3) stack; entry `i * len(inner) + j` is
+        `outer[i] @ inner[j]`.
+    """
+    outer, inner = _as_transforms(outer), _as_transforms(inner)
+    return np.matmul(outer[:, None], inner[None]).reshape(-1, 3, 3)
+
+
+###############################################################################
+# Replication
+###############################################################################
+def _copy_groups(group: pl.Series, n_copies: int, sep: str) -> pl.Series:
+    """
+    Internal builder of the group column of every copy.
+
+    Each distinct group gets one new label (or id) per copy, built once and
+    gathered onto the rows, so the per-row work is integer indexing only.
+    Null groups stay null in every copy. Integer groups become Int64 so the
+    offsets can't overflow, and Enum groups become Categorical, as the new
+    labels aren't among the Enum's categories.
+    """
+    n_rows = len(group)
+    if group.dtype.is_integer():
+        # Int64 so offsets can't wrap around in small or unsigned dtypes
+        group = group.cast(pl.Int64)
+        span = group.max() - group.min() + 1 if group.null_count() < n_rows else 0
+        offsets = np.repeat(np.arange(n_copies) * span, n_rows)
+        rows = np.tile(np.arange(n_rows), n_copies)
+        return group.gather(rows) + pl.Series(offsets, dtype=pl.Int64)
+
+    physical = group.cast(pl.Categorical).to_physical().to_numpy()
+    _, first, codes = np.unique(physical, return_index=True, return_inverse=True)
+    n_groups = len(first)
+    labels = pl.DataFrame(
+        {
+            "label": group.cast(pl.Utf8).gather(np.tile(first, n_copies)),
+            "copy": np.repeat(np.arange(1, n_copies + 1), n_groups),
+        }
+    ).select(pl.concat_str("label", pl.lit(sep), pl.col("copy").cast(pl.Utf8)))
+    rows = np.arange(n_copies)[:, None] * n_groups + codes.reshape(-1)[None, :]
+    dtype = pl.Categorical if isinstance(group.dtype, pl.Enum) else group.dtype
+    return labels.to_series().cast(dtype).gather(rows.reshape(-1)).alias(group.name)
+
+
+def replicate(
+    data: pl.DataFrame,
+    transforms,
+    group_sep: str = "_",
+) -> pl.DataFrame:
+    """
+    Replicate shape data under a set of affine transforms.
+
+    Every copy is computed at once with one broadcasted matrix multiply, and
+    group labels for every copy are assigned in bulk. Use `rotations`,
+    `dihedral`, `lattice`, and `compose` to build the transforms for
+    kaleidoscopes and wallpaper tilings.
+
+    Parameters
+    ----------
+    data : pl.DataFrame
+        Shape data (e.g. from `circle_data`) with `x` and `y` columns. Other
+        columns, such as `color` and `fill`, are repeated for every copy.
+    transforms : array-like
+        One 2x3 or 3x3 affine matrix, or a stack of them (k, 2, 3) or (k, 3, 3).
+        Each maps (x, y, 1) to a new position.
+    group_sep : str, default "_"
+        Separator between the original group label and the copy number.
+
+    Returns
+    -------
+    pl.DataFrame
+        The copies stacked one after another (`len(transforms) * data.height`
+        rows) with the same columns as `data`. String group labels become
+        "<group><group_sep><copy>", with copies numbered from 1; integer
+        groups become Int64 and are offset so every copy has distinct ids.
+        Rows with a null group keep a null group in every copy, and an Enum
+        group column becomes Categorical. Without a `group` column, one is
+        added with the labels "copy<group_sep><copy>".
+
+    Examples
+    --------
+    ```python
+    from artpack import circle_data
+    from artpack.symmetry import dihedral, replicate
+    from plotnine import ggplot, aes, geom_path, coord_equal
+
+    motif = circle_data(x=2, y=0.5, radius=0.5, group_var=True, group_value="dot")
+    kaleidoscope = replicate(motif, dihedral(6))
+    (ggplot(kaleidoscope, aes("x", "y", group="group")) + geom_path() + coord_equal())
+    ```
+    """
+
+    ###############################################################################
+    # Input Checks
+    ###############################################################################
+    _check_type("data", data, pl.DataFrame)
+    missing = [column for column in ("x", "y") if column not in data.columns]
+    if missing:
+        raise ValueError(
+            "`data` must have `x` and `y` columns.\n"
+            f"Missing: {', '.join(f'`{column}`' for column in missing)}"
+        )
+    ops = _as_transforms(transforms)
+    _check_type("group_sep", group_sep, str)
+
+    ###############################################################################
+    # Replication
+    ###############################################################################
+    n_rows, n_copies = data.height, len(ops)
+    xy = data.select("x", "y").to_numpy().astype(np.float64)
+
+    # (k, n, 2): every copy of every point in one broadcasted multiply
+    moved = xy @ ops[:, :2, :2].transpose(0, 2, 1) + ops[:, None, :2, 2]
+
+    columns = {
+        "x": pl.Series("x", moved[..., 0].reshape(-1)).cast(data.schema["x"]),
+        "y": pl.Series("y", moved[..., 1].reshape(-1)).cast(data.schema["y"]),
+    }
+    others = [column for column in data.columns if column not in columns]
+    if "group" in others:
+        columns["group"] = _copy_groups(data["group"], n_copies, group_sep)
+        others.remove("group")
+    if others:
+        rows = np.tile(np.arange(n_rows), n_copies)
+        columns.update(data.select(others)[rows].to_dict())
+
+    order = data.columns
+    if "group" not in data.columns:
+        labels = pl.Series([f"copy{group_sep}{i}" for i in range(1, n_copies + 1)])
+        columns["group"] = labels.gather(np.repeat(np.arange(n_copies), n_rows))
+        order = [*order, "group"]
+    return pl.DataFrame({column: columns[column] for column in order})
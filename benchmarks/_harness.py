@@ -0,0 +1,163 @@
+###############################################################################
+# benchmarks/_harness.py
+###############################################################################
+"""
+Minimal, dependency-free benchmark harness for artpack.
+
+Benchmarks are plain functions registered with `@benchmark`. Each registered
+function is a *setup* function: it receives one parameter value and returns the
+zero-argument callable that gets timed. This keeps setup cost (building inputs)
+out of the measurement.
+"""
+
+import gc
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+###############################################################################
+# Registry
+###############################################################################
+_REGISTRY: list["Benchmark"] = []
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[Any], Callable[[], Any]]
+    params: list[Any] = field(default_factory=lambda: [None])
+    group: str = "misc"
+    self_timed: bool = False
+
+    def cases(self) -> list[tuple[str, Any]]:
+        if self.params == [None]:
+            return [(self.name, None)]
+        return [(f"{self.name}[{param}]", param) for param in self.params]
+
+
+def benchmark(
+    name: str,
+    params: list[Any] | None = None,
+    group: str = "misc",
+    self_timed: bool = False,
+):
+    """
+    Register a benchmark setup function.
+
+    Parameters
+    ----------
+    name : str
+        Benchmark name. Parametrized cases are reported as `name[param]`.
+    params : list, optional
+        Parameter values passed to the setup function, one case per value.
+    group : str, default "misc"
+        Group used to select benchmarks from the command line.
+    self_timed : bool, default False
+        If True, the timed callable measures itself and returns the elapsed
+        seconds (e.g. work done in a subprocess) instead of being wall-timed.
+    """
+
+    def decorator(setup):
+        _REGISTRY.append(
+            Benchmark(
+                name=name,
+                setup=setup,
+                params=list(params) if params is not None else [None],
+                group=group,
+                self_timed=self_timed,
+            )
+        )
+        return setup
+
+    return decorator
+
+
+def registry() -> list[Benchmark]:
+    return list(_REGISTRY)
+
+
+###############################################################################
+# Measurement
+###############################################################################
+def measure(func: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Time `func` and record its peak traced memory.
+
+    The loop count is chosen with `timeit.Timer.autorange` so each repeat takes
+    at least 0.2 seconds. Peak memory is measured separately, over a single
+    call, with `tracemalloc` (this covers Python and NumPy allocations but not
+    memory owned by polars' Rust allocator).
+
+    Returns
+    -------
+    dict
+        `median_s`, `min_s` and `stdev_s` per call, plus `number`, `repeat`
+        and `peak_bytes`.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+
+    gc.collect()
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result_bytes = result.estimated_size() if hasattr(result, "estimated_size") else 0
+
+    return {
+        "median_s": statistics.median(per_call),
+        "min_s": min(per_call),
+        "stdev_s": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+        "peak_bytes": peak,
+        "result_bytes": result_bytes,
+    }
+
+
+def measure_self_timed(func: Callable[[], float], repeat: int = 5) -> dict[str, float]:
+    """
+    Collect `repeat` self-reported timings from `func`.
+
+    Returns
+    -------
+    dict
+        Same keys as `measure`. Memory is not measured in this mode.
+    """
+    per_call = [func() for _ in range(repeat)]
+    return {
+        "median_s": statistics.median(per_call),
+        "min_s": min(per_call),
+        "stdev_s": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "number": 1,
+        "repeat": repeat,
+        "peak_bytes": 0,
+        "result_bytes": 0,
+    }
+
+
+###############################################################################
+# Formatting
+###############################################################################
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def format_bytes(n_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n_bytes) < 1024:
+            return f"{n_bytes:7.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:7.1f} GiB"
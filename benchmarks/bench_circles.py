@@ -0,0 +1,136 @@
+###############################################################################
+# benchmarks/bench_circles.py
+###############################################################################
+import polars as pl
+from _harness import benchmark
+
+import artpack.namespace  # noqa: F401
+from artpack import Canvas, art_pals, circle_batch_data, circle_data
+from artpack.backend import _numba_available, use_backend
+
+
+@benchmark(
+    "circle_data.n_points", params=[100, 1_000, 10_000, 100_000], group="circles"
+)
+def circle_n_points(n_points):
+    return lambda: circle_data(0, 0, 5, n_points=n_points)
+
+
+@benchmark("circle_data.all_columns", group="circles")
+def circle_all_columns(_):
+    return lambda: circle_data(
+        0, 0, 5, color="#000000", fill="pink", group_var=True, group_value="circle_1"
+    )
+
+
+@benchmark("circle_data.scene_concat", params=[10, 100, 1_000], group="circles")
+def circle_scene(n_circles):
+    def build():
+        return pl.concat(
+            [
+                circle_data(
+                    i,
+                    i,
+                    1 + i % 5,
+                    color="#000000",
+                    group_var=True,
+                    group_value=f"c{i}",
+                )
+                for i in range(n_circles)
+            ]
+        )
+
+    return build
+
+
+@benchmark("circle_batch_data", params=[10, 100, 1_000, 10_000], group="circles")
+def circle_batch(n_circles):
+    xs = list(range(n_circles))
+    return lambda: circle_batch_data(xs, xs, 1, color="#000000")
+
+
+@benchmark("circle_batch_data.color_format", params=["hex", "rgba"], group="circles")
+def circle_batch_color_format(color_format):
+    xs = list(range(10_000))
+    fills = ["#FF0000", "#00FF00", "#0000FF", "#FFFFFF"] * 2_500
+    return lambda: circle_batch_data(
+        xs, xs, 1, color="#000000", fill=fills, color_format=color_format
+    )
+
+
+@benchmark("circle_batch_data.categorical", params=[False, True], group="circles")
+def circle_batch_categorical(categorical):
+    xs = list(range(10_000))
+    return lambda: circle_batch_data(
+        xs, xs, 1, color="#000000", categorical=categorical
+    )
+
+
+@benchmark("circle_batch_data.gradient", params=["table", "art_pals"], group="circles")
+def circle_batch_gradient(method):
+    xs = list(range(1_000))
+    if method == "table":
+        return lambda: circle_batch_data(xs, xs, 1, gradient="neon")
+
+    def build():
+        # Baseline: interpolate the palette for each circle and attach it
+        circles = circle_batch_data(xs, xs, 1)
+        colors = [color for _ in xs for color in art_pals("neon", 100)]
+        return circles.with_columns(color=pl.Series(colors))
+
+    return build
+
+
+@benchmark("circle_data.scene_canvas", params=[10, 100, 1_000], group="circles")
+def circle_scene_canvas(n_circles):
+    def build():
+        canvas = Canvas()
+        for i in range(n_circles):
+            circle_data(
+                i,
+                i,
+                1 + i % 5,
+                color="#000000",
+                group_var=True,
+                group_value=f"c{i}",
+                canvas=canvas,
+            )
+        return canvas.to_polars()
+
+    return build
+
+
+@benchmark("namespace.circles", params=[1_000, 10_000, 100_000], group="circles")
+def namespace_circles(n_circles):
+    specs = pl.DataFrame(
+        {"x": range(n_circles), "y": range(n_circles), "radius": [1.0] * n_circles}
+    )
+    return lambda: specs.artpack.circles()
+
+
+@benchmark(
+    "circle_batch_data.backend",
+    params=["numpy", "numba"] if _numba_available() else ["numpy"],
+    group="circles",
+)
+def circle_batch_backend(backend):
+    xs = list(range(10_000))
+
+    def build():
+        with use_backend(backend):
+            return circle_batch_data(xs, xs, 1, group_var=False)
+
+    return build
+
+
+@benchmark(
+    "circle_batch_data.bbox", params=["none", "cull", "cull+clip"], group="circles"
+)
+def circle_batch_bbox(mode):
+    # 100k circles scattered over 100x the visible area: ~1% land in view
+    xs = [(i * 7919) % 1_000 for i in range(100_000)]
+    ys = [(i * 104_729) % 1_000 for i in range(100_000)]
+    bbox = None if mode == "none" else (0, 0, 100, 100)
+    return lambda: circle_batch_data(
+        xs, ys, 1, group_var=False, bbox=bbox, clip=mode == "cull+clip"
+    )
@@ -0,0 +1,52 @@
+###############################################################################
+# benchmarks/bench_flow.py
+###############################################################################
+import numpy as np
+import polars as pl
+from _harness import benchmark
+
+from artpack.flow import flow_paths
+from artpack.noise import perlin_noise
+
+N_STEPS = 50
+
+
+def _starts(n_particles):
+    return np.random.default_rng(0).uniform(0, 10, (2, n_particles))
+
+
+@benchmark("perlin_noise.points", params=[10_000, 1_000_000], group="flow")
+def noise_points(n_points):
+    xs, ys = np.random.default_rng(0).uniform(0, 100, (2, n_points))
+    return lambda: perlin_noise(xs, ys, scale=4, octaves=4)
+
+
+@benchmark("flow_paths.lockstep", params=[1_000, 10_000, 50_000], group="flow")
+def flow_lockstep(n_particles):
+    xs, ys = _starts(n_particles)
+    return lambda: flow_paths(
+        xs, ys, n_steps=N_STEPS, scale=4, octaves=2, bbox=(0, 0, 10, 10)
+    )
+
+
+@benchmark("flow_paths.per_particle", params=[100, 1_000], group="flow")
+def flow_per_particle(n_particles):
+    # Baseline: trace each particle on its own, one noise lookup per step
+    xs, ys = _starts(n_particles)
+
+    def build():
+        paths = []
+        for n, (x, y) in enumerate(zip(xs, ys), start=1):
+            px, py = [x], [y]
+            for _ in range(N_STEPS):
+                angle = 2 * np.pi * perlin_noise(px[-1], py[-1], scale=4, octaves=2)
+                x, y = px[-1] + 0.1 * np.cos(angle), py[-1] + 0.1 * np.sin(angle)
+                if not (0 <= x <= 10 and 0 <= y <= 10):
+                    break
+                px.append(x)
+                py.append(y)
+            if len(px) > 1:
+                paths.append(pl.DataFrame({"x": px, "y": py, "group": f"flow_{n}"}))
+        return pl.concat(paths)
+
+    return build
@@ -0,0 +1,54 @@
+###############################################################################
+# benchmarks/bench_hatching.py
+###############################################################################
+import numpy as np
+import polars as pl
+from _harness import benchmark
+
+from artpack import circle_batch_data
+from artpack.hatching import hatch_fill
+
+
+def _circles(n_circles):
+    rng = np.random.default_rng(0)
+    xs, ys = rng.uniform(0, 10 * np.sqrt(n_circles), (2, n_circles))
+    return circle_batch_data(xs, ys, rng.uniform(0.5, 3, n_circles))
+
+
+@benchmark("hatch_fill.circles", params=[1_000, 10_000, 100_000], group="hatching")
+def hatch_circles(n_circles):
+    circles = _circles(n_circles)
+    return lambda: hatch_fill(circles, spacing=0.2, angle=45)
+
+
+@benchmark("hatch_fill.per_shape", params=[100, 1_000], group="hatching")
+def hatch_per_shape(n_circles):
+    # Baseline: intersect each shape's edges with each hatch line in Python
+    circles = _circles(n_circles)
+    spacing, theta = 0.2, np.deg2rad(45)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+
+    def build():
+        segments = []
+        for (group,), shape in circles.group_by("group", maintain_order=True):
+            x, y = shape["x"].to_numpy(), shape["y"].to_numpy()
+            u, v = x * cos_t + y * sin_t, (y * cos_t - x * sin_t) / spacing
+            u1, v1 = np.roll(u, -1), np.roll(v, -1)
+            for k in range(int(np.ceil(v.min())), int(np.ceil(v.max()))):
+                crosses = (np.minimum(v, v1) <= k) & (k < np.maximum(v, v1))
+                t = (k - v[crosses]) / (v1[crosses] - v[crosses])
+                hits = np.sort(u[crosses] + t * (u1[crosses] - u[crosses]))
+                for n, (a, b) in enumerate(zip(hits[::2], hits[1::2])):
+                    yk = k * spacing
+                    segments.append(
+                        pl.DataFrame(
+                            {
+                                "x": [a * cos_t - yk * sin_t, b * cos_t - yk * sin_t],
+                                "y": [a * sin_t + yk * cos_t, b * sin_t + yk * cos_t],
+                                "group": f"{group}_{k}_{n}",
+                            }
+                        )
+                    )
+        return pl.concat(segments)
+
+    return build
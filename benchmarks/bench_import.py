@@ -0,0 +1,92 @@
+###############################################################################
+# benchmarks/bench_import.py
+###############################################################################
+"""
+Import-time benchmark for artpack.
+
+Runs `import artpack` in fresh interpreters and reports the median wall time.
+Exits with a non-zero status if the median exceeds `--max-ms`. The same
+measurement is registered with the benchmark suite (`benchmarks/run.py`).
+
+Usage
+-----
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 20 --max-ms 50
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from _harness import benchmark
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_IMPORT_SNIPPET = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "print(time.perf_counter() - start)"
+)
+
+
+def time_import(module: str = "artpack", repeat: int = 10) -> list[float]:
+    """
+    Time `import module` in `repeat` fresh interpreters.
+
+    Parameters
+    ----------
+    module : str, default "artpack"
+        The module to import.
+    repeat : int, default 10
+        Number of fresh interpreters to spawn.
+
+    Returns
+    -------
+    list of float
+        Import times in seconds, one per interpreter.
+    """
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SNIPPET.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+@benchmark(
+    "import", params=["artpack", "artpack.circles"], group="import", self_timed=True
+)
+def import_module(module):
+    return lambda: time_import(module, repeat=1)[0]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--module", default="artpack")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    timings = time_import(args.module, args.repeat)
+    median_ms = statistics.median(timings) * 1000
+    print(
+        f"import {args.module}: median {median_ms:.1f} ms "
+        f"(min {min(timings) * 1000:.1f} ms, n={args.repeat})"
+    )
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"FAILED: median import time exceeds {args.max_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
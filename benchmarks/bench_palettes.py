@@ -0,0 +1,21 @@
+###############################################################################
+# benchmarks/bench_palettes.py
+###############################################################################
+from _harness import benchmark
+
+from artpack import art_pals
+
+
+@benchmark("art_pals.sample", params=[1, 5, 10], group="palettes")
+def pals_sample(n):
+    return lambda: art_pals("rainbow", n)
+
+
+@benchmark("art_pals.interpolate", params=[20, 1_000, 100_000], group="palettes")
+def pals_interpolate(n):
+    return lambda: art_pals("rainbow", n)
+
+
+@benchmark("art_pals.reverse_randomize", group="palettes")
+def pals_reverse_randomize(_):
+    return lambda: art_pals("neon", 50, direction="rev", randomize=True)
@@ -0,0 +1,72 @@
+###############################################################################
+# benchmarks/bench_spatial.py
+###############################################################################
+import numpy as np
+import polars as pl
+from _harness import benchmark
+
+from artpack.spatial import ShapeIndex
+
+
+def _bounds(n_shapes):
+    rng = np.random.default_rng(0)
+    side = np.sqrt(n_shapes)
+    x, y = rng.uniform(0, side, (2, n_shapes))
+    radius = rng.uniform(0.05, 0.75, n_shapes)
+    return pl.DataFrame(
+        {
+            "group": pl.int_range(n_shapes, eager=True),
+            "xmin": x - radius,
+            "ymin": y - radius,
+            "xmax": x + radius,
+            "ymax": y + radius,
+        }
+    )
+
+
+def _boxes(n_shapes, n_queries=10_000):
+    corners = np.random.default_rng(1).uniform(0, np.sqrt(n_shapes), (n_queries, 2))
+    return np.c_[corners, corners + 1]
+
+
+@benchmark("spatial.build", params=[10_000, 100_000, 1_000_000], group="spatial")
+def spatial_build(n_shapes):
+    bounds = _bounds(n_shapes)
+    return lambda: ShapeIndex.from_bounds(bounds)
+
+
+@benchmark("spatial.query", params=[10_000, 100_000, 1_000_000], group="spatial")
+def spatial_query(n_shapes):
+    index, boxes = ShapeIndex.from_bounds(_bounds(n_shapes)), _boxes(n_shapes)
+    return lambda: index.query(boxes)
+
+
+@benchmark("spatial.query_brute_force", params=[10_000, 100_000], group="spatial")
+def spatial_query_brute_force(n_shapes):
+    # Baseline: test every shape against each box (first 100 boxes only)
+    bounds, boxes = _bounds(n_shapes), _boxes(n_shapes)[:100]
+
+    def run():
+        return [
+            bounds.filter(
+                (pl.col("xmin") <= xmax)
+                & (pl.col("xmax") >= xmin)
+                & (pl.col("ymin") <= ymax)
+                & (pl.col("ymax") >= ymin)
+            )
+            for xmin, ymin, xmax, ymax in boxes
+        ]
+
+    return run
+
+
+@benchmark("spatial.nearest", params=[10_000, 100_000, 1_000_000], group="spatial")
+def spatial_nearest(n_shapes):
+    index, points = ShapeIndex.from_bounds(_bounds(n_shapes)), _boxes(n_shapes)[:, :2]
+    return lambda: index.nearest(points)
+
+
+@benchmark("spatial.covered", params=[10_000, 100_000, 1_000_000], group="spatial")
+def spatial_covered(n_shapes):
+    index = ShapeIndex.from_bounds(_bounds(n_shapes))
+    return lambda: index.covered("circle")
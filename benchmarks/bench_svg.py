@@ -0,0 +1,16 @@
+###############################################################################
+# benchmarks/bench_svg.py
+###############################################################################
+import io
+
+from _harness import benchmark
+
+from artpack import art_pals, circle_batch_data
+from artpack.svg import write_svg
+
+
+@benchmark("write_svg", params=[1_000, 10_000, 100_000], group="svg")
+def svg_circles(n_circles):
+    xs = list(range(n_circles))
+    circles = circle_batch_data(xs, xs, 1, fill=art_pals("neon", n_circles))
+    return lambda: write_svg(circles, io.StringIO(), precision=2)
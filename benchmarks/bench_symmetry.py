@@ -0,0 +1,36 @@
+###############################################################################
+# benchmarks/bench_symmetry.py
+###############################################################################
+import polars as pl
+from _harness import benchmark
+
+from artpack import circle_batch_data
+from artpack.symmetry import compose, dihedral, lattice, replicate
+
+MOTIF = circle_batch_data([0.2, 0.3, 0.35], [0.05, 0.1, 0.2], 0.04, fill="red")
+
+
+@benchmark("symmetry.replicate", params=[10, 100, 1_000], group="symmetry")
+def symmetry_replicate(n_tiles):
+    ops = compose(lattice((1, 0), (0.5, 0.866), n_tiles, 1), dihedral(6))
+    return lambda: replicate(MOTIF, ops)
+
+
+@benchmark("symmetry.regenerate", params=[10, 100, 1_000], group="symmetry")
+def symmetry_regenerate(n_tiles):
+    # Baseline: transform and relabel the motif once per copy
+    ops = compose(lattice((1, 0), (0.5, 0.866), n_tiles, 1), dihedral(6))
+
+    def build():
+        copies = []
+        for k, op in enumerate(ops):
+            copies.append(
+                MOTIF.with_columns(
+                    x=pl.col("x") * op[0, 0] + pl.col("y") * op[0, 1] + op[0, 2],
+                    y=pl.col("x") * op[1, 0] + pl.col("y") * op[1, 1] + op[1, 2],
+                    group=pl.col("group") + f"_{k + 1}",
+                )
+            )
+        return pl.concat(copies)
+
+    return build
@@ -0,0 +1,50 @@
+###############################################################################
+# benchmarks/bench_validators.py
+###############################################################################
+from _harness import benchmark
+
+from artpack._utils import (
+    _check_min_points,
+    _check_type,
+    _is_positive_number,
+    _is_valid_color,
+)
+
+
+@benchmark("validators.check_type", group="validators")
+def check_type(_):
+    return lambda: _check_type("x", 1.5, (float, int))
+
+
+@benchmark(
+    "validators.is_valid_color", params=["#1a1a1a", "rebeccapurple"], group="validators"
+)
+def is_valid_color(color):
+    return lambda: _is_valid_color("color", color)
+
+
+@benchmark("validators.is_positive_number", group="validators")
+def is_positive_number(_):
+    return lambda: _is_positive_number("radius", 5)
+
+
+@benchmark("validators.check_min_points", group="validators")
+def check_min_points(_):
+    return lambda: _check_min_points(100, 100, "circle")
+
+
+@benchmark("validators.circle_data_inputs", group="validators")
+def circle_data_inputs(_):
+    # Mirrors the full set of checks `circle_data` runs before generating data
+    def validate():
+        _check_type("x", 0, (float, int))
+        _check_type("y", 0, (float, int))
+        _check_type("radius", 5, (float, int))
+        _check_type("n_points", 100, int)
+        _is_positive_number("radius", 5)
+        _check_min_points(100, 100, "circle")
+        _is_valid_color("color", "#000000")
+        _is_valid_color("fill", "pink")
+        _check_type("group_value", "circle_", str)
+
+    return validate
@@ -0,0 +1,162 @@
+###############################################################################
+# benchmarks/run.py
+###############################################################################
+"""
+Run the artpack benchmark suite.
+
+Results are saved as JSON under `benchmarks/results/<label>.json` (the label
+defaults to the installed artpack version) so runs from different versions can
+be compared with `--compare`.
+
+Usage
+-----
+    python benchmarks/run.py                       # run everything and save
+    python benchmarks/run.py --group circles       # one group only
+    python benchmarks/run.py -k interpolate        # filter by name
+    python benchmarks/run.py --compare benchmarks/results/0.2.0.post1.json
+    python benchmarks/run.py --list
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_DIR = BENCH_DIR / "results"
+
+# Make `import artpack` resolve to this checkout and `import _harness` work
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from _harness import (
+    format_bytes,
+    format_seconds,
+    measure,
+    measure_self_timed,
+    registry,
+)
+
+BENCH_MODULES = [
+    "bench_circles",
+    "bench_flow",
+    "bench_hatching",
+    "bench_import",
+    "bench_palettes",
+    "bench_spatial",
+    "bench_svg",
+    "bench_symmetry",
+    "bench_validators",
+]
+
+
+def _default_label() -> str:
+    try:
+        return version("artpack")
+    except PackageNotFoundError:
+        return "dev"
+
+
+def run(groups=None, keyword=None, repeat=5) -> dict[str, dict]:
+    for module in BENCH_MODULES:
+        importlib.import_module(module)
+
+    results = {}
+    for bench in registry():
+        if groups and bench.group not in groups:
+            continue
+        for case_name, param in bench.cases():
+            if keyword and keyword not in case_name:
+                continue
+            func = bench.setup(param)
+            if bench.self_timed:
+                stats = measure_self_timed(func, repeat=repeat)
+            else:
+                stats = measure(func, repeat=repeat)
+            stats["group"] = bench.group
+            results[case_name] = stats
+            print(
+                f"{case_name:<45} {format_seconds(stats['median_s'])}"
+                f"  peak {format_bytes(stats['peak_bytes'])}"
+                f"  result {format_bytes(stats['result_bytes'])}"
+            )
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Print a comparison table and return the names of regressed benchmarks.
+
+    A benchmark regresses when its median time grows by more than `threshold`
+    (a fraction, e.g. 0.1 for 10%).
+    """
+    regressions = []
+    print(f"\n{'benchmark':<45} {'baseline':>11} {'current':>11} {'ratio':>7}")
+    for name, stats in current.items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["median_s"]
+        ratio = stats["median_s"] / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(
+            f"{name:<45} {format_seconds(before)} {format_seconds(stats['median_s'])}"
+            f" {ratio:7.2f}{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the artpack benchmark suite.")
+    parser.add_argument("--group", action="append", help="Only run this group")
+    parser.add_argument("-k", dest="keyword", help="Only run names containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--label", default=None, help="Name for the saved results")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--list", action="store_true", help="List benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for module in BENCH_MODULES:
+            importlib.import_module(module)
+        for bench in registry():
+            for case_name, _ in bench.cases():
+                print(f"{bench.group:<12} {case_name}")
+        return 0
+
+    results = run(args.group, args.keyword, args.repeat)
+
+    label = args.label or _default_label()
+    payload = {
+        "label": label,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        out_path = RESULTS_DIR / f"{label}.json"
+        out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"\nSaved results to {out_path}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,28 +1,44 @@
+import glob
+import hashlib
+import json
 import os
 import re
-import glob
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 reference_dir = "docs/reference"
-
-# Find all HTML files in the reference directory, excluding index.html and vignettes
-html_files = [
-    f
-    for f in glob.glob(os.path.join(reference_dir, "*.html"))
-    if not f.endswith("index.html") and "vignette" not in f.lower()
-]
+# Kept in Quarto's project cache, outside the published `docs` tree
+manifest_path = os.path.join(".quarto", "post-render-manifest.json")
+legacy_manifest_path = os.path.join(reference_dir, ".post-render-manifest.json")
+
+# Precompiled patterns
+TABLE_RE = re.compile(
+    r'<table[^>]*class="[^"]*caption-top[^"]*table[^"]*"[^>]*>.*?</table>', re.DOTALL
+)
+TBODY_RE = re.compile(r"<tbody>(.*?)</tbody>", re.DOTALL)
+ROW_RE = re.compile(r"<tr[^>]*>(.*?)</tr>", re.DOTALL)
+CELL_RE = re.compile(r"<td[^>]*>(.*?)</td>", re.DOTALL)
+DD_RE = re.compile(r"<dd>(.*?)</dd>", re.DOTALL)
+LIST_LINE_RE = re.compile(r"^\s*-\s+", re.MULTILINE)
+LIST_ITEM_RE = re.compile(r"^\s*-\s*(.+)", re.MULTILINE)
+LIST_LINE_STRIP_RE = re.compile(r"^\s*-\s*.+\n?", re.MULTILINE)
+COLON_DASH_RE = re.compile(r":\s*-\s*")
+DASH_SPLIT_RE = re.compile(r"\s*-\s*")
+INLINE_ITEM_RE = re.compile(r"-\s*(.*?)(?=(?:\s*-\s|$))", re.DOTALL)
 
 
 def convert_table_to_dl(match: re.Match) -> str:
     table_html = match.group(0)
-    tbody_match = re.search(r"<tbody>(.*?)</tbody>", table_html, re.DOTALL)
+    tbody_match = TBODY_RE.search(table_html)
     if not tbody_match:
         return table_html
 
     tbody = tbody_match.group(1)
-    rows = re.findall(r"<tr[^>]*>(.*?)</tr>", tbody, flags=re.DOTALL)
+    rows = ROW_RE.findall(tbody)
     items = []
     for row in rows:
-        cols = re.findall(r"<td[^>]*>(.*?)</td>", row, flags=re.DOTALL)
+        cols = CELL_RE.findall(row)
         cols = [c.strip() for c in cols]
         if len(cols) == 4:
             name, type_, desc, default = cols
@@ -51,9 +67,6 @@ def convert_table_to_dl(match: re.Match) -> str:
     )
 
 
-table_pattern = r'<table[^>]*class="[^"]*caption-top[^"]*table[^"]*"[^>]*>.*?</table>'
-
-
 def fix_dd_bullets_in_content(content: str) -> str:
     """
     Convert lists inside <dd>...</dd> into proper <ul><li> items.
@@ -66,11 +79,11 @@ def fix_dd_bullets_in_content(content: str) -> str:
         inner = match.group(1)
 
         # 1) Multiline lists: lines starting with '-'
-        if re.search(r"^\s*-\s+", inner, flags=re.MULTILINE):
+        if LIST_LINE_RE.search(inner):
             # extract list items
-            items = re.findall(r"^\s*-\s*(.+)", inner, flags=re.MULTILINE)
+            items = LIST_ITEM_RE.findall(inner)
             # remove those list lines from the inner content
-            new_inner = re.sub(r"^\s*-\s*.+\n?", "", inner, flags=re.MULTILINE).rstrip()
+            new_inner = LIST_LINE_STRIP_RE.sub("", inner).rstrip()
             ul = (
                 "<ul>"
                 + "".join(f"<li>{it.strip()}</li>" for it in items if it.strip())
@@ -85,22 +98,20 @@ def fix_dd_bullets_in_content(content: str) -> str:
         # 2) Collapsed inline list (no leading line breaks), look for "colon then dash" or "- item" patterns
         if " - " in inner:
             # try to find a prefix ending with a colon
-            m = re.search(r":\s*-\s*", inner)
+            m = COLON_DASH_RE.search(inner)
             if m:
                 prefix = inner[: m.start() + 1]  # include colon
                 items_part = inner[m.end() :]
             else:
                 # fallback: split before the first " - "
-                parts = re.split(r"\s*-\s*", inner, maxsplit=1)
+                parts = DASH_SPLIT_RE.split(inner, maxsplit=1)
                 if len(parts) == 1:
                     return f"<dd>{inner}</dd>"
                 prefix = parts[0]
                 items_part = parts[1]
 
             # capture each "- item" (non-greedy) so that "x: x-coords" stays together
-            raw_items = re.findall(
-                r"-\s*(.*?)(?=(?:\s*-\s|$))", "-" + items_part, flags=re.DOTALL
-            )
+            raw_items = INLINE_ITEM_RE.findall("-" + items_part)
             items = [it.strip() for it in raw_items if it.strip()]
             if not items:
                 return f"<dd>{inner}</dd>"
@@ -112,18 +123,29 @@ def fix_dd_bullets_in_content(content: str) -> str:
         # nothing to change
         return f"<dd>{inner}</dd>"
 
-    return re.sub(r"<dd>(.*?)</dd>", repl, content, flags=re.DOTALL)
+    return DD_RE.sub(repl, content)
 
 
-# Process each HTML file
-for html_file in html_files:
-    if not os.path.exists(html_file):
-        continue
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def process_file(html_file: str, known_hash: str | None) -> tuple[str, str, str, float]:
+    """
+    Post-process one HTML file in place.
+
+    Skips the file if its content hash matches `known_hash`, i.e. it is still
+    the output of a previous run. Returns (file, status, new hash, seconds).
+    """
+    start = time.perf_counter()
     with open(html_file, "r", encoding="utf-8") as fh:
         content = fh.read()
 
+    if known_hash is not None and content_hash(content) == known_hash:
+        return html_file, "unchanged", known_hash, time.perf_counter() - start
+
     # 1) convert caption-top tables into dl blocks
-    content = re.sub(table_pattern, convert_table_to_dl, content, flags=re.DOTALL)
+    content = TABLE_RE.sub(convert_table_to_dl, content)
 
     # 2) fix any lists that ended up inside <dd> blocks
     content = fix_dd_bullets_in_content(content)
@@ -131,9 +153,73 @@ for html_file in html_files:
     with open(html_file, "w", encoding="utf-8") as fh:
         fh.write(content)
 
-    print(f"Processed: {html_file}")
+    return html_file, "processed", content_hash(content), time.perf_counter() - start
+
+
+def load_manifest() -> dict[str, str]:
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, str]) -> None:
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+
+
+def main() -> int:
+    # Find all HTML files in the reference directory, excluding index.html and vignettes
+    html_files = sorted(
+        f
+        for f in glob.glob(os.path.join(reference_dir, "*.html"))
+        if not f.endswith("index.html") and "vignette" not in f.lower()
+    )
+
+    if not html_files:
+        print(f"No HTML files found in {reference_dir}")
+        return 0
+
+    manifest = load_manifest()
+    start = time.perf_counter()
+
+    # Worker processes only pay off once there are several files to share
+    max_workers = int(os.environ.get("POST_RENDER_WORKERS", os.cpu_count() or 1))
+    if max_workers > 1 and len(html_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(html_files))) as pool:
+            results = list(
+                pool.map(
+                    process_file,
+                    html_files,
+                    [manifest.get(os.path.basename(f)) for f in html_files],
+                )
+            )
+    else:
+        results = [
+            process_file(f, manifest.get(os.path.basename(f))) for f in html_files
+        ]
+
+    for html_file, status, new_hash, seconds in results:
+        manifest[os.path.basename(html_file)] = new_hash
+        print(f"{status.capitalize():<10} {html_file} ({seconds * 1000:.1f} ms)")
+
+    # Forget files that no longer exist
+    current = {os.path.basename(f) for f in html_files}
+    save_manifest({name: h for name, h in manifest.items() if name in current})
+    # Older versions wrote the manifest into the published site
+    if os.path.exists(legacy_manifest_path):
+        os.remove(legacy_manifest_path)
+
+    n_processed = sum(status == "processed" for _, status, _, _ in results)
+    print(
+        f"Post-render complete: {n_processed} processed, "
+        f"{len(results) - n_processed} unchanged in {time.perf_counter() - start:.2f} s "
+        "(tables converted and <dd> lists fixed)."
+    )
+    return 0
+
 
-if html_files:
-    print("Post-render complete: tables converted and <dd> lists fixed.")
-else:
-    print(f"No HTML files found in {reference_dir}")
+if __name__ == "__main__":
+    sys.exit(main())
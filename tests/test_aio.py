@@ -0,0 +1,130 @@
+###############################################################################
+# aio.py Test Suite
+###############################################################################
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from artpack import art_pals
+from artpack.aio import _default_executor, circle_stream, offload
+from artpack.circles import circle_batch_data
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+# ------------------------------------------------------------------------------
+# offload
+def test_offload_returns_function_result():
+    colors = asyncio.run(offload(art_pals, "rainbow", n=30))
+    assert colors == art_pals("rainbow", 30)
+
+
+def test_default_executor_is_shared():
+    assert _default_executor() is _default_executor()
+
+
+# ------------------------------------------------------------------------------
+# circle_stream
+def test_circle_stream_chunks_match_batch():
+    xs = list(range(25))
+    fills = art_pals("neon", 25)
+
+    chunks = asyncio.run(
+        _collect(circle_stream(xs, 0, 0.4, fill=fills, chunk_size=10, max_pending=3))
+    )
+
+    assert [chunk["group"].n_unique() for chunk in chunks] == [10, 10, 5]
+    assert_frame_equal(pl.concat(chunks), circle_batch_data(xs, 0, 0.4, fill=fills))
+
+
+def test_circle_stream_categorical_chunks_concatenate():
+    stream = circle_stream(range(5), 0, 1, fill="red", chunk_size=2, categorical=True)
+    chunks = asyncio.run(_collect(stream))
+    scene = pl.concat(chunks)
+    assert scene.schema["group"] == pl.Categorical
+    assert_frame_equal(
+        scene, circle_batch_data(range(5), 0, 1, fill="red", categorical=True)
+    )
+
+
+def test_circle_stream_uses_supplied_executor():
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        chunks = asyncio.run(
+            _collect(circle_stream([0, 1, 2], 0, 1, chunk_size=2, executor=pool))
+        )
+    assert sum(chunk.height for chunk in chunks) == 3 * 100
+
+
+def test_circle_stream_runs_chunks_on_several_workers():
+    xs = list(range(8_000))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        stream = circle_stream(xs, 0, 1, chunk_size=500, max_pending=4, executor=pool)
+        chunks = asyncio.run(_collect(stream))
+    assert len(chunks) == 16
+    assert_frame_equal(pl.concat(chunks), circle_batch_data(xs, 0, 1))
+
+
+def test_circle_stream_runs_concurrently_with_other_tasks():
+    async def main():
+        results = await asyncio.gather(
+            _collect(circle_stream(range(50), 0, 1, chunk_size=5)),
+            _collect(circle_stream(range(30), 0, 1, chunk_size=5, group_value="b_")),
+        )
+        return results
+
+    first, second = asyncio.run(main())
+    assert len(first) == 10
+    assert len(second) == 6
+    assert second[-1]["group"][-1] == "b_30"
+
+
+def test_circle_stream_stops_early():
+    async def first_chunk():
+        stream = circle_stream(range(100), 0, 1, chunk_size=10)
+        async for chunk in stream:
+            await stream.aclose()
+            return chunk
+
+    chunk = asyncio.run(first_chunk())
+    assert chunk["group"].n_unique() == 10
+
+
+def test_circle_stream_culls_each_chunk():
+    xs = list(range(25))
+    bbox = (4.5, -1, 12.5, 1)
+    chunks = asyncio.run(_collect(circle_stream(xs, 0, 0.4, chunk_size=10, bbox=bbox)))
+    assert [chunk["group"].n_unique() for chunk in chunks] == [5, 3, 0]
+    assert_frame_equal(pl.concat(chunks), circle_batch_data(xs, 0, 0.4, bbox=bbox))
+
+
+def test_circle_stream_derives_chunk_size_from_max_memory():
+    xs = list(range(100))
+    stream = circle_stream(xs, 0, 1, chunk_size=1, max_memory="200KB")
+    chunks = asyncio.run(_collect(stream))
+    assert 1 < len(chunks) < 100
+    assert_frame_equal(pl.concat(chunks), circle_batch_data(xs, 0, 1))
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc, error_msg",
+    [
+        ({"chunk_size": 0}, ValueError, "`chunk_size` must be a positive integer"),
+        ({"max_pending": 1.5}, TypeError, "`max_pending` should be of type `int`"),
+        ({"radius": -1}, ValueError, "`radius` values must all be positive"),
+        (
+            {"max_memory": 100},
+            ValueError,
+            "`max_memory` is too small to generate even one circle",
+        ),
+    ],
+)
+def test_circle_stream_validates_before_first_chunk(kwargs, exc, error_msg):
+    arguments = {"x": [0, 1], "y": [0, 1], "radius": 1, **kwargs}
+    with pytest.raises(exc, match=re.escape(error_msg)):
+        asyncio.run(_collect(circle_stream(**arguments)))
@@ -0,0 +1,165 @@
+###############################################################################
+# backend.py Test Suite
+###############################################################################
+import asyncio
+import os
+import re
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+from polars.testing import assert_frame_equal
+
+import artpack
+from artpack import backend
+from artpack.aio import offload
+from artpack.backend import _kernel, get_backend, set_backend, use_backend
+from artpack.circles import _circle_vertices, circle_batch_data
+
+needs_numba = pytest.mark.skipif(
+    not backend._numba_available(), reason="numba is not installed"
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    previous = backend._SETTINGS["backend"]
+    yield
+    backend._SETTINGS["backend"] = previous
+
+
+# Settings
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize("invalid", ["cuda", None, 3])
+def test_set_backend_rejects_unknown_backends(invalid):
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            f"`backend` must be one of: auto, numba, numpy.\nYou've supplied: '{invalid}'"
+        ),
+    ):
+        set_backend(invalid)
+
+
+def test_set_backend_numba_requires_numba(monkeypatch):
+    monkeypatch.setattr(backend, "_numba_available", lambda: False)
+    with pytest.raises(ImportError, match="The 'numba' backend requires numba"):
+        set_backend("numba")
+
+
+def test_auto_resolves_to_numpy_without_numba(monkeypatch):
+    monkeypatch.setattr(backend, "_numba_available", lambda: False)
+    set_backend("AUTO")
+    assert get_backend() == "numpy"
+
+
+def test_invalid_environment_backend_warns_and_falls_back():
+    code = "import artpack; print(artpack.get_backend())"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "ARTPACK_BACKEND": "cuda"},
+    )
+    assert result.stdout.strip() == "numpy"
+    assert "Ignoring `ARTPACK_BACKEND`" in result.stderr
+    assert "You've supplied: 'cuda'" in result.stderr
+
+
+def test_use_backend_restores_previous_setting():
+    set_backend("auto")
+    with use_backend("numpy"):
+        assert get_backend() == "numpy"
+    assert backend._SETTINGS["backend"] == "auto"
+
+
+def test_use_backend_is_local_to_the_current_thread():
+    set_backend("auto")
+    seen = {}
+
+    def other_thread():
+        seen["backend"] = backend._OVERRIDE.get()
+
+    with use_backend("numpy"):
+        worker = threading.Thread(target=other_thread)
+        worker.start()
+        worker.join()
+    assert seen["backend"] is None
+
+
+def test_use_backend_carries_over_to_offloaded_work():
+    async def run():
+        with use_backend("numpy"):
+            inside = await offload(backend._OVERRIDE.get)
+        outside = await offload(backend._OVERRIDE.get)
+        return inside, outside
+
+    assert asyncio.run(run()) == ("numpy", None)
+
+
+def test_backend_functions_are_exported():
+    assert artpack.set_backend is set_backend
+    assert artpack.get_backend is get_backend
+
+
+# Kernels
+# ------------------------------------------------------------------------------
+def test_kernel_dispatches_to_numpy_implementation():
+    def add_numpy(a, out):
+        out[:] = a + 1
+
+    @_kernel(numpy=add_numpy)
+    def add_one(a, out):
+        """Adds one."""
+        for i in range(len(a)):
+            out[i] = a[i] + 1
+
+    out = np.zeros(3)
+    with use_backend("numpy"):
+        add_one(np.arange(3.0), out)
+    assert out.tolist() == [1.0, 2.0, 3.0]
+    assert add_one.__name__ == "add_one"
+    assert add_one.__doc__ == "Adds one."
+
+
+@needs_numba
+def test_circle_vertices_identical_across_backends():
+    rng = np.random.default_rng(7)
+    x, y = rng.uniform(-100, 100, (2, 50))
+    radius = rng.uniform(0.1, 20, 50)
+
+    with use_backend("numpy"):
+        expected = _circle_vertices(x, y, radius, 150)
+    with use_backend("numba"):
+        result = _circle_vertices(x, y, radius, 150)
+
+    np.testing.assert_array_equal(result[0], expected[0])
+    np.testing.assert_array_equal(result[1], expected[1])
+
+
+@needs_numba
+def test_circle_batch_data_identical_across_backends():
+    kwargs = {"x": [0, 1.5, 3], "y": [2, -1, 0.25], "radius": [1, 2, 3], "fill": "red"}
+    with use_backend("numpy"):
+        expected = circle_batch_data(**kwargs)
+    with use_backend("numba"):
+        result = circle_batch_data(**kwargs)
+    assert_frame_equal(result, expected)
+
+
+def test_circle_vertices_writes_into_outputs():
+    out_x, out_y = np.empty(200, dtype=np.float32), np.empty(200, dtype=np.float32)
+    with use_backend("numpy"):
+        result = _circle_vertices(
+            np.array([0.0, 5.0]),
+            np.array([0.0, 5.0]),
+            np.array([1.0, 2.0]),
+            100,
+            out_x,
+            out_y,
+        )
+    assert result[0] is out_x
+    assert out_x[100] == 7.0
@@ -0,0 +1,271 @@
+###############################################################################
+# cache.py Test Suite
+###############################################################################
+import os
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import artpack.cache
+from artpack import circle_batch_data, profile
+from artpack.cache import (
+    _cache_key,
+    _default_cache_dir,
+    _normalize,
+    cache_scene,
+    clear_scene_cache,
+)
+
+
+def _make_counted_scene(cache_dir, **options):
+    calls = []
+
+    @cache_scene(cache_dir=cache_dir, **options)
+    def scene(n, seed=1, radius=1.0):
+        calls.append((n, seed))
+        rng = np.random.default_rng(seed)
+        return circle_batch_data(rng.uniform(0, 10, n), rng.uniform(0, 10, n), radius)
+
+    return scene, calls
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+def test_cache_scene_requires_callable():
+    with pytest.raises(TypeError, match=re.escape("`func` should be callable.")):
+        cache_scene(5)
+
+
+def test_cache_scene_max_bytes_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="`max_bytes` must be a positive integer"):
+        cache_scene(lambda: None, cache_dir=tmp_path, max_bytes=-1)
+
+
+def test_cache_scene_rejects_unhashable_arguments(tmp_path):
+    scene, _ = _make_counted_scene(tmp_path)
+    with pytest.raises(
+        TypeError, match="`cache_scene` can't hash arguments of type `object`"
+    ):
+        scene(object())
+
+
+def test_cache_scene_requires_dataframe_output(tmp_path):
+    @cache_scene(cache_dir=tmp_path)
+    def not_a_scene(n):
+        return [n]
+
+    with pytest.raises(
+        TypeError,
+        match=re.escape(
+            "`not_a_scene` must return a polars DataFrame to be cached.\nIt returned a `list` object"
+        ),
+    ):
+        not_a_scene(1)
+
+
+# Hits and misses
+# ------------------------------------------------------------------------------
+def test_cache_hit_skips_generation(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+
+    first = scene(10, seed=3)
+    second = scene(10, seed=3)
+
+    assert calls == [(10, 3)]
+    assert_frame_equal(first, second)
+
+
+def test_equivalent_calls_share_a_key(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+    scene(10)
+    scene(10, 1)
+    scene(n=10, seed=1, radius=1.0)
+    assert len(calls) == 1
+
+
+def test_different_arguments_miss(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+    scene(10, seed=1)
+    scene(10, seed=2)
+    scene(10, seed=2, radius=1.5)
+    assert len(calls) == 3
+    assert len(list(tmp_path.glob("*.arrow"))) == 3
+
+
+def test_cache_hits_are_reported_to_profile(tmp_path):
+    scene, _ = _make_counted_scene(tmp_path)
+    with profile() as prof:
+        scene(5)
+        scene(5)
+        scene(5)
+    assert prof.stats()["caches"]["scene_cache"] == {
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+    }
+
+
+def test_corrupt_entry_is_regenerated(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+    scene(5)
+    for path in tmp_path.glob("*.arrow"):
+        path.write_bytes(b"not arrow")
+    scene(5)
+    assert len(calls) == 2
+
+
+# Eviction
+# ------------------------------------------------------------------------------
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+    scene(50, seed=1)
+    entry_size = next(tmp_path.glob("*.arrow")).stat().st_size
+
+    limited, limited_calls = _make_counted_scene(
+        tmp_path, max_bytes=int(entry_size * 2.5)
+    )
+    for seed, mtime in ((1, 100), (2, 200)):
+        limited(50, seed=seed)
+    for path, mtime in zip(
+        sorted(tmp_path.glob("*.arrow"), key=os.path.getmtime), (100, 200)
+    ):
+        os.utime(path, (mtime, mtime))
+
+    limited(50, seed=1)  # hit: seed 1 becomes most recently used
+    limited(50, seed=3)  # miss: over budget, seed 2 is evicted
+
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+    limited(50, seed=1)
+    assert calls == [(50, 1)]
+    assert limited_calls == [(50, 2), (50, 3)]
+
+
+def test_entry_evicted_during_read_is_still_returned(tmp_path, monkeypatch):
+    scene, calls = _make_counted_scene(tmp_path)
+    first = scene(5)
+
+    def evicted(path, *args):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(artpack.cache.os, "utime", evicted)
+    assert_frame_equal(scene(5), first)
+    assert len(calls) == 1
+
+
+def test_eviction_removes_stale_temporary_files(tmp_path):
+    scene, _ = _make_counted_scene(tmp_path)
+    stale, fresh = tmp_path / "tmpstale.tmp", tmp_path / "tmpfresh.tmp"
+    stale.write_bytes(b"partial")
+    fresh.write_bytes(b"in progress")
+    old = time.time() - 2 * 60 * 60
+    os.utime(stale, (old, old))
+
+    scene(5)
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_clear_scene_cache(tmp_path):
+    scene, calls = _make_counted_scene(tmp_path)
+    scene(5, seed=1)
+    scene(5, seed=2)
+    assert clear_scene_cache(tmp_path) == 2
+    scene(5, seed=1)
+    assert len(calls) == 3
+
+
+# Internals
+# ------------------------------------------------------------------------------
+def test_default_cache_dir_honors_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("ARTPACK_CACHE_DIR", str(tmp_path))
+    assert _default_cache_dir() == tmp_path
+    assert _make_counted_scene(None)[0].cache_dir == tmp_path
+
+    monkeypatch.delenv("ARTPACK_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert _default_cache_dir() == tmp_path / "xdg" / "artpack"
+
+
+def test_clear_scene_cache_uses_default_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("ARTPACK_CACHE_DIR", str(tmp_path))
+    assert clear_scene_cache() == 0
+
+
+def test_normalize_distinguishes_types_and_values():
+    assert _normalize([1, 2]) != _normalize((1, 2))
+    assert _normalize(1) != _normalize(1.0)
+    assert _normalize({"b": 1, "a": 2}) == _normalize({"a": 2, "b": 1})
+    assert _normalize(range(3)) == {"range": [0, 3, 1]}
+    assert _normalize(np.arange(3)) != _normalize(np.arange(3.0))
+    assert _normalize(pl.Series([1, 2])) == _normalize(pl.Series([1, 2]))
+    assert _normalize(pl.DataFrame({"a": [1]})) != _normalize(pl.DataFrame({"a": [2]}))
+
+
+def test_cache_key_changes_with_function_code():
+    def scene_a(n):
+        return n + 1
+
+    def scene_b(n):
+        return n + 2
+
+    scene_b.__qualname__ = scene_a.__qualname__
+    assert _cache_key(scene_a, (1,), {}) != _cache_key(scene_b, (1,), {})
+
+
+def test_cache_key_is_stable_across_processes():
+    # Nested code objects (comprehensions, lambdas, inner functions) and set
+    # constants must not leak memory addresses or hash order into the key
+    script = """
+from artpack.cache import _cache_key
+
+def scene(n, tags=("a", "b")):
+    def shift(v):
+        return v + 1
+    squares = [shift(i) ** 2 for i in range(n)]
+    keep = sorted(squares, key=lambda v: -v)
+    return [v for v in keep if str(v) in {"1", "4", "9"}]
+
+print(_cache_key(scene, (3,), {}))
+"""
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(keys) == 1
+
+
+def test_cache_key_changes_with_artpack_version(monkeypatch):
+    def scene(n):
+        return n
+
+    key = _cache_key(scene, (1,), {})
+    monkeypatch.setattr(artpack.cache, "__version__", "999.0")
+    assert _cache_key(scene, (1,), {}) != key
+
+
+def test_cache_key_without_code_object():
+    assert len(_cache_key(pl.DataFrame, (), {})) == 64
+
+
+def test_failed_write_leaves_no_partial_files(tmp_path, monkeypatch):
+    scene, _ = _make_counted_scene(tmp_path)
+
+    def broken_write(self, file, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pl.DataFrame, "write_ipc", broken_write)
+    with pytest.raises(OSError, match="disk full"):
+        scene(5)
+    assert list(tmp_path.iterdir()) == []
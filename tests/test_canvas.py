@@ -0,0 +1,173 @@
+###############################################################################
+# canvas.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from artpack import Canvas, circle_batch_data, circle_data
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+def test_canvas_capacity_must_be_int():
+    with pytest.raises(
+        TypeError, match=re.escape("`capacity` should be of type `int`")
+    ):
+        Canvas(capacity=10.5)
+
+
+def test_add_path_lengths_must_match():
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "`x` and `y` must have the same length.\nYou've supplied lengths 3 and 2"
+        ),
+    ):
+        Canvas().add_path([0, 1, 2], [0, 1])
+
+
+def test_add_path_validates_styles():
+    with pytest.raises(ValueError, match="`color` must be a valid hex color"):
+        Canvas().add_path([0, 1], [0, 1], color="nope")
+    with pytest.raises(ValueError, match="`fill` must be a valid hex color"):
+        Canvas().add_path([0, 1], [0, 1], fill="nope")
+    with pytest.raises(TypeError, match="`group` should be of type `str`"):
+        Canvas().add_path([0, 1], [0, 1], group=1)
+
+
+def test_generators_reject_non_canvas():
+    with pytest.raises(TypeError, match="`canvas` should be of type `Canvas`"):
+        circle_data(x=0, y=0, radius=1, canvas=pl.DataFrame())
+    with pytest.raises(TypeError, match="`canvas` should be of type `Canvas`"):
+        circle_batch_data(x=[0], y=[0], radius=1, canvas=[])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_canvas_matches_concatenated_frames():
+    canvas = Canvas(capacity=8)
+    circle_data(x=0, y=0, radius=1, color="red", canvas=canvas)
+    circle_data(
+        x=1,
+        y=2,
+        radius=3,
+        fill="#ffffff",
+        group_var=True,
+        group_value="a",
+        canvas=canvas,
+    )
+    circle_batch_data(
+        x=[4, 5], y=[6, 7], radius=[1, 2], color=["red", "blue"], canvas=canvas
+    )
+    canvas.add_path([0, 1, 1], [0, 0, 1], group="triangle", fill="pink")
+
+    expected = pl.concat(
+        [
+            circle_data(x=0, y=0, radius=1, color="red"),
+            circle_data(
+                x=1, y=2, radius=3, fill="#ffffff", group_var=True, group_value="a"
+            ),
+            circle_batch_data(x=[4, 5], y=[6, 7], radius=[1, 2], color=["red", "blue"]),
+            pl.DataFrame(
+                {
+                    "x": [0.0, 1.0, 1.0],
+                    "y": [0.0, 0.0, 1.0],
+                    "fill": "pink",
+                    "group": "triangle",
+                },
+                schema={
+                    "x": pl.Float32,
+                    "y": pl.Float32,
+                    "fill": pl.Utf8,
+                    "group": pl.Utf8,
+                },
+            ),
+        ],
+        how="diagonal",
+    ).select("x", "y", "color", "fill", "group")
+
+    assert_frame_equal(canvas.to_polars(), expected)
+    assert len(canvas) == expected.height
+
+
+def test_canvas_grows_geometrically():
+    canvas = Canvas(capacity=100)
+    circle_data(x=0, y=0, radius=1, canvas=canvas)
+    assert canvas.capacity == 100
+    circle_data(x=0, y=0, radius=1, n_points=150, canvas=canvas)
+    assert canvas.capacity == 400
+
+
+def test_canvas_returned_from_generators():
+    canvas = Canvas()
+    assert circle_data(x=0, y=0, radius=1, canvas=canvas) is canvas
+    assert circle_batch_data(x=[0], y=[0], radius=1, canvas=canvas) is canvas
+    assert canvas.add_path([0], [0]) is canvas
+
+
+def test_to_polars_shares_vertex_memory():
+    canvas = circle_data(x=0, y=0, radius=1, canvas=Canvas())
+    df = canvas.to_polars()
+    assert df.columns == ["x", "y"]
+    assert np.shares_memory(df["x"].to_numpy(), canvas._x)
+
+
+def test_clear_keeps_exported_frames_intact():
+    canvas = circle_data(x=0, y=0, radius=1, canvas=Canvas())
+    df = canvas.to_polars()
+    expected = df.clone()
+
+    canvas.clear()
+    circle_data(x=10, y=10, radius=5, canvas=canvas)
+
+    assert_frame_equal(df, expected)
+    assert len(canvas) == 100
+
+
+def test_to_arrow_uses_dictionary_columns():
+    canvas = Canvas()
+    circle_batch_data(x=[0, 1], y=0, radius=1, fill="red", canvas=canvas)
+    canvas.add_path([0, 1], [0, 1])
+    table = canvas.to_arrow()
+
+    assert table.column_names == ["x", "y", "fill", "group"]
+    assert table.schema.field("group").type.value_type == "string"
+    assert table.column("group").null_count == 2
+    assert pl.from_arrow(table)["fill"].cast(
+        pl.Utf8
+    ).drop_nulls().unique().to_list() == ["red"]
+
+
+def test_to_polars_packs_rgba_colors():
+    canvas = Canvas()
+    circle_batch_data(x=[0, 1], y=0, radius=1, color="red", canvas=canvas)
+    canvas.add_path([0, 1], [0, 1], fill="blue")
+    df = canvas.to_polars(color_format="rgba")
+
+    assert df.schema["color"] == pl.UInt32
+    assert df.schema["group"] == pl.Utf8
+    assert df["color"].unique(maintain_order=True).to_list() == [0xFF0000FF, None]
+    assert df["fill"].drop_nulls().unique().to_list() == [0x0000FFFF]
+    with pytest.raises(ValueError, match="`color_format` must be one of"):
+        canvas.to_polars(color_format="argb")
+
+
+def test_to_polars_categorical_columns():
+    canvas = Canvas()
+    circle_batch_data(x=[0, 1], y=0, radius=1, fill=["red", "blue"], canvas=canvas)
+    canvas.add_path([0, 1], [0, 1], color="red")
+    df = canvas.to_polars(categorical=True)
+
+    for column in ("color", "fill", "group"):
+        assert df.schema[column] == pl.Categorical
+    df = df.with_columns(pl.col("color", "fill", "group").cast(pl.Utf8))
+    assert_frame_equal(df, canvas.to_polars())
+
+
+def test_canvas_repr():
+    canvas = circle_batch_data(x=[0, 1], y=0, radius=1, canvas=Canvas(capacity=256))
+    assert repr(canvas) == "Canvas(rows=200, groups=2, capacity=256)"
@@ -1,11 +1,17 @@
 ###############################################################################
 # circles.py Test Suite
 ###############################################################################
-import pytest
 import re
-from artpack import circle_data
+
+import numpy as np
+import polars as pl
+import pytest
 from polars import DataFrame
+from polars.testing import assert_frame_equal
 
+from artpack import Canvas, circle_data
+from artpack.circles import circle_batch_data
+from artpack.colors import unpack_colors
 
 # Input validations
 # ------------------------------------------------------------------------------
@@ -150,7 +156,257 @@ def test_circle_data_docstring_examples():
     This will automatically test the examples in the docstring of circle_data.
     """
     import doctest
+
     import artpack.circles
 
     failures, _ = doctest.testmod(artpack.circles, verbose=False)
     assert failures == 0
+
+
+# ------------------------------------------------------------------------------
+# circle_batch_data
+## Input validations----
+circle_batch_data_error_cases = [
+    {
+        "id": "x is a string",
+        "kwargs": {"x": "0, 1", "y": [0, 1], "radius": 1},
+        "exc": TypeError,
+        "error_msg": "`x` should be a number or a sequence of numbers.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "y holds non-numbers",
+        "kwargs": {"x": [0, 1], "y": [0, "one"], "radius": 1},
+        "exc": TypeError,
+        "error_msg": "`y` should be a number or a sequence of numbers.\nYou've supplied a `list` object",
+    },
+    {
+        "id": "radius is nested",
+        "kwargs": {"x": [0, 1], "y": [0, 1], "radius": [[1, 2]]},
+        "exc": TypeError,
+        "error_msg": "`radius` should be a number or a 1-D sequence of numbers.\nYou've supplied an array with shape (1, 2)",
+    },
+    {
+        "id": "lengths differ",
+        "kwargs": {"x": [0, 1, 2], "y": [0, 1], "radius": 1},
+        "exc": ValueError,
+        "error_msg": "`x`, `y`, and `radius` must have the same length (or length 1).\nYou've supplied lengths 3, 2, and 1",
+    },
+    {
+        "id": "radius is not positive",
+        "kwargs": {"x": [0, 1], "y": [0, 1], "radius": [1, -2]},
+        "exc": ValueError,
+        "error_msg": "`radius` values must all be positive integers or floats.\nYou've supplied: `-2`",
+    },
+    {
+        "id": "n_points is not gte 100",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "n_points": 20},
+        "exc": ValueError,
+        "error_msg": "`n_points` must be >= 100 for a reasonable approximation of a circle.\nYou've supplied: `20`",
+    },
+    {
+        "id": "color list has wrong length",
+        "kwargs": {"x": [0, 1], "y": [0, 1], "radius": 1, "color": ["red"]},
+        "exc": ValueError,
+        "error_msg": "`color` must be a single color or one color per circle (2).\nYou've supplied 1 colors",
+    },
+    {
+        "id": "fill list has an invalid color",
+        "kwargs": {"x": [0, 1], "y": [0, 1], "radius": 1, "fill": ["red", "nope"]},
+        "exc": ValueError,
+        "error_msg": "`fill` must be a valid hex color (#RRGGBB or #RGB) or a named matplotlib color.\nYou've supplied: 'nope'",
+    },
+    {
+        "id": "color_format is unknown",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "color_format": "rgb"},
+        "exc": ValueError,
+        "error_msg": "`color_format` must be one of: hex, rgba.\nYou've supplied: 'rgb'",
+    },
+    {
+        "id": "categorical is not a bool",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "categorical": "yes"},
+        "exc": TypeError,
+        "error_msg": "`categorical` should be of type `bool`.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "color is not a string or sequence",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "color": 5},
+        "exc": TypeError,
+        "error_msg": "`color` should be of type `list` or `tuple` or `Series`.\nYou've supplied a `int` object",
+    },
+    {
+        "id": "bbox is inverted",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "bbox": (1, 0, 0, 1)},
+        "exc": ValueError,
+        "error_msg": "`bbox` must be (xmin, ymin, xmax, ymax) with xmin < xmax and ymin < ymax.\nYou've supplied: `(1, 0, 0, 1)`",
+    },
+    {
+        "id": "clip without bbox",
+        "kwargs": {"x": [0], "y": [0], "radius": 1, "clip": True},
+        "exc": ValueError,
+        "error_msg": "`clip` needs a `bbox` to clip to.\nSupply `bbox=(xmin, ymin, xmax, ymax)` or set `clip=False`",
+    },
+    {
+        "id": "max_memory is smaller than the output",
+        "kwargs": {"x": [0, 1], "y": [0, 1], "radius": 1, "max_memory": "1KB"},
+        "exc": ValueError,
+        "error_msg": "`max_memory` is smaller than the estimated output (4,800 bytes).\nYou've supplied: 1,000 bytes. Use `aio.circle_stream` to generate the batch in chunks",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    circle_batch_data_error_cases,
+    ids=[case["id"] for case in circle_batch_data_error_cases],
+)
+def test_circle_batch_data_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        circle_batch_data(**case["kwargs"])
+
+
+## Output validations----
+def test_circle_batch_data_matches_circle_data():
+    xs, ys, radii = [0, 3.5, -2], [1, 2, 3], [1, 0.5, 4]
+    colors = ["red", "#000000", "pink"]
+
+    df_batch = circle_batch_data(xs, ys, radii, color=colors, fill="blue")
+    df_single = pl.concat(
+        [
+            circle_data(
+                x, y, r, color=c, fill="blue", group_var=True, group_value=f"circle_{i}"
+            )
+            for i, (x, y, r, c) in enumerate(zip(xs, ys, radii, colors), start=1)
+        ]
+    )
+    assert_frame_equal(df_batch, df_single)
+
+
+def test_circle_batch_data_broadcasts_scalars():
+    df_circles = circle_batch_data(x=[0, 1, 2, 3], y=0, radius=1, n_points=120)
+    assert df_circles.height == 4 * 120
+    assert df_circles["group"].n_unique() == 4
+
+    df_stacked = circle_batch_data(x=5, y=[0, 2, 4], radius=[1])
+    assert df_stacked["group"].n_unique() == 3
+
+
+def test_circle_batch_data_without_group():
+    df_circles = circle_batch_data(x=[0, 1], y=[0, 1], radius=1, group_var=False)
+    assert df_circles.columns == ["x", "y"]
+
+
+def test_circle_batch_data_accepts_numpy_and_polars():
+    df_circles = circle_batch_data(
+        x=np.array([0.0, 1.0]),
+        y=pl.Series([0, 1]),
+        radius=2,
+        fill=pl.Series(["red", "blue"]),
+    )
+    assert df_circles["fill"].unique().sort().to_list() == ["blue", "red"]
+
+
+def test_circle_batch_data_empty_input():
+    df_circles = circle_batch_data(x=[], y=[], radius=[])
+    assert df_circles.height == 0
+    assert df_circles.columns == ["x", "y", "group"]
+
+
+def test_circle_data_packs_rgba_colors():
+    df_circle = circle_data(0, 0, 1, color="red", fill="#00F", color_format="rgba")
+    assert df_circle.schema["color"] == pl.UInt32
+    assert df_circle["color"].unique().to_list() == [0xFF0000FF]
+    assert df_circle["fill"].unique().to_list() == [0x0000FFFF]
+
+
+def test_circle_batch_data_rgba_matches_hex():
+    kwargs = {"x": [0, 1, 2], "y": 0, "radius": 1, "color": "black"}
+    fills = ["#FF0000", "#00ff00", "#FF0000"]
+    df_hex = circle_batch_data(**kwargs, fill=fills)
+    df_rgba = circle_batch_data(**kwargs, fill=fills, color_format="rgba")
+    assert df_rgba.schema["fill"] == pl.UInt32
+    assert df_rgba["color"].unique().to_list() == [0x000000FF]
+    assert_frame_equal(
+        unpack_colors(df_rgba).drop("color"),
+        df_hex.drop("color").with_columns(pl.col("fill").str.to_lowercase()),
+    )
+
+
+def test_circle_data_categorical_columns():
+    df_circle = circle_data(
+        0, 0, 1, color="red", fill="blue", group_var=True, categorical=True
+    )
+    for column in ("color", "fill", "group"):
+        assert df_circle.schema[column] == pl.Categorical
+    assert df_circle["group"].unique().to_list() == ["circle_"]
+
+
+def test_circle_batch_data_categorical_matches_strings():
+    kwargs = {"x": [0, 1, 2], "y": 0, "radius": 1, "color": "black"}
+    kwargs["fill"] = ["red", "blue", "red"]
+    df_labels = circle_batch_data(**kwargs, categorical=True)
+    df_strings = circle_batch_data(**kwargs)
+    assert df_labels.schema["group"] == pl.Categorical
+    assert df_labels["fill"].to_physical().n_unique() == 2
+    df_labels = df_labels.with_columns(pl.col("color", "fill", "group").cast(pl.Utf8))
+    assert_frame_equal(df_labels, df_strings)
+
+
+def test_circle_batch_data_categorical_frames_concatenate():
+    first = circle_batch_data([0, 1], 0, 1, group_value="a_", categorical=True)
+    second = circle_batch_data([0, 1], 0, 1, group_value="b_", categorical=True)
+    scene = pl.concat([first, second])
+    assert scene.schema["group"] == pl.Categorical
+    assert scene.group_by("group").len().height == 4
+
+
+def test_circle_batch_data_rgba_colors_stay_packed_when_categorical():
+    df_circles = circle_batch_data(
+        [0, 1], 0, 1, fill="red", color_format="rgba", categorical=True
+    )
+    assert df_circles.schema["fill"] == pl.UInt32
+    assert df_circles.schema["group"] == pl.Categorical
+
+
+def test_circle_data_culls_circles_outside_bbox():
+    df_circle = circle_data(10, 10, 1, fill="red", group_var=True, bbox=(0, 0, 5, 5))
+    assert df_circle.height == 0
+    assert df_circle.columns == ["x", "y", "fill", "group"]
+
+    canvas = Canvas()
+    circle_data(10, 10, 1, bbox=(0, 0, 5, 5), canvas=canvas)
+    assert canvas.to_polars().height == 0
+
+
+def test_circle_data_clips_vertices_to_bbox():
+    df_circle = circle_data(0, 0, 2, bbox=(-1, -5, 5, 1), clip=True)
+    assert df_circle.height == 100
+    assert df_circle["x"].min() == -1 and df_circle["y"].max() == 1
+
+
+def test_circle_batch_data_culls_and_keeps_group_numbers():
+    kwargs = {"x": [0, 10, 2], "y": [0, 10, 2], "radius": 1}
+    kwargs["fill"] = ["red", "blue", "green"]
+    df_circles = circle_batch_data(**kwargs, bbox=(-1, -1, 5, 5))
+    expected = circle_batch_data(**kwargs).filter(pl.col("group") != "circle_2")
+    assert_frame_equal(df_circles, expected)
+
+    canvas = Canvas()
+    circle_batch_data(**kwargs, bbox=(-1, -1, 5, 5), canvas=canvas)
+    assert_frame_equal(canvas.to_polars(), expected)
+
+
+def test_circle_batch_data_clips_on_canvas():
+    kwargs = {"x": [0, 4], "y": 0, "radius": 2, "bbox": (-1, -1, 3, 1), "clip": True}
+    df_circles = circle_batch_data(**kwargs)
+    assert df_circles["x"].min() == -1 and df_circles["x"].max() == 3
+    canvas = Canvas()
+    circle_batch_data(**kwargs, canvas=canvas)
+    assert_frame_equal(canvas.to_polars(), df_circles)
+
+
+def test_circle_batch_data_builds_in_chunks_within_max_memory():
+    kwargs = {"x": range(300), "y": 0, "radius": 1, "fill": ["red", "blue"] * 150}
+    expected = circle_batch_data(**kwargs)
+    chunked = circle_batch_data(**kwargs, max_memory=expected.height * 45)
+    assert chunked.n_chunks() > 1
+    assert_frame_equal(chunked, expected)
@@ -0,0 +1,175 @@
+###############################################################################
+# cli.py Test Suite
+###############################################################################
+import json
+import os
+import re
+
+import pytest
+
+from artpack import cli
+from artpack.cli import _build_scene, _parse_seeds, main
+
+SPEC = {
+    "name": "dots",
+    "width": 200,
+    "height": 200,
+    "bbox": [0, 0, 10, 10],
+    "background": "#000000",
+    "shapes": [
+        {
+            "type": "circle",
+            "n": 25,
+            "x": [0, 10],
+            "y": [0, 10],
+            "radius": [0.1, 1],
+            "fill": {"palette": "neon"},
+        },
+        {
+            "type": "circle",
+            "n": 3,
+            "x": 5,
+            "y": 5,
+            "radius": 2,
+            "color": ["red", "blue"],
+        },
+    ],
+}
+
+
+def _write_spec(tmp_path, spec=SPEC):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    return str(path)
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+spec_error_cases = [
+    {
+        "id": "spec is not an object",
+        "spec": [1, 2],
+        "error_msg": "A scene spec must be a JSON object.\nYou've supplied a `list`",
+    },
+    {
+        "id": "spec has no shapes",
+        "spec": {"shapes": []},
+        "error_msg": "A scene spec needs a non-empty `shapes` list",
+    },
+    {
+        "id": "unknown shape type",
+        "spec": {"shapes": [{"type": "square"}]},
+        "error_msg": "`shapes[0]` must be an object whose `type` is one of: circle",
+    },
+    {
+        "id": "unknown shape keys",
+        "spec": {"shapes": [{"type": "circle", "size": 1, "alpha": 2}]},
+        "error_msg": "Unknown keys in `shapes[0]`: `alpha`, `size`",
+    },
+    {
+        "id": "values rejected by the generator",
+        "spec": {"shapes": [{"type": "circle", "radius": -1}]},
+        "error_msg": "invalid scene spec:\n`radius` values must all be positive",
+    },
+]
+
+
+@pytest.mark.parametrize("case", spec_error_cases, ids=lambda case: case["id"])
+def test_render_rejects_invalid_specs(case, tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["render", _write_spec(tmp_path, case["spec"]), "--out", str(tmp_path)])
+    assert excinfo.value.code == 2
+    assert re.search(re.escape(case["error_msg"]), capsys.readouterr().err)
+
+
+def test_parse_seeds():
+    assert _parse_seeds("3:6") == [3, 4, 5]
+    assert _parse_seeds("7") == [7]
+    assert _parse_seeds("1,5,9") == [1, 5, 9]
+    with pytest.raises(Exception, match="expected START:STOP"):
+        _parse_seeds("a:b")
+
+
+# Rendering
+# ------------------------------------------------------------------------------
+def _render(tmp_path, out, *options):
+    args = ["render", _write_spec(tmp_path), "--out", str(out), "--workers", "1"]
+    return main([*args, *options])
+
+
+def test_scenes_depend_only_on_seed():
+    first = _build_scene(SPEC, 4).to_polars()
+    assert first.equals(_build_scene(SPEC, 4).to_polars())
+    assert not first.equals(_build_scene(SPEC, 5).to_polars())
+    assert first["group"].n_unique() == 28
+    assert first["group"][0] == "layer1_circle_1"
+
+
+def test_render_writes_one_svg_per_seed(tmp_path, capsys):
+    out = tmp_path / "out"
+    assert _render(tmp_path, out, "--seeds", "0:3") == 0
+    names = sorted(path.name for path in out.iterdir())
+    assert names == ["dots_0.svg", "dots_1.svg", "dots_2.svg"]
+    svg = (out / "dots_0.svg").read_text(encoding="utf-8")
+    assert 'width="200" height="200"' in svg
+    assert svg.count("<path") == 28
+    assert "images/s" in capsys.readouterr().out
+
+
+def test_render_resumes_and_overwrites(tmp_path, capsys):
+    out = tmp_path / "out"
+    _render(tmp_path, out, "--seeds", "0:2")
+    capsys.readouterr()
+
+    _render(tmp_path, out, "--seeds", "0:3")
+    output = capsys.readouterr().out
+    assert "Skipping 2 already rendered seed(s)" in output
+    assert "Rendered 1 image(s)" in output
+
+    _render(tmp_path, out, "--seeds", "0:3")
+    assert "Nothing to render" in capsys.readouterr().out
+
+    _render(tmp_path, out, "--seeds", "0:3", "--overwrite")
+    assert "Rendered 3 image(s)" in capsys.readouterr().out
+
+
+def test_process_pool_matches_serial_output(tmp_path):
+    serial, pooled = tmp_path / "serial", tmp_path / "pooled"
+    _render(tmp_path, serial, "--seeds", "0:4")
+    assert _render(tmp_path, pooled, "--seeds", "0:4", "--workers", "2") == 0
+    for seed in range(4):
+        name = f"dots_{seed}.svg"
+        assert (serial / name).read_bytes() == (pooled / name).read_bytes()
+
+
+def test_size_options_override_spec(tmp_path):
+    out = tmp_path / "out"
+    _render(tmp_path, out, "--width", "640", "--height", "480")
+    svg = (out / "dots_0.svg").read_text(encoding="utf-8")
+    assert 'width="640" height="480"' in svg
+
+
+def test_render_summary_survives_zero_elapsed_time(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(cli.time, "perf_counter", lambda: 0.0)
+    assert _render(tmp_path, tmp_path / "out", "--seeds", "0:2") == 0
+    assert "Rendered 2 image(s) in 0.00 s" in capsys.readouterr().out
+
+
+def test_serial_render_leaves_environment_alone(tmp_path, monkeypatch):
+    monkeypatch.delenv("POLARS_MAX_THREADS", raising=False)
+    _render(tmp_path, tmp_path / "out", "--seeds", "0:2")
+    assert "POLARS_MAX_THREADS" not in os.environ
+
+
+def test_serial_render_reports_failures_and_raises_bugs(tmp_path, monkeypatch, capsys):
+    def fail(seed, out_dir):
+        raise error
+
+    monkeypatch.setattr(cli, "_render_seed", fail)
+    error = OSError("disk full")
+    assert _render(tmp_path, tmp_path / "out", "--seeds", "0:2") == 1
+    assert "seed 0 failed: disk full" in capsys.readouterr().err
+
+    error = AttributeError("bug")
+    with pytest.raises(AttributeError, match="bug"):
+        _render(tmp_path, tmp_path / "out", "--seeds", "0:2")
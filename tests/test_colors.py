@@ -0,0 +1,104 @@
+###############################################################################
+# _colors.py and colors.py Test Suite
+###############################################################################
+import re
+
+import polars as pl
+import pytest
+
+from artpack._colors import (
+    _CSS4_COLORS,
+    _hex_to_rgb,
+    _rgb_to_hex,
+    _rgba32_to_hex,
+    _to_rgba32,
+)
+from artpack.colors import pack_colors, unpack_colors
+
+
+# ------------------------------------------------------------------------------
+# _CSS4_COLORS Tests
+def test_css4_table_has_all_named_colors():
+    assert len(_CSS4_COLORS) == 148
+    assert _CSS4_COLORS["rebeccapurple"] == "#663399"
+
+
+# ------------------------------------------------------------------------------
+# _hex_to_rgb Tests
+@pytest.mark.parametrize(
+    "hex_color, expected",
+    [
+        ("#000000", (0.0, 0.0, 0.0)),
+        ("#FFFFFF", (1.0, 1.0, 1.0)),
+        ("#abc", (0xAA / 255, 0xBB / 255, 0xCC / 255)),
+        ("#12012E", (0x12 / 255, 0x01 / 255, 0x2E / 255)),
+    ],
+)
+def test_hex_to_rgb_converts_hex_strings(hex_color, expected):
+    assert _hex_to_rgb(hex_color) == expected
+
+
+# ------------------------------------------------------------------------------
+# _rgb_to_hex Tests
+def test_rgb_to_hex_converts_and_lowercases():
+    assert _rgb_to_hex((0.1, 0.2, 0.3)) == "#1a334c"
+
+
+def test_rgb_to_hex_round_trips():
+    assert _rgb_to_hex(_hex_to_rgb("#F67C21")) == "#f67c21"
+
+
+# ------------------------------------------------------------------------------
+# _to_rgba32 / _rgba32_to_hex Tests
+@pytest.mark.parametrize(
+    "color, expected",
+    [
+        ("#FF0000", 0xFF0000FF),
+        ("#abc", 0xAABBCCFF),
+        ("White", 0xFFFFFFFF),
+        ("rebeccapurple", 0x663399FF),
+    ],
+)
+def test_to_rgba32_packs_opaque_colors(color, expected):
+    assert _to_rgba32(color) == expected
+
+
+def test_rgba32_to_hex_includes_alpha_only_when_translucent():
+    assert _rgba32_to_hex(0x663399FF) == "#663399"
+    assert _rgba32_to_hex(0x66339980) == "#66339980"
+
+
+# ------------------------------------------------------------------------------
+# pack_colors / unpack_colors Tests
+def test_pack_colors_round_trips_with_nulls():
+    packed = pack_colors(["#FF0000", "white", None, "#FF0000"])
+    assert packed.dtype == pl.UInt32
+    assert packed.to_list() == [0xFF0000FF, 0xFFFFFFFF, None, 0xFF0000FF]
+    assert unpack_colors(packed).to_list() == ["#ff0000", "#ffffff", None, "#ff0000"]
+
+
+def test_pack_colors_accepts_a_single_color_and_empty_input():
+    assert pack_colors("#000").to_list() == [0x000000FF]
+    assert pack_colors([]).dtype == pl.UInt32
+    assert unpack_colors(pl.Series([], dtype=pl.UInt32)).dtype == pl.Utf8
+
+
+def test_pack_colors_validates_colors():
+    with pytest.raises(ValueError, match=re.escape("You've supplied: 'nope'")):
+        pack_colors(["red", "nope"])
+    with pytest.raises(TypeError, match="`colors` should be of type"):
+        pack_colors(5)
+
+
+def test_unpack_colors_converts_frame_color_columns():
+    frame = pl.DataFrame(
+        {"x": [0.0, 1.0], "color": pack_colors(["red", "blue"]), "fill": ["a", "b"]}
+    )
+    unpacked = unpack_colors(frame)
+    assert unpacked["color"].to_list() == ["#ff0000", "#0000ff"]
+    assert unpacked["fill"].to_list() == ["a", "b"]
+
+
+def test_unpack_colors_requires_integers():
+    with pytest.raises(TypeError, match="`data` should hold packed RGBA integers"):
+        unpack_colors(pl.Series(["#ff0000"]))
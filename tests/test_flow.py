@@ -0,0 +1,119 @@
+###############################################################################
+# flow.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+
+from artpack.flow import flow_paths
+from artpack.noise import perlin_noise
+
+STARTS = np.random.default_rng(5).uniform(0, 10, size=(2, 200))
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+flow_error_cases = [
+    {
+        "id": "x and y have different lengths",
+        "kwargs": {"x": [1, 2, 3], "y": [1, 2]},
+        "exc": ValueError,
+        "error_msg": "`x` and `y` must have the same length (or length 1).\nYou've supplied lengths 3 and 2",
+    },
+    {
+        "id": "n_steps is not positive",
+        "kwargs": {"x": 0, "y": 0, "n_steps": 0},
+        "exc": ValueError,
+        "error_msg": "`n_steps` must be a positive integer or float (number with decimals).\nYou've supplied: `0`",
+    },
+    {
+        "id": "step_size is not a number",
+        "kwargs": {"x": 0, "y": 0, "step_size": "0.1"},
+        "exc": TypeError,
+        "error_msg": "`step_size` should be of type `float` or `int`.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "field is not callable",
+        "kwargs": {"x": 0, "y": 0, "field": 1.5},
+        "exc": TypeError,
+        "error_msg": "`field` must be a function of x and y that returns headings in radians.\nYou've supplied a `float` object",
+    },
+    {
+        "id": "bbox is empty",
+        "kwargs": {"x": 0, "y": 0, "bbox": (0, 0, 0, 1)},
+        "exc": ValueError,
+        "error_msg": "`bbox` must be (xmin, ymin, xmax, ymax) with xmin < xmax and ymin < ymax.\nYou've supplied: `(0, 0, 0, 1)`",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    flow_error_cases,
+    ids=[case["id"] for case in flow_error_cases],
+)
+def test_flow_paths_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        flow_paths(**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_flow_paths_schema():
+    paths = flow_paths(STARTS[0], STARTS[1], n_steps=10)
+    assert paths.schema == {"x": pl.Float32, "y": pl.Float32, "group": pl.Utf8}
+    assert paths.height == 200 * 11
+    assert paths["group"].unique(maintain_order=True).to_list() == [
+        f"flow_{n}" for n in range(1, 201)
+    ]
+    np.testing.assert_allclose(paths["x"].gather_every(11), STARTS[0], rtol=1e-6)
+
+
+def test_flow_paths_lockstep_matches_one_particle_at_a_time():
+    kwargs = {"n_steps": 25, "step_size": 0.2, "scale": 3, "octaves": 2, "seed": 4}
+    together = flow_paths(STARTS[0], STARTS[1], **kwargs)
+    for n in (0, 57, 199):
+        alone = flow_paths(STARTS[0][n], STARTS[1][n], **kwargs)
+        one = together.filter(pl.col("group") == f"flow_{n + 1}")
+        assert one[["x", "y"]].equals(alone[["x", "y"]])
+
+
+def test_flow_paths_follow_the_noise_field():
+    paths = flow_paths(0.3, 0.7, n_steps=1, step_size=0.5, scale=2, seed=9, turns=0.5)
+    heading = np.pi * perlin_noise(0.3, 0.7, scale=2, seed=9)
+    np.testing.assert_allclose(
+        paths[["x", "y"]].row(1),
+        (0.3 + 0.5 * np.cos(heading), 0.7 + 0.5 * np.sin(heading)),
+        rtol=1e-6,
+    )
+
+
+def test_flow_paths_custom_field():
+    paths = flow_paths([0, 0], [0, 1], n_steps=4, step_size=1, field=lambda x, y: 0 * x)
+    assert paths["x"].to_list() == [0, 1, 2, 3, 4] * 2
+    assert paths["y"].to_list() == [0] * 5 + [1] * 5
+
+
+def test_flow_paths_stop_at_bbox():
+    paths = flow_paths(
+        [0.5, 2.5, 20, 3.5],
+        0.5,
+        n_steps=10,
+        step_size=1,
+        field=lambda x, y: 0 * x,
+        bbox=(0, 0, 4, 1),
+    )
+    # Particle 3 starts outside and particle 4 leaves on its first step
+    assert paths.group_by("group", maintain_order=True).len().rows() == [
+        ("flow_1", 4),
+        ("flow_2", 2),
+    ]
+    assert paths["x"].to_list() == [0.5, 1.5, 2.5, 3.5, 2.5, 3.5]
+
+
+def test_flow_paths_all_outside_bbox():
+    paths = flow_paths([5, 6], 5, bbox=(0, 0, 1, 1))
+    assert paths.height == 0
+    assert paths.columns == ["x", "y", "group"]
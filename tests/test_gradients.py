@@ -0,0 +1,152 @@
+###############################################################################
+# gradients.py Test Suite
+###############################################################################
+import re
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from artpack import Canvas, art_pals, circle_batch_data, circle_data
+from artpack.gradients import _gradient_table, palette_gradient
+
+SQUARE = pl.DataFrame(
+    {
+        "x": [0.0, 1.0, 1.0, 0.0, 5.0, 5.0, 5.0],
+        "y": [0.0, 0.0, 3.0, 3.0, 0.0, 1.0, 1.0],
+        "group": ["a", "a", "a", "a", "b", "b", "b"],
+    }
+)
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+gradient_error_cases = [
+    {
+        "id": "unknown palette name",
+        "kwargs": {"data": SQUARE, "gradient": "plaid"},
+        "exc": ValueError,
+        "error_msg": "`gradient` must be an artpack palette name or a list of colors.\nYou've supplied: 'plaid'",
+    },
+    {
+        "id": "invalid color in list",
+        "kwargs": {"data": SQUARE, "gradient": ["red", "nope"]},
+        "exc": ValueError,
+        "error_msg": "`gradient` must be a valid hex color (#RRGGBB or #RGB) or a named matplotlib color.\nYou've supplied: 'nope'",
+    },
+    {
+        "id": "empty color list",
+        "kwargs": {"data": SQUARE, "gradient": []},
+        "exc": ValueError,
+        "error_msg": "`gradient` must have at least one color",
+    },
+    {
+        "id": "unknown position measure",
+        "kwargs": {"data": SQUARE, "gradient": "neon", "by": "angle"},
+        "exc": ValueError,
+        "error_msg": "`by` must be one of: arc_length, index.\nYou've supplied: 'angle'",
+    },
+    {
+        "id": "data has no y column",
+        "kwargs": {"data": SQUARE.drop("y"), "gradient": "neon"},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x` and `y` columns.\nMissing: `y`",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case", gradient_error_cases, ids=[case["id"] for case in gradient_error_cases]
+)
+def test_palette_gradient_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        palette_gradient(**case["kwargs"])
+
+
+# Palette tables
+# ------------------------------------------------------------------------------
+def test_gradient_table_matches_art_pals_and_is_cached():
+    table = _gradient_table("Neon")
+    assert list(table) == art_pals("neon", 256)
+    assert _gradient_table("neon") is table
+    assert _gradient_table(["red", "#0000ff"])[-1] == "#0000ff"
+
+
+# Gradients for any shape data
+# ------------------------------------------------------------------------------
+def test_palette_gradient_by_arc_length_and_index():
+    table = _gradient_table(["#000000", "#ffffff"])
+    by_length = palette_gradient(SQUARE, ["black", "white"])["color"].to_list()
+    by_index = palette_gradient(SQUARE, ["black", "white"], by="index")["color"]
+
+    # Square "a" has perimeter steps 1, 3, 1 of 5; "b" has a zero-length last step
+    expected_t = [0, 0.2, 0.8, 1, 0, 1, 1]
+    assert by_length == [table[round(t * 255)] for t in expected_t]
+    assert by_index.to_list() == [
+        table[round(t * 255)] for t in [0, 1 / 3, 2 / 3, 1, 0, 0.5, 1]
+    ]
+
+
+def test_palette_gradient_without_group_and_packed():
+    colors = palette_gradient(
+        SQUARE.drop("group"), "neon", column="stroke", color_format="rgba"
+    )["stroke"]
+    assert colors.dtype == pl.UInt32
+    assert colors[0] != colors[-1]
+
+
+# Shape generator option
+# ------------------------------------------------------------------------------
+def test_circle_gradient_sweeps_palette_around_outline():
+    circle = circle_data(0, 0, 1, fill="black", gradient="neon", n_points=101)
+    table = _gradient_table("neon")
+    assert circle["color"][0] == table[0]
+    assert circle["color"][50] == table[128]
+    assert circle["color"][100] == table[255]
+    assert_frame_equal(
+        circle,
+        palette_gradient(
+            circle_data(0, 0, 1, fill="black", n_points=101), "neon", by="index"
+        ).select(circle.columns),
+        check_dtypes=False,
+    )
+
+
+def test_batch_gradient_matches_per_circle_gradients():
+    batch = circle_batch_data([0, 3, 6], 0, [1, 2, 0.5], gradient="sunnyside")
+    single = pl.concat(
+        circle_data(
+            x, 0, r, gradient="sunnyside", group_var=True, group_value=f"circle_{i}"
+        )
+        for i, (x, r) in enumerate([(0, 1), (3, 2), (6, 0.5)], start=1)
+    )
+    assert_frame_equal(batch, single)
+
+    packed = circle_batch_data([0, 3], 0, 1, gradient="neon", color_format="rgba")
+    assert packed.schema["color"] == pl.UInt32
+    assert packed["color"].n_unique() == 100
+
+
+def test_gradient_on_canvas_matches_frames():
+    canvas = Canvas()
+    circle_batch_data([0, 3], 0, 1, fill="red", gradient="neon", canvas=canvas)
+    circle_data(0, 0, 1, gradient=["red", "blue"], group_var=True, canvas=canvas)
+    expected = pl.concat(
+        [
+            circle_batch_data([0, 3], 0, 1, fill="red", gradient="neon"),
+            circle_data(0, 0, 1, gradient=["red", "blue"], group_var=True),
+        ],
+        how="diagonal",
+    )
+    assert_frame_equal(canvas.to_polars(), expected.select(canvas.to_polars().columns))
+
+
+def test_gradient_and_color_are_exclusive():
+    with pytest.raises(
+        ValueError, match="`color` and `gradient` can't both be supplied"
+    ):
+        circle_batch_data([0], 0, 1, color="red", gradient="neon")
+    with pytest.raises(
+        ValueError, match="`color` and `gradient` can't both be supplied"
+    ):
+        circle_data(0, 0, 1, color="red", gradient="neon")
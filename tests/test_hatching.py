@@ -0,0 +1,160 @@
+###############################################################################
+# hatching.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+
+from artpack import circle_batch_data, circle_data
+from artpack.hatching import hatch_fill
+
+SQUARE = pl.DataFrame(
+    {"x": [0.0, 4.0, 4.0, 0.0], "y": [0.0, 0.0, 4.0, 4.0], "group": ["a"] * 4}
+)
+
+
+def _segments(hatches: pl.DataFrame) -> pl.DataFrame:
+    """One row per segment: its start and end points."""
+    return hatches.group_by("group", maintain_order=True).agg(
+        x0=pl.col("x").first(),
+        y0=pl.col("y").first(),
+        x1=pl.col("x").last(),
+        y1=pl.col("y").last(),
+    )
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+hatch_error_cases = [
+    {
+        "id": "data is not a DataFrame",
+        "kwargs": {"data": [1, 2], "spacing": 1},
+        "exc": TypeError,
+        "error_msg": "`data` should be of type `DataFrame`.\nYou've supplied a `list` object",
+    },
+    {
+        "id": "data has no y column",
+        "kwargs": {"data": pl.DataFrame({"x": [0.0]}), "spacing": 1},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x` and `y` columns.\nMissing: `y`",
+    },
+    {
+        "id": "spacing is not positive",
+        "kwargs": {"data": SQUARE, "spacing": -1},
+        "exc": ValueError,
+        "error_msg": "`spacing` must be a positive integer or float (number with decimals).\nYou've supplied: `-1`",
+    },
+    {
+        "id": "angle is not a number",
+        "kwargs": {"data": SQUARE, "spacing": 1, "angle": "45"},
+        "exc": TypeError,
+        "error_msg": "`angle` should be of type `float` or `int`.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "color is invalid",
+        "kwargs": {"data": SQUARE, "spacing": 1, "color": "nope"},
+        "exc": ValueError,
+        "error_msg": "`color` must be a valid hex color (#RRGGBB or #RGB) or a named matplotlib color.\nYou've supplied: 'nope'",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    hatch_error_cases,
+    ids=[case["id"] for case in hatch_error_cases],
+)
+def test_hatch_fill_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        hatch_fill(**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_hatch_fill_square():
+    hatches = hatch_fill(SQUARE, spacing=1, angle=0, offset=0.5, color="black")
+    assert hatches.columns == ["x", "y", "color", "group"]
+    assert hatches["group"].unique(maintain_order=True).to_list() == [
+        "a_1",
+        "a_2",
+        "a_3",
+        "a_4",
+    ]
+    assert hatches["y"].to_list() == [0.5, 0.5, 1.5, 1.5, 2.5, 2.5, 3.5, 3.5]
+    assert hatches["x"].to_list() == [0.0, 4.0] * 4
+
+
+def test_hatch_fill_circle_chords():
+    circle = circle_data(0, 0, 2, n_points=4000, group_var=True)
+    segments = _segments(hatch_fill(circle, spacing=0.25, angle=0))
+    chords = 2 * np.sqrt(4 - segments["y0"].to_numpy() ** 2)
+    np.testing.assert_allclose(segments["x1"] - segments["x0"], chords, atol=1e-3)
+    assert segments.height == 15
+
+
+def test_hatch_fill_angle_rotates_lines():
+    segments = _segments(hatch_fill(SQUARE, spacing=1, angle=90, offset=0.5))
+    assert (segments["x0"] - segments["x1"]).abs().max() < 1e-9
+    assert segments["x0"].round(6).to_list() == [3.5, 2.5, 1.5, 0.5]
+
+
+def test_hatch_fill_skips_holes():
+    hole = SQUARE.with_columns(pl.col("x", "y") / 2 + 1)
+    ring = pl.concat([SQUARE, hole]).with_columns(subgroup=pl.Series([1] * 4 + [2] * 4))
+    segments = _segments(hatch_fill(ring, spacing=1, angle=0, offset=0.5))
+    assert segments.height == 6
+    assert segments.filter(pl.col("y0") == 1.5)[["x0", "x1"]].rows() == [
+        (0.0, 1.0),
+        (3.0, 4.0),
+    ]
+
+
+def test_hatch_fill_concave_shape():
+    # A "U": lines through the arms are split in two
+    u_shape = pl.DataFrame(
+        {
+            "x": [0.0, 3.0, 3.0, 2.0, 2.0, 1.0, 1.0, 0.0],
+            "y": [0.0, 0.0, 3.0, 3.0, 1.0, 1.0, 3.0, 3.0],
+        }
+    )
+    segments = _segments(hatch_fill(u_shape, spacing=1, angle=0, offset=0.5))
+    assert segments["group"].to_list() == [
+        "hatch_1",
+        "hatch_2",
+        "hatch_3",
+        "hatch_4",
+        "hatch_5",
+    ]
+    assert segments.filter(pl.col("y0") == 2.5)[["x0", "x1"]].rows() == [
+        (0.0, 1.0),
+        (2.0, 3.0),
+    ]
+
+
+def test_hatch_fill_many_shapes_share_one_grid():
+    circles = circle_batch_data([0, 10, 20], 0, [1, 2, 3], n_points=400)
+    hatches = hatch_fill(circles, spacing=0.5, angle=0)
+    per_shape = (
+        hatches.with_columns(shape=pl.col("group").str.extract(r"^(circle_\d+)_"))
+        .group_by("shape", maintain_order=True)
+        .agg(pl.col("y").unique().sort())
+    )
+    assert per_shape["shape"].to_list() == ["circle_1", "circle_2", "circle_3"]
+    for radius, lines in zip([1, 2, 3], per_shape["y"]):
+        assert lines.to_list() == [k * 0.5 for k in range(-2 * radius + 1, 2 * radius)]
+
+
+def test_hatch_fill_keeps_float_dtypes():
+    circles = circle_batch_data([0], 0, 1)
+    hatches = hatch_fill(circles, spacing=0.3)
+    assert hatches.schema["x"] == pl.Float32
+    square = SQUARE.with_columns(pl.col("x", "y").cast(pl.Int64))
+    assert hatch_fill(square, spacing=1).schema["x"] == pl.Float64
+
+
+def test_hatch_fill_empty():
+    hatches = hatch_fill(SQUARE.clear(), spacing=1)
+    assert hatches.height == 0
+    assert hatches.columns == ["x", "y", "group"]
@@ -0,0 +1,63 @@
+###############################################################################
+# __init__.py Test Suite
+###############################################################################
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import artpack
+
+
+# ------------------------------------------------------------------------------
+# Import cost
+def test_import_artpack_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, artpack\n"
+        "heavy = ('matplotlib', 'polars', 'numpy')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_art_pals_never_loads_matplotlib():
+    code = (
+        "import sys, artpack\n"
+        "artpack.art_pals('rainbow', 30)\n"
+        "print('matplotlib' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+# ------------------------------------------------------------------------------
+# Lazy exports
+def test_lazy_export_resolves_circle_data():
+    from artpack.circles import circle_data
+
+    assert artpack.circle_data is circle_data
+
+
+def test_lazy_exports_are_listed_in_dir():
+    assert "circle_data" in dir(artpack)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_function'"):
+        _ = artpack.not_a_function
+
+
+# ------------------------------------------------------------------------------
+# Version
+def test_version_matches_pyproject():
+    pyproject = (Path(__file__).parent.parent / "pyproject.toml").read_text()
+    expected = re.search(r'^version = "([^"]+)"', pyproject, re.MULTILINE)[1]
+    assert artpack.__version__ == expected
+    assert "__version__" in dir(artpack)
@@ -0,0 +1,141 @@
+###############################################################################
+# namespace.py Test Suite
+###############################################################################
+import re
+import subprocess
+import sys
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+import artpack.namespace  # noqa: F401
+from artpack import circle_batch_data
+
+# Input validations
+# ------------------------------------------------------------------------------
+namespace_error_cases = [
+    {
+        "id": "n_points is not gte 100",
+        "kwargs": {"n_points": 10},
+        "exc": ValueError,
+        "error_msg": "`n_points` must be >= 100 for a reasonable approximation of a circle.\nYou've supplied: `10`",
+    },
+    {
+        "id": "radius is not a column name",
+        "kwargs": {"radius": 5},
+        "exc": TypeError,
+        "error_msg": "`radius` should be of type `str`.\nYou've supplied a `int` object",
+    },
+    {
+        "id": "fill is not a column name",
+        "kwargs": {"fill": ["red"]},
+        "exc": TypeError,
+        "error_msg": "`fill` should be of type `str`.\nYou've supplied a `list` object",
+    },
+    {
+        "id": "group_value is missing",
+        "kwargs": {"group_value": None},
+        "exc": TypeError,
+        "error_msg": "`group_value` should be of type `str`.\nYou've supplied a `NoneType` object",
+    },
+    {
+        "id": "spec column is missing",
+        "kwargs": {"radius": "r", "color": "stroke"},
+        "exc": ValueError,
+        "error_msg": "Spec columns not found in the DataFrame: `r`, `stroke`",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    namespace_error_cases,
+    ids=[case["id"] for case in namespace_error_cases],
+)
+def test_circles_namespace_error_messages(case):
+    specs = pl.DataFrame({"x": [0], "y": [0], "radius": [1]})
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        specs.artpack.circles(**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_circles_namespace_matches_circle_batch_data():
+    specs = pl.DataFrame(
+        {
+            "cx": [0.0, 3.5, -2.0],
+            "cy": [1, 2, 3],
+            "r": [1.0, 0.5, 4.0],
+            "stroke": ["red", "#000000", "pink"],
+            "paint": ["blue", "blue", "green"],
+        }
+    )
+    vertices = specs.artpack.circles(
+        n_points=150, x="cx", y="cy", radius="r", color="stroke", fill="paint"
+    )
+    expected = circle_batch_data(
+        x=[0, 3.5, -2],
+        y=[1, 2, 3],
+        radius=[1, 0.5, 4],
+        color=["red", "#000000", "pink"],
+        fill=["blue", "blue", "green"],
+        n_points=150,
+    )
+    assert_frame_equal(vertices, expected)
+
+
+def test_circles_namespace_is_lazy():
+    specs = pl.LazyFrame({"x": [0, 1], "y": [0, 1], "radius": [1, 2]})
+    query = specs.artpack.circles(group_var=False)
+    assert isinstance(query, pl.LazyFrame)
+    assert query.collect().columns == ["x", "y"]
+    assert query.collect().height == 200
+
+
+def test_circles_namespace_group_prefix():
+    specs = pl.DataFrame({"x": [0, 1], "y": [0, 1], "radius": [1, 2]})
+    groups = specs.artpack.circles(group_value="dot_")["group"].unique(
+        maintain_order=True
+    )
+    assert groups.to_list() == ["dot_1", "dot_2"]
+
+
+def test_plan_circles_namespace_matches_plan_circles():
+    from artpack.planning import plan_circles
+
+    specs = pl.DataFrame(
+        {
+            "x": [0.0, 1.0],
+            "y": 0.0,
+            "radius": 1.0,
+            "paint": ["lightgoldenrodyellow", "red"],
+        }
+    )
+    plan = specs.artpack.plan_circles(n_points=120, fill="paint")
+    assert plan == plan_circles(2, 120, fill=["lightgoldenrodyellow", "red"])
+    assert plan["rows"] == specs.artpack.circles(n_points=120, fill="paint").height
+    with pytest.raises(
+        ValueError, match="Spec columns not found in the DataFrame: `pal`"
+    ):
+        specs.artpack.plan_circles(fill="pal")
+
+
+def test_import_artpack_registers_namespace_when_polars_is_loaded():
+    code = "import polars as pl, artpack\nprint(hasattr(pl.DataFrame({}), 'artpack'))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
+
+
+def test_lazy_export_registers_namespace():
+    code = (
+        "import sys, artpack\n"
+        "artpack.circle_data\n"
+        "print('artpack.namespace' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
@@ -0,0 +1,100 @@
+###############################################################################
+# noise.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import pytest
+
+from artpack.noise import perlin_noise
+
+POINTS = np.random.default_rng(0).uniform(-40, 40, size=(2, 20_000))
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+noise_error_cases = [
+    {
+        "id": "x is not numeric",
+        "kwargs": {"x": "1", "y": 0},
+        "exc": TypeError,
+        "error_msg": "`x` should be a number or a sequence of numbers.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "x and y shapes don't broadcast",
+        "kwargs": {"x": [1, 2, 3], "y": [1, 2]},
+        "exc": ValueError,
+        "error_msg": "`x` and `y` must have the same shape (or shapes that broadcast).\nYou've supplied shapes (3,) and (2,)",
+    },
+    {
+        "id": "scale is not positive",
+        "kwargs": {"x": 0, "y": 0, "scale": 0},
+        "exc": ValueError,
+        "error_msg": "`scale` must be a positive integer or float (number with decimals).\nYou've supplied: `0`",
+    },
+    {
+        "id": "octaves is not an int",
+        "kwargs": {"x": 0, "y": 0, "octaves": 2.0},
+        "exc": TypeError,
+        "error_msg": "`octaves` should be of type `int`.\nYou've supplied a `float` object",
+    },
+    {
+        "id": "seed is not an int",
+        "kwargs": {"x": 0, "y": 0, "seed": "7"},
+        "exc": TypeError,
+        "error_msg": "`seed` should be of type `int`.\nYou've supplied a `str` object",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    noise_error_cases,
+    ids=[case["id"] for case in noise_error_cases],
+)
+def test_perlin_noise_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        perlin_noise(**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_perlin_noise_is_seeded():
+    first = perlin_noise(*POINTS, octaves=3, seed=11)
+    np.testing.assert_array_equal(first, perlin_noise(*POINTS, octaves=3, seed=11))
+    assert not np.allclose(first, perlin_noise(*POINTS, octaves=3, seed=12))
+
+
+@pytest.mark.parametrize("octaves", [1, 4])
+def test_perlin_noise_range(octaves):
+    values = perlin_noise(*POINTS, scale=3, octaves=octaves)
+    assert values.min() >= -1 and values.max() <= 1
+    assert values.std() > 0.1
+
+
+def test_perlin_noise_is_zero_on_the_lattice():
+    lattice = np.arange(-5.0, 6.0)
+    np.testing.assert_allclose(
+        perlin_noise(lattice * 2, lattice[::-1] * 2, scale=2), 0, atol=1e-12
+    )
+
+
+def test_perlin_noise_is_smooth():
+    xs = np.linspace(0, 8, 8001)
+    values = perlin_noise(xs, 1.3, octaves=3)
+    assert np.abs(np.diff(values)).max() < 0.01
+
+
+def test_perlin_noise_octaves_add_detail():
+    xs = np.linspace(0, 8, 8001)
+    rough = np.abs(np.diff(perlin_noise(xs, 1.3, octaves=5))).mean()
+    smooth = np.abs(np.diff(perlin_noise(xs, 1.3, octaves=1))).mean()
+    assert rough > smooth
+
+
+def test_perlin_noise_broadcasts_grids():
+    xs, ys = np.linspace(0, 3, 7), np.linspace(0, 2, 5)
+    grid = perlin_noise(xs[None, :], ys[:, None], seed=2)
+    assert grid.shape == (5, 7)
+    np.testing.assert_array_equal(grid[3], perlin_noise(xs, ys[3], seed=2))
+    assert np.ndim(perlin_noise(0.5, 0.5)) == 0
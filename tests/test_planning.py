@@ -0,0 +1,205 @@
+###############################################################################
+# planning.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+
+from artpack.circles import circle_batch_data
+from artpack.flow import flow_paths
+from artpack.planning import (
+    _as_bytes,
+    _group_label_bytes,
+    plan_circles,
+    plan_flow_paths,
+    plan_replicate,
+)
+from artpack.symmetry import replicate, rotations
+
+# Input validations
+# ------------------------------------------------------------------------------
+planning_error_cases = [
+    {
+        "id": "replicate data has no x column",
+        "func": plan_replicate,
+        "kwargs": {"data": pl.DataFrame({"y": [0.0]}), "transforms": np.eye(3)},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x` and `y` columns.\nMissing: `x`",
+    },
+    {
+        "id": "n_particles is negative",
+        "func": plan_flow_paths,
+        "kwargs": {"n_particles": -1},
+        "exc": ValueError,
+        "error_msg": "`n_particles` must be zero or a positive integer.\nYou've supplied: `-1`",
+    },
+    {
+        "id": "n_circles is not an int",
+        "func": plan_circles,
+        "kwargs": {"n_circles": 1.5},
+        "exc": TypeError,
+        "error_msg": "`n_circles` should be of type `int`.\nYou've supplied a `float` object",
+    },
+    {
+        "id": "n_circles is negative",
+        "func": plan_circles,
+        "kwargs": {"n_circles": -1},
+        "exc": ValueError,
+        "error_msg": "`n_circles` must be zero or a positive integer.\nYou've supplied: `-1`",
+    },
+    {
+        "id": "n_points is too small",
+        "func": plan_circles,
+        "kwargs": {"n_circles": 1, "n_points": 10},
+        "exc": ValueError,
+        "error_msg": "`n_points` must be >= 100 for a reasonable approximation of a circle.\nYou've supplied: `10`",
+    },
+    {
+        "id": "fill has the wrong length",
+        "func": plan_circles,
+        "kwargs": {"n_circles": 3, "fill": ["red"]},
+        "exc": ValueError,
+        "error_msg": "`fill` must be a single color or one color per circle (3).\nYou've supplied 1 colors",
+    },
+    {
+        "id": "color_format is unknown",
+        "func": plan_circles,
+        "kwargs": {"n_circles": 1, "color_format": "rgb"},
+        "exc": ValueError,
+        "error_msg": "`color_format` must be one of: hex, rgba.\nYou've supplied: 'rgb'",
+    },
+    {
+        "id": "size has an unknown unit",
+        "func": _as_bytes,
+        "kwargs": {"param_name": "max_memory", "size": "2 bananas"},
+        "exc": ValueError,
+        "error_msg": "`max_memory` must be a number of bytes or a size such as '512MB' or '2GiB'.\nYou've supplied: '2 bananas'",
+    },
+    {
+        "id": "size is a bool",
+        "func": _as_bytes,
+        "kwargs": {"param_name": "max_memory", "size": True},
+        "exc": TypeError,
+        "error_msg": "`max_memory` should be of type `int` or `str`.\nYou've supplied a `bool` object",
+    },
+    {
+        "id": "size is not positive",
+        "func": _as_bytes,
+        "kwargs": {"param_name": "max_memory", "size": 0},
+        "exc": ValueError,
+        "error_msg": "`max_memory` must be a positive integer or float (number with decimals).\nYou've supplied: `0`",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    planning_error_cases,
+    ids=[case["id"] for case in planning_error_cases],
+)
+def test_planning_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        case["func"](**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (1024, 1024),
+        ("512", 512),
+        ("2KB", 2000),
+        ("1.5 MiB", 1_572_864),
+        ("1gib", 2**30),
+    ],
+)
+def test_as_bytes_parses_sizes(size, expected):
+    assert _as_bytes("max_memory", size) == expected
+
+
+def test_plan_circles_counts_rows_and_columns():
+    plan = plan_circles(1_000, n_points=200, color="red", fill=["red", "blue"] * 500)
+    assert plan["rows"] == 200_000
+    assert list(plan["columns"]) == ["x", "y", "color", "fill", "group"]
+    assert plan["columns"]["x"] == plan["columns"]["y"] == 800_000
+    assert plan["bytes"] == sum(plan["columns"].values())
+    assert plan["peak_bytes"] > plan["bytes"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"color_format": "rgba", "fill": "red", "group_var": False},
+        {"categorical": True, "color": "black"},
+        {"color_format": "rgba", "gradient": "rainbow", "group_var": False},
+    ],
+)
+def test_plan_circles_matches_fixed_width_columns(kwargs):
+    df = circle_batch_data(range(50), 0, 1, **kwargs)
+    plan = plan_circles(50, **kwargs)
+    assert plan["rows"] == df.height
+    assert plan["columns"] == {name: df[name].estimated_size() for name in df.columns}
+
+
+@pytest.mark.parametrize("group_value", ["a_long_prefix_", "a_long_group_prefix_"])
+@pytest.mark.parametrize(
+    "fill", ["lightgoldenrodyellow", ["lightgoldenrodyellow", "red"] * 25]
+)
+def test_plan_circles_string_columns_cover_their_bytes(group_value, fill):
+    df = circle_batch_data(range(50), 0, 1, fill=fill, group_value=group_value)
+    plan = plan_circles(50, fill=fill, group_value=group_value)
+    for name in ("fill", "group"):
+        assert plan["columns"][name] >= df[name].estimated_size()
+
+
+def test_group_label_bytes_counts_long_labels():
+    # "circle_1".."circle_9999" are all 12 bytes or shorter
+    assert _group_label_bytes("circle_", 9_999) == 0
+    # "circle_10000".."circle_99999" are 12 bytes; 13-byte labels start at 100000
+    assert _group_label_bytes("circle_", 100_001) == 2 * 13
+    assert _group_label_bytes("a_long_prefix_", 11) == 9 * 15 + 2 * 16
+    assert _group_label_bytes("a_long_prefix_", 11, 100) == 100 * (9 * 15 + 2 * 16)
+
+
+@pytest.mark.parametrize(
+    "motif",
+    [
+        circle_batch_data(range(20), 0, 1, fill="lightgoldenrodyellow"),
+        circle_batch_data(range(20), 0, 1, group_value="a_long_group_prefix_"),
+        circle_batch_data(range(20), 0, 1, fill="red", categorical=True),
+        pl.DataFrame(
+            {"x": [0.0, 1.0], "y": 0.0, "group": pl.Series([1, 2], dtype=pl.UInt8)}
+        ),
+        pl.DataFrame({"x": [0.0, 1.0], "y": 0.0}),
+    ],
+    ids=["long fill", "long group", "categorical", "integer group", "no group"],
+)
+def test_plan_replicate_covers_output(motif):
+    copies = replicate(motif, rotations(12))
+    plan = plan_replicate(motif, rotations(12))
+    assert plan["rows"] == copies.height
+    assert list(plan["columns"]) == copies.columns
+    for name in copies.columns:
+        assert plan["columns"][name] >= copies[name].estimated_size()
+    assert plan["columns"]["x"] == copies["x"].estimated_size()
+
+
+def test_plan_flow_paths_covers_output():
+    rng = np.random.default_rng(0)
+    paths = flow_paths(*rng.uniform(0, 1, size=(2, 200)), n_steps=30)
+    plan = plan_flow_paths(200, n_steps=30)
+    assert plan["rows"] == paths.height
+    for name in paths.columns:
+        assert plan["columns"][name] >= paths[name].estimated_size()
+
+
+def test_plan_circles_reports_fit():
+    plan = plan_circles(10)
+    if plan["available_bytes"] is None:
+        assert plan["fits"] is None
+    else:
+        assert plan["fits"] is True
+        assert plan_circles(10**12)["fits"] is False
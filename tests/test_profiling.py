@@ -0,0 +1,98 @@
+###############################################################################
+# profiling.py Test Suite
+###############################################################################
+import pytest
+
+import artpack
+from artpack import art_pals, circle_data, profile, stats
+from artpack.circles import _unit_circle
+from artpack.profiling import _NULL_PHASE, _PROFILE, _phase
+
+
+# ------------------------------------------------------------------------------
+# Disabled by default
+def test_profiling_is_disabled_by_default():
+    assert _PROFILE.enabled is False
+    assert _phase("validation") is _NULL_PHASE
+
+
+def test_calls_outside_profile_are_not_recorded():
+    with profile():
+        pass
+    circle_data(x=0, y=0, radius=5)
+    assert stats()["functions"] == {}
+
+
+# ------------------------------------------------------------------------------
+# Recording
+def test_profile_records_calls_rows_and_bytes():
+    with profile() as prof:
+        df_1 = circle_data(x=0, y=0, radius=5)
+        df_2 = circle_data(x=1, y=1, radius=2, n_points=200, color="red")
+
+    entry = prof.stats()["functions"]["circle_data"]
+    assert entry["calls"] == 2
+    assert entry["rows"] == df_1.height + df_2.height
+    assert entry["bytes"] == df_1.estimated_size() + df_2.estimated_size()
+    assert entry["time_s"] > 0
+    assert set(entry["phases"]) == {"validation", "coordinates", "frame"}
+
+
+def test_profile_records_art_pals_phases():
+    with profile():
+        art_pals("rainbow", 20)
+
+    entry = stats()["functions"]["art_pals"]
+    assert entry["calls"] == 1
+    assert entry["rows"] == 20
+    assert entry["bytes"] == 20 * 7
+    assert set(entry["phases"]) == {"validation", "colors"}
+
+
+def test_profile_records_cache_hit_rate():
+    _unit_circle.cache_clear()
+    with profile():
+        for _ in range(4):
+            circle_data(x=0, y=0, radius=5, n_points=123)
+
+    cache = stats()["caches"]["unit_circle"]
+    assert cache == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+
+def test_profile_records_time_when_function_raises():
+    with profile(), pytest.raises(ValueError):
+        circle_data(x=0, y=0, radius=-1)
+
+    entry = stats()["functions"]["circle_data"]
+    assert entry["calls"] == entry["errors"] == 1
+    assert entry["time_s"] > 0
+    assert entry["rows"] == entry["bytes"] == 0
+    assert "validation" in entry["phases"]
+
+
+def test_profile_reset_false_accumulates():
+    with profile():
+        art_pals()
+    with profile(reset=False):
+        art_pals()
+    assert stats()["functions"]["art_pals"]["calls"] == 2
+
+
+def test_report_lists_functions_and_caches():
+    with profile() as prof:
+        circle_data(x=0, y=0, radius=5)
+    report = prof.report()
+    assert "circle_data" in report
+    assert "validation" in report
+    assert "cache unit_circle" in report
+
+
+def test_profile_is_exported():
+    assert artpack.profile is profile
+    assert artpack.stats is stats
+
+
+def test_output_size_of_unsized_result_is_zero():
+    from artpack.profiling import _output_size
+
+    assert _output_size(None) == (0, 0)
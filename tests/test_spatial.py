@@ -0,0 +1,202 @@
+###############################################################################
+# spatial.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal, assert_series_equal
+
+from artpack import Canvas, circle_batch_data
+from artpack.spatial import ShapeIndex
+
+RNG = np.random.default_rng(7)
+XS, YS = RNG.uniform(0, 50, (2, 400))
+RADII = RNG.uniform(0.2, 4, 400)
+SCENE = circle_batch_data(XS, YS, RADII)
+INDEX = ShapeIndex(SCENE)
+
+
+def _brute_bounds():
+    return SCENE.group_by("group", maintain_order=True).agg(
+        xmin=pl.col("x").min(),
+        ymin=pl.col("y").min(),
+        xmax=pl.col("x").max(),
+        ymax=pl.col("y").max(),
+    )
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+spatial_error_cases = [
+    {
+        "id": "data is not a DataFrame",
+        "func": ShapeIndex,
+        "kwargs": {"data": [1, 2]},
+        "exc": TypeError,
+        "error_msg": "`data` should be of type `DataFrame`.\nYou've supplied a `list` object",
+    },
+    {
+        "id": "data has no group column",
+        "func": ShapeIndex,
+        "kwargs": {"data": pl.DataFrame({"x": [0.0], "y": [0.0]})},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x`, `y`, and `group` columns.\nMissing: `group`",
+    },
+    {
+        "id": "bounds are missing columns",
+        "func": ShapeIndex.from_bounds,
+        "kwargs": {"bounds": pl.DataFrame({"group": ["a"], "xmin": [0.0]})},
+        "exc": ValueError,
+        "error_msg": "`bounds` must have `group`, `xmin`, `ymin`, `xmax`, and `ymax` columns.\nMissing: `ymin`, `xmax`, `ymax`",
+    },
+    {
+        "id": "cell_size is not positive",
+        "func": ShapeIndex,
+        "kwargs": {"data": SCENE, "cell_size": 0},
+        "exc": ValueError,
+        "error_msg": "`cell_size` must be a positive integer or float (number with decimals).\nYou've supplied: `0`",
+    },
+    {
+        "id": "query boxes have the wrong shape",
+        "func": INDEX.query,
+        "kwargs": {"boxes": (0, 0, 1)},
+        "exc": ValueError,
+        "error_msg": "`boxes` must be an (xmin, ymin, xmax, ymax) box or an (n, 4) array of them.\nYou've supplied an array with shape (3,)",
+    },
+    {
+        "id": "query boxes are inverted",
+        "func": INDEX.query,
+        "kwargs": {"boxes": [(0, 0, 1, 1), (2, 0, 1, 1)]},
+        "exc": ValueError,
+        "error_msg": "`boxes` must have xmin <= xmax and ymin <= ymax.\nYou've supplied: `(2.0, 0.0, 1.0, 1.0)`",
+    },
+    {
+        "id": "points are not numeric",
+        "func": INDEX.nearest,
+        "kwargs": {"points": "origin"},
+        "exc": TypeError,
+        "error_msg": "`points` should be an array of numbers.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "cover shape is unknown",
+        "func": INDEX.covered,
+        "kwargs": {"shape": "square"},
+        "exc": ValueError,
+        "error_msg": "`shape` must be one of: box, circle.\nYou've supplied: 'square'",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case",
+    spatial_error_cases,
+    ids=[case["id"] for case in spatial_error_cases],
+)
+def test_spatial_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        case["func"](**case["kwargs"])
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_shape_index_bounds_match_group_extents():
+    assert len(INDEX) == 400
+    assert_frame_equal(INDEX.bounds, _brute_bounds(), check_dtypes=False)
+
+
+def test_from_bounds_matches_vertex_index():
+    index = ShapeIndex.from_bounds(_brute_bounds(), cell_size=INDEX.cell_size)
+    boxes = RNG.uniform(0, 50, (50, 2))
+    boxes = np.c_[boxes, boxes + 3]
+    assert_frame_equal(index.query(boxes), INDEX.query(boxes))
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.5, 100])
+def test_query_matches_brute_force(cell_size):
+    index = ShapeIndex(SCENE, cell_size=cell_size)
+    bounds = _brute_bounds()
+    boxes = np.c_[RNG.uniform(-5, 50, (60, 2)), RNG.uniform(0, 8, (60, 2))]
+    boxes[:, 2:] += boxes[:, :2]
+
+    expected = []
+    for i, (xmin, ymin, xmax, ymax) in enumerate(boxes):
+        hits = bounds.filter(
+            (pl.col("xmin") <= xmax)
+            & (pl.col("xmax") >= xmin)
+            & (pl.col("ymin") <= ymax)
+            & (pl.col("ymax") >= ymin)
+        )
+        expected.append(hits.select(pl.lit(i, dtype=pl.UInt32).alias("query"), "group"))
+    assert_frame_equal(index.query(boxes), pl.concat(expected))
+
+
+def test_query_hit_tests_points():
+    x, y = XS[10], YS[10]
+    hits = INDEX.query((x, y, x, y))
+    assert "circle_11" in hits["group"].to_list()
+    assert hits["query"].unique().to_list() == [0]
+
+
+def test_nearest_matches_brute_force():
+    points = RNG.uniform(-20, 70, (100, 2))
+    bounds = _brute_bounds()
+    boxes = bounds.select("xmin", "ymin", "xmax", "ymax").to_numpy()
+    dx = np.maximum(
+        np.maximum(
+            boxes[None, :, 0] - points[:, None, 0],
+            points[:, None, 0] - boxes[None, :, 2],
+        ),
+        0,
+    )
+    dy = np.maximum(
+        np.maximum(
+            boxes[None, :, 1] - points[:, None, 1],
+            points[:, None, 1] - boxes[None, :, 3],
+        ),
+        0,
+    )
+    distance = np.hypot(dx, dy)
+
+    nearest = INDEX.nearest(points)
+    np.testing.assert_allclose(nearest["distance"], distance.min(axis=1), rtol=1e-6)
+    assert (
+        nearest["group"].to_list()
+        == bounds["group"].gather(distance.argmin(axis=1)).to_list()
+    )
+
+
+def test_covered_finds_shapes_under_later_shapes():
+    circles = circle_batch_data([0, 0.5, 0, 10], [0, 0, 0, 10], [1, 3, 4, 1])
+    index = ShapeIndex(circles)
+    # circle_1 sits under both later circles, circle_2 under circle_3; circle_3
+    # covers circle_1 but is drawn after it, so it stays visible
+    assert_series_equal(
+        index.covered("circle"), pl.Series("group", ["circle_1", "circle_2"])
+    )
+
+
+def test_covered_circle_is_stricter_than_box():
+    # The small circle's box fits inside the big circle's box, but it pokes
+    # out of the big circle near the corner
+    circles = circle_batch_data([2.6, 0], [2.6, 0], [0.3, 3])
+    index = ShapeIndex(circles)
+    assert index.covered("box").to_list() == ["circle_1"]
+    assert index.covered("circle").to_list() == []
+
+
+def test_shape_index_accepts_canvas_output():
+    canvas = Canvas()
+    circle_batch_data([0, 5], [0, 5], 1, group_value="a_", canvas=canvas)
+    circle_batch_data([10], [10], 1, group_value="b_", canvas=canvas)
+    index = ShapeIndex(canvas.to_polars())
+    assert index.nearest((9, 9))["group"].to_list() == ["b_1"]
+
+
+def test_empty_index():
+    index = ShapeIndex(circle_batch_data([], [], 1))
+    assert len(index) == 0
+    assert index.query((0, 0, 1, 1)).height == 0
+    assert index.nearest([(0, 0), (1, 1)])["group"].to_list() == [None, None]
+    assert index.covered().len() == 0
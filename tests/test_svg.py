@@ -0,0 +1,192 @@
+###############################################################################
+# svg.py Test Suite
+###############################################################################
+import io
+import re
+import xml.etree.ElementTree as ET
+
+import polars as pl
+import pytest
+
+from artpack import circle_batch_data, circle_data
+from artpack.svg import write_svg
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+def _render(data, **kwargs):
+    buffer = io.StringIO()
+    n_paths = write_svg(data, buffer, **kwargs)
+    return n_paths, buffer.getvalue()
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+svg_error_cases = [
+    {
+        "id": "data is not a DataFrame",
+        "kwargs": {"data": {"x": [0]}},
+        "exc": TypeError,
+        "error_msg": "`data` should be of type `DataFrame`.\nYou've supplied a `dict` object",
+    },
+    {
+        "id": "data has no y column",
+        "kwargs": {"data": pl.DataFrame({"x": [0.0]})},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x` and `y` columns.\nMissing: `y`",
+    },
+    {
+        "id": "precision is negative",
+        "kwargs": {"precision": -1},
+        "exc": ValueError,
+        "error_msg": "`precision` must be >= 0.\nYou've supplied: `-1`",
+    },
+    {
+        "id": "width is not positive",
+        "kwargs": {"width": 0},
+        "exc": ValueError,
+        "error_msg": "`width` must be a positive integer or float",
+    },
+    {
+        "id": "bbox is inverted",
+        "kwargs": {"bbox": (1, 0, 0, 1)},
+        "exc": ValueError,
+        "error_msg": "`bbox` must be (xmin, ymin, xmax, ymax) with xmin < xmax and ymin < ymax.\nYou've supplied: `(1, 0, 0, 1)`",
+    },
+    {
+        "id": "background is invalid",
+        "kwargs": {"background": "sparkly"},
+        "exc": ValueError,
+        "error_msg": "`background` must be a valid hex color",
+    },
+    {
+        "id": "chunk_size is not an int",
+        "kwargs": {"chunk_size": 2.5},
+        "exc": TypeError,
+        "error_msg": "`chunk_size` should be of type `int`.",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case", svg_error_cases, ids=[case["id"] for case in svg_error_cases]
+)
+def test_write_svg_error_messages(case):
+    kwargs = {"data": circle_data(x=0, y=0, radius=1), **case["kwargs"]}
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        write_svg(file=io.StringIO(), **kwargs)
+
+
+# Output validations
+# ------------------------------------------------------------------------------
+def test_write_svg_one_path_per_group_with_styles():
+    circles = circle_batch_data(
+        x=[0, 3, 6], y=0, radius=1, color="black", fill=["red", "#00ff00", "blue"]
+    )
+    n_paths, svg = _render(circles, chunk_size=2)
+
+    root = ET.fromstring(svg)
+    paths = root.findall(f"{SVG_NS}path")
+    assert n_paths == len(paths) == 3
+    assert [path.get("fill") for path in paths] == ["red", "#00ff00", "blue"]
+    assert {path.get("stroke") for path in paths} == {"black"}
+    assert all(
+        path.get("d").startswith("M") and path.get("d").endswith(" Z") for path in paths
+    )
+
+
+def test_write_svg_flips_y_and_applies_precision():
+    square = pl.DataFrame({"x": [0.0, 1.0, 1.0, 0.0], "y": [0.0, 0.0, 2.004, 2.004]})
+    _, svg = _render(square, precision=2)
+    path = ET.fromstring(svg).find(f"{SVG_NS}path")
+    assert path.get("d") == "M0,2 1,2 1,0 0,0"
+    assert path.get("stroke") == "#000000"
+    assert path.get("fill") == "none"
+
+
+def test_write_svg_groups_non_contiguous_rows_together():
+    df = pl.concat(
+        [
+            circle_data(0, 0, 1, group_var=True, group_value="a"),
+            circle_data(5, 0, 1, group_var=True, group_value="b"),
+            circle_data(0, 5, 1, group_var=True, group_value="a"),
+        ]
+    )
+    n_paths, svg = _render(df)
+    assert n_paths == 2
+    first_path = ET.fromstring(svg).find(f"{SVG_NS}path").get("d")
+    assert len(first_path.split(" ")) > 150
+
+
+def test_write_svg_chunks_match_single_pass():
+    shuffled = circle_batch_data(range(7), 0, 1, fill="red").sample(
+        fraction=1, shuffle=True, seed=3
+    )
+    _, single = _render(shuffled)
+    n_paths, chunked = _render(shuffled, chunk_size=2)
+    assert n_paths == 7
+    assert chunked == single
+
+
+def test_write_svg_drops_repeated_rounded_points():
+    circle = circle_data(x=0, y=0, radius=1, n_points=1000)
+    _, coarse = _render(circle, precision=0)
+    _, fine = _render(circle, precision=3)
+    assert len(coarse) < len(fine) / 10
+
+
+def test_write_svg_size_bbox_and_background():
+    circle = circle_data(x=0, y=0, radius=1)
+    _, svg = _render(
+        circle, width=400, height=300, bbox=(-2, -2, 2, 2), background="white"
+    )
+    root = ET.fromstring(svg)
+    assert (root.get("width"), root.get("height"), root.get("viewBox")) == (
+        "400",
+        "300",
+        "0 0 4 4",
+    )
+    assert root.find(f"{SVG_NS}rect").get("fill") == "white"
+
+
+def test_write_svg_large_extent_keeps_precision():
+    # `:g` formatting would round this to "0 0 1e+06 2e+06" and clip the image
+    corners = pl.DataFrame({"x": [0.0, 1_000_002.5], "y": [0.0, 2_000_002.25]})
+    root = ET.fromstring(_render(corners)[1])
+    assert root.get("viewBox") == "0 0 1000002.5 2000002.25"
+    assert (root.get("width"), root.get("height")) == ("1000002.5", "2000002.25")
+
+
+def test_write_svg_fill_only_has_no_stroke_and_close_override():
+    circle = circle_data(x=0, y=0, radius=1, fill="pink")
+    _, svg = _render(circle, close=False)
+    path = ET.fromstring(svg).find(f"{SVG_NS}path")
+    assert path.get("stroke") == "none"
+    assert not path.get("d").endswith("Z")
+
+
+def test_write_svg_accepts_packed_rgba_colors():
+    kwargs = {
+        "x": [0, 1],
+        "y": 0,
+        "radius": 1,
+        "color": "black",
+        "fill": ["red", "#0F0"],
+    }
+    hex_svg = _render(circle_batch_data(**kwargs))[1]
+    rgba_svg = _render(circle_batch_data(**kwargs, color_format="rgba"))[1]
+    assert rgba_svg == hex_svg.replace('"black"', '"#000000"').replace(
+        '"red"', '"#ff0000"'
+    ).replace('"#0F0"', '"#00ff00"')
+
+
+def test_write_svg_to_path(tmp_path):
+    target = tmp_path / "circle.svg"
+    assert write_svg(circle_data(x=0, y=0, radius=1), target) == 1
+    assert target.read_text().startswith("<svg")
+
+
+def test_write_svg_empty_data():
+    n_paths, svg = _render(circle_batch_data(x=[], y=[], radius=[]))
+    assert n_paths == 0
+    assert ET.fromstring(svg).findall(f"{SVG_NS}path") == []
@@ -0,0 +1,197 @@
+###############################################################################
+# symmetry.py Test Suite
+###############################################################################
+import re
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from artpack import circle_batch_data, circle_data
+from artpack.symmetry import compose, dihedral, lattice, replicate, rotations
+
+MOTIF = circle_batch_data([2, 3], [0.5, 0], 0.5, fill=["red", "blue"])
+
+
+# Input validations
+# ------------------------------------------------------------------------------
+symmetry_error_cases = [
+    {
+        "id": "data is not a DataFrame",
+        "func": replicate,
+        "kwargs": {"data": [1, 2], "transforms": np.eye(3)},
+        "exc": TypeError,
+        "error_msg": "`data` should be of type `DataFrame`.\nYou've supplied a `list` object",
+    },
+    {
+        "id": "data has no x column",
+        "func": replicate,
+        "kwargs": {"data": pl.DataFrame({"y": [0.0]}), "transforms": np.eye(3)},
+        "exc": ValueError,
+        "error_msg": "`data` must have `x` and `y` columns.\nMissing: `x`",
+    },
+    {
+        "id": "transforms have the wrong shape",
+        "func": replicate,
+        "kwargs": {"data": MOTIF, "transforms": np.eye(2)},
+        "exc": ValueError,
+        "error_msg": "`transforms` must be a 2x3 or 3x3 affine matrix, or a stack of them.\nYou've supplied an array with shape (1, 2, 2)",
+    },
+    {
+        "id": "transforms are not numeric",
+        "func": replicate,
+        "kwargs": {"data": MOTIF, "transforms": "rotate"},
+        "exc": TypeError,
+        "error_msg": "`transforms` should be an array of affine matrices.\nYou've supplied a `str` object",
+    },
+    {
+        "id": "rotation count is not positive",
+        "func": rotations,
+        "kwargs": {"n": 0},
+        "exc": ValueError,
+        "error_msg": "`n` must be a positive integer or float (number with decimals).\nYou've supplied: `0`",
+    },
+    {
+        "id": "center is not a pair",
+        "func": dihedral,
+        "kwargs": {"n": 3, "center": (0, 0, 0)},
+        "exc": ValueError,
+        "error_msg": "`center` must be an (x, y) pair.\nYou've supplied: `(0, 0, 0)`",
+    },
+    {
+        "id": "lattice count is not an int",
+        "func": lattice,
+        "kwargs": {"a": (1, 0), "b": (0, 1), "n_a": 2.5},
+        "exc": TypeError,
+        "error_msg": "`n_a` should be of type `int`.\nYou've supplied a `float` object",
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "case", symmetry_error_cases, ids=[case["id"] for case in symmetry_error_cases]
+)
+def test_symmetry_error_messages(case):
+    with pytest.raises(case["exc"], match=re.escape(case["error_msg"])):
+        case["func"](**case["kwargs"])
+
+
+# Transform builders
+# ------------------------------------------------------------------------------
+def test_rotations_about_a_center():
+    ops = rotations(4, center=(1, 1))
+    assert ops.shape == (4, 3, 3)
+    np.testing.assert_allclose(ops[0], np.eye(3))
+    np.testing.assert_allclose(ops[1] @ [2, 1, 1], [1, 2, 1], atol=1e-12)
+
+
+def test_dihedral_has_rotations_then_reflections():
+    ops = dihedral(3)
+    assert ops.shape == (6, 3, 3)
+    np.testing.assert_allclose(ops[:3], rotations(3))
+    np.testing.assert_allclose(ops[3] @ [1, 2, 1], [1, -2, 1], atol=1e-12)
+    np.testing.assert_allclose(np.linalg.det(ops[3:, :2, :2]), -1)
+
+
+def test_lattice_and_compose():
+    tiles = lattice((2, 0), (1, 3), 3, 2)
+    np.testing.assert_allclose(
+        tiles[:, :2, 2], [[0, 0], [2, 0], [4, 0], [1, 3], [3, 3], [5, 3]]
+    )
+
+    combined = compose(tiles, rotations(2))
+    assert combined.shape == (12, 3, 3)
+    np.testing.assert_allclose(combined[3], tiles[1] @ rotations(2)[1])
+
+
+# Replication
+# ------------------------------------------------------------------------------
+def test_replicate_matches_regenerating_each_copy():
+    ops = compose(lattice((10, 0), (0, 10), 2), rotations(4))
+    copies = replicate(MOTIF, ops)
+
+    assert copies.height == MOTIF.height * 8
+    assert copies.columns == MOTIF.columns
+    xy = MOTIF.select("x", "y").to_numpy().astype(np.float64)
+    for k, op in enumerate(ops):
+        block = copies.slice(k * MOTIF.height, MOTIF.height)
+        expected = xy @ op[:2, :2].T + op[:2, 2]
+        np.testing.assert_allclose(
+            block.select("x", "y").to_numpy(), expected, atol=1e-5
+        )
+        assert block["fill"].equals(MOTIF["fill"])
+        assert block["group"].unique(maintain_order=True).to_list() == [
+            f"circle_1_{k + 1}",
+            f"circle_2_{k + 1}",
+        ]
+
+
+def test_replicate_keeps_dtypes_and_categorical_groups():
+    motif = MOTIF.with_columns(pl.col("group").cast(pl.Categorical))
+    copies = replicate(motif, rotations(3), group_sep="-")
+    assert copies.schema == motif.schema
+    assert copies["group"].n_unique() == 6
+    assert copies["group"][-1] == "circle_2-3"
+
+
+def test_replicate_turns_enum_groups_categorical():
+    motif = MOTIF.with_columns(pl.col("group").cast(pl.Enum(["circle_1", "circle_2"])))
+    copies = replicate(motif, rotations(2))
+    assert copies["group"].dtype == pl.Categorical
+    assert copies["group"].unique(maintain_order=True).to_list() == [
+        "circle_1_1",
+        "circle_2_1",
+        "circle_1_2",
+        "circle_2_2",
+    ]
+
+
+@pytest.mark.parametrize("groups", [["a", None, "a"], [1, None, 1]])
+def test_replicate_keeps_null_groups_null(groups):
+    motif = pl.DataFrame({"x": [0.0, 1.0, 2.0], "y": 0.0, "group": groups})
+    copies = replicate(motif, rotations(2))
+    assert copies["group"].is_null().to_list() == [False, True, False] * 2
+    assert copies["group"].drop_nulls().n_unique() == 2
+
+
+def test_replicate_keeps_all_null_integer_groups_null():
+    motif = pl.DataFrame(
+        {"x": [0.0, 1.0], "y": 0.0, "group": pl.Series([None, None], dtype=pl.Int32)}
+    )
+    copies = replicate(motif, rotations(3))
+    assert copies["group"].dtype == pl.Int64
+    assert copies["group"].null_count() == 6
+
+
+@pytest.mark.parametrize("dtype", [pl.UInt8, pl.Int8])
+def test_replicate_small_integer_groups_do_not_wrap(dtype):
+    motif = pl.DataFrame(
+        {"x": [0.0, 1.0], "y": 0.0, "group": pl.Series([0, 100], dtype=dtype)}
+    )
+    copies = replicate(motif, rotations(4))
+    assert copies["group"].dtype == pl.Int64
+    assert copies["group"].to_list() == [0, 100, 101, 201, 202, 302, 303, 403]
+
+
+def test_replicate_offsets_integer_groups():
+    motif = pl.DataFrame({"x": [0.0, 1.0, 2.0], "y": 0.0, "group": [3, 3, 5]})
+    copies = replicate(motif, lattice((1, 0), (0, 1), 3))
+    assert copies["group"].to_list() == [3, 3, 5, 6, 6, 8, 9, 9, 11]
+
+
+def test_replicate_adds_group_per_copy():
+    copies = replicate(circle_data(0, 0, 1), rotations(3)[:, :2, :])
+    assert copies.columns == ["x", "y", "group"]
+    assert copies["group"].unique(maintain_order=True).to_list() == [
+        "copy_1",
+        "copy_2",
+        "copy_3",
+    ]
+
+
+def test_replicate_single_identity_is_a_relabel():
+    copies = replicate(MOTIF, np.eye(3))
+    assert_frame_equal(
+        copies.with_columns(pl.col("group").str.strip_suffix("_1")), MOTIF
+    )